@@ -11,17 +11,38 @@ done
 echo "PostgreSQL is up - running migrations"
 python manage.py migrate --noinput
 
+echo "Adding finished ingestion runs missing from the dashboard rollups"
+python manage.py rebuild_ingestion_rollups || echo "Rollup rebuild failed"
+
+echo "Resuming any queued rescoring jobs"
+python manage.py process_rescore_jobs || echo "Rescoring jobs failed"
+
 echo "Starting scheduled OCDS ingestion in the background (8x per day)..."
 (
   # Run immediately on container start
   while true; do
     echo "[ingest_ocds] $(date -Iseconds): Triggering OCDS ingestion..."
     python manage.py ingest_ocds || echo "[ingest_ocds] $(date -Iseconds): Ingestion failed"
+    python manage.py sweep_recency_scores || echo "[sweep_recency_scores] $(date -Iseconds): Sweep failed"
+    python manage.py archive_closed_tenders || echo "[archive_closed_tenders] $(date -Iseconds): Archival failed"
     echo "[ingest_ocds] $(date -Iseconds): Sleeping for 3 hours..."
     sleep 10800  # 3 hours
   done
 ) &
 
-echo "Starting Django development server"
-python manage.py runserver 0.0.0.0:8000
+echo "Starting the notification dispatcher in the background..."
+(
+  while true; do
+    python manage.py dispatch_notifications --loop || echo "[dispatch_notifications] $(date -Iseconds): Dispatcher failed"
+    sleep 60
+  done
+) &
+
+if [ "${DJANGO_ASYNC_VIEWS:-false}" = "true" ]; then
+  echo "Starting uvicorn (ASGI, ${WEB_WORKERS:-1} workers)"
+  uvicorn tenderlink.asgi:application --host 0.0.0.0 --port 8000 --workers "${WEB_WORKERS:-1}"
+else
+  echo "Starting Django development server"
+  python manage.py runserver 0.0.0.0:8000
+fi
 
@@ -1,4 +1,6 @@
 from django.contrib import admin
+from django.db import connection
+from django.db.models import F, Lookup, Q
 
 from .models import (
     ProcuringEntity,
@@ -9,7 +11,55 @@ from .models import (
     SavedTender,
     IngestionRun,
     IngestionError,
+    NotificationOutbox,
+    ScoreSweep,
+    TenderDimension,
 )
+from .filters import split_by_archive
+from .pagination import EstimatedCountPaginator
+
+
+class ILike(Lookup):
+    """`column ILIKE pattern`, which a gin_trgm_ops index on the bare column serves."""
+
+    lookup_name = "ilike"
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        rhs, rhs_params = self.process_rhs(compiler, connection)
+        return f"{lhs} ILIKE {rhs}", [*lhs_params, *rhs_params]
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    """
+    Changelist for tables too big to scan. The search term is matched whole
+    against `search_fields` with lookups indexes can serve: `=field` by
+    equality (btree), fields in `ilike_search_fields` by ILIKE substring
+    (trigram indexes on the column), other fields by icontains substring
+    (trigram index on UPPER(field)). Counts come from planner estimates,
+    and the unfiltered total is not counted at all.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+    ilike_search_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        term = search_term.strip()
+        if not term:
+            return queryset, False
+        condition = Q()
+        for field in self.get_search_fields(request):
+            if field.startswith("="):
+                condition |= Q(**{field[1:]: term})
+            elif field in self.ilike_search_fields:
+                condition |= self.ilike_condition(field, f"%{connection.ops.prep_for_like_query(term)}%")
+            else:
+                condition |= Q(**{f"{field}__icontains": term})
+        return queryset.filter(condition), False
+
+    def ilike_condition(self, field, pattern):
+        return ILike(F(field), pattern)
 
 
 @admin.register(ProcuringEntity)
@@ -19,29 +69,35 @@ class ProcuringEntityAdmin(admin.ModelAdmin):
 
 
 @admin.register(Release)
-class ReleaseAdmin(admin.ModelAdmin):
+class ReleaseAdmin(LargeTableAdmin):
     list_display = ("release_id", "ocid", "date", "initiation_type")
-    search_fields = ("release_id", "ocid")
+    search_fields = ("=release_id", "=ocid")
     list_filter = ("initiation_type",)
 
 
 @admin.register(Tender)
-class TenderAdmin(admin.ModelAdmin):
-    list_display = ("tender_id", "title", "province", "value_amount", "status", "match_score")
-    search_fields = ("tender_id", "title", "description", "province", "city")
+class TenderAdmin(LargeTableAdmin):
+    list_display = ("tender_id", "title", "province", "value_amount", "status", "match_score", "recency_bonus")
+    search_fields = ("=tender_id", "=ocid", "title", "description")
+    # The title trigram indexes are on the bare column (they also serve
+    # feed search), one partial index per side of the archive
+    ilike_search_fields = ("title",)
     list_filter = ("status", "province")
 
+    def ilike_condition(self, field, pattern):
+        return split_by_archive(super().ilike_condition(field, pattern))
+
 
 @admin.register(TenderDocument)
-class TenderDocumentAdmin(admin.ModelAdmin):
+class TenderDocumentAdmin(LargeTableAdmin):
     list_display = ("document_id", "title", "document_type", "tender")
-    search_fields = ("document_id", "title", "document_type")
+    search_fields = ("=tender__tender_id",)
 
 
 @admin.register(SupplierProfile)
-class SupplierProfileAdmin(admin.ModelAdmin):
+class SupplierProfileAdmin(LargeTableAdmin):
     list_display = ("company_name", "email", "province", "city", "user")
-    search_fields = ("company_name", "email", "province", "city", "user__email")
+    search_fields = ("company_name", "email", "province")
 
 
 @admin.register(SavedTender)
@@ -60,3 +116,23 @@ class IngestionRunAdmin(admin.ModelAdmin):
 class IngestionErrorAdmin(admin.ModelAdmin):
     list_display = ("occurred_at", "release_id", "message", "run")
     search_fields = ("release_id", "message")
+
+
+@admin.register(ScoreSweep)
+class ScoreSweepAdmin(admin.ModelAdmin):
+    list_display = ("ran_at", "tenders_updated")
+
+
+@admin.register(TenderDimension)
+class TenderDimensionAdmin(admin.ModelAdmin):
+    list_display = ("kind", "value", "tender_count", "active_count")
+    list_filter = ("kind",)
+    search_fields = ("value",)
+
+
+@admin.register(NotificationOutbox)
+class NotificationOutboxAdmin(LargeTableAdmin):
+    list_display = ("supplier", "tender", "channel", "match_score", "status", "attempts", "next_attempt_at", "sent_at")
+    list_filter = ("channel", "status")
+    search_fields = ("supplier__company_name", "=tender__tender_id")
+    raw_id_fields = ("supplier", "tender")
@@ -3,3 +3,6 @@ from django.apps import AppConfig
 
 class OcdsConfig(AppConfig):
     name = 'ocds'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,146 @@
+"""
+Async variants of the read-heavy API views, for ASGI deployments
+(`DJANGO_ASYNC_VIEWS=true`, see `urls.py`). Queries go through Django's
+async ORM and cache API, so a slow feed query no longer holds a worker
+thread. Serialisation and rendering are unchanged; they only touch rows
+that were already fetched.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
+from django.http import Http404, StreamingHttpResponse
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .authentication import CachedTokenAuthentication, QueryParamTokenAuthentication
+from .events import Subscription, decode_event_id, event_stream, get_broker
+from .models import Tender
+from .renderers import FastJSONRenderer
+from .services import current_detail_snapshot, render_detail_snapshot
+from .views import CategoryListView, TenderDetailView, TenderListView, get_scoring_context
+
+
+class AsyncAPIViewMixin:
+    """
+    Run a DRF view's handlers as coroutines. Authentication, permissions,
+    throttling and content negotiation may hit the database and run in a
+    worker thread; handlers are `async def`, and exceptions and responses go
+    through DRF's usual `handle_exception` / `finalize_response`.
+    """
+
+    async def dispatch(self, request, *args, **kwargs):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            response = handler(request, *args, **kwargs)
+            # OPTIONS and 405 handlers are inherited and synchronous
+            if asyncio.iscoroutine(response):
+                response = await response
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+
+class AsyncTenderListView(AsyncAPIViewMixin, TenderListView):
+    """`TenderListView` with the page fetched through the async ORM."""
+
+    async def get(self, request, *args, **kwargs):
+        async def cached_list(request, *args, **kwargs):
+            return await self.aget_cached(request, self.alist, *args, **kwargs)
+
+        return await self.aget_conditional(request, cached_list, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        # Resolve the caller's profile up front; building the queryset is
+        # then pure Python
+        await sync_to_async(get_scoring_context)(request)
+        queryset = self.filter_queryset(self.get_queryset())
+        tenders = await self.paginator.apaginate_queryset(queryset, request, view=self)
+        return self.get_page_response(request, tenders)
+
+
+class AsyncTenderDetailView(AsyncAPIViewMixin, TenderDetailView):
+    """`TenderDetailView` reading the detail snapshot through the async ORM."""
+
+    async def get(self, request, *args, **kwargs):
+        return await self.aget_conditional(request, self.aretrieve, *args, **kwargs)
+
+    async def aretrieve(self, request, *args, **kwargs):
+        await sync_to_async(get_scoring_context)(request)
+        lookup = {self.lookup_field: kwargs[self.lookup_url_kwarg]}
+        try:
+            tender = await self.get_snapshot_queryset(request).aget(**lookup)
+        except Tender.DoesNotExist:
+            raise Http404
+        snapshot = current_detail_snapshot(tender)
+        if snapshot is None:
+            snapshot = await sync_to_async(lambda: render_detail_snapshot(self.get_object()))()
+        return self.get_snapshot_response(request, tender, snapshot)
+
+
+class AsyncCategoryListView(AsyncAPIViewMixin, CategoryListView):
+    """`CategoryListView` reading the dictionary through the async ORM."""
+
+    async def get(self, request, *args, **kwargs):
+        return await self.aget_cached(request, self.alist, *args, **kwargs)
+
+    async def alist(self, request, *args, **kwargs):
+        return Response([value async for value in self.get_queryset().aiterator()])
+
+
+class TenderEventStreamView(AsyncAPIViewMixin, APIView):
+    """
+    Server-sent `tender` events for new or updated active tenders that score
+    at least `?minScore=` (default `TENDER_EVENTS_MIN_SCORE`) for the
+    caller's profile, with keep-alive comments and resume from
+    `Last-Event-ID`. EventSource cannot send headers, so the token may also
+    be passed as `?token=`.
+    """
+
+    authentication_classes = [CachedTokenAuthentication, QueryParamTokenAuthentication]
+
+    def perform_content_negotiation(self, request, force=False):
+        # The stream is text/event-stream; errors are rendered as JSON
+        renderer = FastJSONRenderer()
+        return renderer, renderer.media_type
+
+    async def get(self, request, *args, **kwargs):
+        try:
+            min_score = int(request.query_params.get("minScore", settings.TENDER_EVENTS_MIN_SCORE))
+        except ValueError:
+            return Response({"detail": "minScore must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+
+        scoring = await sync_to_async(get_scoring_context)(request)
+        broker = get_broker()
+        subscription = Subscription(scoring, min_score)
+        head = await broker.subscribe(subscription)
+
+        backlog = []
+        last_event = decode_event_id(
+            request.headers.get("Last-Event-ID") or request.query_params.get("lastEventId")
+        )
+        if last_event is not None and last_event < head:
+            backlog = await sync_to_async(subscription.catch_up)(last_event, head)
+        # Idle streams hold no database connection
+        await sync_to_async(connections.close_all)()
+
+        response = StreamingHttpResponse(
+            event_stream(broker, subscription, backlog), content_type="text/event-stream"
+        )
+        response["Cache-Control"] = "no-cache"
+        response["X-Accel-Buffering"] = "no"
+        return response
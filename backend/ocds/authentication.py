@@ -0,0 +1,144 @@
+"""
+Token authentication without database queries on the hot path.
+
+`CachedTokenAuthentication` resolves a token to its user and supplier
+profile through a small per-process TTL LRU, backed by the Django cache
+when that cache is shared between processes, and only falls back to the
+`authtoken_token` / `auth_user` / SupplierProfile queries on a miss.
+
+Entries are dropped (signals in `ocds.signals`) when the token is deleted
+or the user or profile is saved, but only in the process that made the
+change and in the shared cache. Other processes keep their local copies
+until they expire, so a deleted token or a deactivated user can still
+authenticate on another worker for up to `AUTH_TOKEN_LOCAL_TTL` seconds,
+and profiles used for scoring can be as old. With a process-local Django
+cache (LocMemCache, the default) the shared tier is skipped, since it
+would stretch that lag to `AUTH_TOKEN_CACHE_TIMEOUT`. Views that show a
+profile for editing or save it load it fresh (see
+`get_or_create_profile_for_user`).
+"""
+import hashlib
+import pickle
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.utils.translation import gettext_lazy as _
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from .models import SupplierProfile
+
+
+class TTLCache:
+    """Thread-safe LRU mapping whose entries expire `ttl` seconds after being set."""
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key) -> Optional[Any]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            expires, value = entry
+            if expires < time.monotonic():
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def set(self, key, value) -> None:
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.ttl, value)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.maxsize:
+                self.entries.popitem(last=False)
+
+    def delete(self, key) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+
+# Pickled (user, profile) per token cache key; each request unpickles its
+# own copies, so no model instance is shared between requests
+_local_tokens = TTLCache(maxsize=settings.AUTH_TOKEN_LOCAL_SIZE, ttl=settings.AUTH_TOKEN_LOCAL_TTL)
+
+
+def token_cache_key(key: str) -> str:
+    # Hashed so raw tokens never appear in cache keys
+    return "auth:token:" + hashlib.sha256(key.encode("utf-8")).hexdigest()
+
+
+def shared_cache_available() -> bool:
+    """Whether the default Django cache is seen by every process (not LocMem / dummy)."""
+    return not isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+def invalidate_token(key: str) -> None:
+    cache_key = token_cache_key(key)
+    _local_tokens.delete(cache_key)
+    cache.delete(cache_key)
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    `TokenAuthentication` with the token -> (user, profile) lookup cached.
+    The profile is attached as `user.cached_supplier_profile`, which
+    `get_or_create_profile_for_user` returns without a query.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        payload = _local_tokens.get(cache_key)
+        if payload is None:
+            shared = shared_cache_available()
+            payload = cache.get(cache_key) if shared else None
+            if payload is None:
+                payload = self.load_credentials(key)
+                if shared:
+                    cache.set(cache_key, payload, settings.AUTH_TOKEN_CACHE_TIMEOUT)
+            _local_tokens.set(cache_key, payload)
+
+        user, profile = pickle.loads(payload)
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed(_("User inactive or deleted."))
+        user.cached_supplier_profile = profile
+        return user, key
+
+    def load_credentials(self, key) -> bytes:
+        model = self.get_model()
+        try:
+            token = model.objects.select_related("user").get(key=key)
+        except model.DoesNotExist:
+            raise exceptions.AuthenticationFailed(_("Invalid token."))
+        profile = SupplierProfile.objects.filter(user=token.user).first()
+        return pickle.dumps((token.user, profile), pickle.HIGHEST_PROTOCOL)
+
+
+class QueryParamTokenAuthentication(CachedTokenAuthentication):
+    """
+    Token passed as `?token=`, for clients that cannot set headers (the
+    browser EventSource API). Only enable it on endpoints that need it:
+    query strings end up in access logs.
+    """
+
+    query_param = "token"
+
+    def authenticate(self, request):
+        key = request.query_params.get(self.query_param)
+        if not key:
+            return None
+        return self.authenticate_credentials(key)
@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import time
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import F
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag, urlencode
+from rest_framework.response import Response
+
+from .models import DataVersion, SupplierProfile
+
+
+# DataVersion counter covering tenders and everything derived from them
+TENDER_DATA = "tenders"
+
+
+def get_data_version(name: str = TENDER_DATA) -> DataVersion:
+    """Current version row; an unsaved version 0 if nothing was bumped yet."""
+    version = DataVersion.objects.filter(name=name).first()
+    if version is None:
+        version = DataVersion(name=name, version=0, changed_at=None)
+    return version
+
+
+def request_data_version(request, name: str = TENDER_DATA) -> DataVersion:
+    """`get_data_version`, looked up at most once per request."""
+    versions = getattr(request, "_data_versions", None)
+    if versions is None:
+        versions = request._data_versions = {}
+    if name not in versions:
+        versions[name] = get_data_version(name)
+    return versions[name]
+
+
+def bump_data_version(name: str = TENDER_DATA) -> None:
+    """Invalidate every validator and cache entry derived from `name`."""
+    now = timezone.now()
+    if not DataVersion.objects.filter(name=name).update(version=F("version") + 1, changed_at=now):
+        _version, created = DataVersion.objects.get_or_create(
+            name=name, defaults={"version": 1, "changed_at": now}
+        )
+        if not created:
+            DataVersion.objects.filter(name=name).update(version=F("version") + 1, changed_at=now)
+
+
+def profile_version(profile: Optional[SupplierProfile]) -> str:
+    """Identity plus last change of the profile a response was scored for."""
+    if profile is None:
+        return "-"
+    updated_at = profile.updated_at.timestamp() if profile.updated_at else 0
+    return f"{profile.pk}.{updated_at:.6f}"
+
+
+def normalized_query_string(query_params, exclude=()) -> str:
+    """
+    Query string with keys and repeated values sorted and empty values
+    dropped, so equivalent requests map to the same validator / cache key.
+    """
+    items = sorted(
+        (key, value)
+        for key in query_params
+        if key not in exclude
+        for value in query_params.getlist(key)
+        if value != ""
+    )
+    return urlencode(items)
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.md5("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+    return quote_etag(digest)
+
+
+# How long a waiting request polls for another request's result before
+# computing the value itself
+CACHE_LOCK_TIMEOUT = 10
+CACHE_LOCK_POLL_INTERVAL = 0.05
+
+
+def get_or_compute(key: str, compute: Callable[[], Any], timeout: Optional[int] = None) -> Any:
+    """
+    Read `key` from the cache or compute and store it. Concurrent misses are
+    collapsed: the first caller takes a short lock (`cache.add`) and the rest
+    wait for its result. `compute` returning None is not cached.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+
+    lock_key = f"{key}:lock"
+    if not cache.add(lock_key, 1, CACHE_LOCK_TIMEOUT):
+        deadline = time.monotonic() + CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            time.sleep(CACHE_LOCK_POLL_INTERVAL)
+            value = cache.get(key)
+            if value is not None:
+                return value
+            if cache.add(lock_key, 1, CACHE_LOCK_TIMEOUT):
+                break
+        else:
+            # The lock holder is stuck or gone; don't wait forever
+            return compute()
+
+    try:
+        value = compute()
+        if value is not None:
+            cache.set(key, value, settings.RESPONSE_CACHE_TIMEOUT if timeout is None else timeout)
+    finally:
+        cache.delete(lock_key)
+    return value
+
+
+async def aget_or_compute(
+    key: str, compute: Callable[[], Awaitable[Any]], timeout: Optional[int] = None
+) -> Any:
+    """`get_or_compute` for async views: `compute` is awaited and waiting never blocks the loop."""
+    value = await cache.aget(key)
+    if value is not None:
+        return value
+
+    lock_key = f"{key}:lock"
+    if not await cache.aadd(lock_key, 1, CACHE_LOCK_TIMEOUT):
+        deadline = time.monotonic() + CACHE_LOCK_TIMEOUT
+        while time.monotonic() < deadline:
+            await asyncio.sleep(CACHE_LOCK_POLL_INTERVAL)
+            value = await cache.aget(key)
+            if value is not None:
+                return value
+            if await cache.aadd(lock_key, 1, CACHE_LOCK_TIMEOUT):
+                break
+        else:
+            return await compute()
+
+    try:
+        value = await compute()
+        if value is not None:
+            await cache.aset(key, value, settings.RESPONSE_CACHE_TIMEOUT if timeout is None else timeout)
+    finally:
+        await cache.adelete(lock_key)
+    return value
+
+
+class CachedResponseMixin:
+    """
+    Serve GET responses from Django's cache. Keys combine the path, the
+    tender data version, the caller's profile version and latest recency
+    bucket crossing (unless `cache_per_profile` is False) and the normalised
+    query string, so an ingestion run, profile update or bucket change
+    invalidates entries by moving to a new generation rather than deleting
+    anything.
+    """
+
+    cache_per_profile = True
+    cache_timeout = None
+    # Query parameters that don't affect the response
+    cache_query_exclude = ()
+
+    def get_cache_key(self, request, *args, **kwargs) -> str:
+        parts = [
+            request.path,
+            request_data_version(request).version,
+            request.get_host(),
+            request.accepted_media_type,
+            normalized_query_string(request.query_params, exclude=self.cache_query_exclude),
+        ]
+        if self.cache_per_profile:
+            # Imported here to avoid a circular import (views imports caching)
+            from .views import get_scoring_context
+
+            scoring = get_scoring_context(request)
+            parts.append(profile_version(scoring.profile))
+            parts.append(scoring.recency_epoch())
+        digest = hashlib.md5("|".join(str(part) for part in parts).encode("utf-8")).hexdigest()
+        return f"ocds:response:{digest}"
+
+    def get(self, request, *args, **kwargs):
+        view_get = super().get
+        responses = []
+
+        def compute():
+            response = view_get(request, *args, **kwargs)
+            responses.append(response)
+            return response.data if response.status_code == 200 else None
+
+        data = get_or_compute(self.get_cache_key(request, *args, **kwargs), compute, self.cache_timeout)
+        if responses:
+            return responses[0]
+        return Response(data)
+
+    async def aget_cached(self, request, handler, *args, **kwargs):
+        """Async counterpart of `get`, serving the response of the awaited `handler`."""
+        # The key may need the data version / profile, which are DB lookups
+        key = await sync_to_async(self.get_cache_key)(request, *args, **kwargs)
+        responses = []
+
+        async def compute():
+            response = await handler(request, *args, **kwargs)
+            responses.append(response)
+            return response.data if response.status_code == 200 else None
+
+        data = await aget_or_compute(key, compute, self.cache_timeout)
+        if responses:
+            return responses[0]
+        return Response(data)
+
+
+class ConditionalGetMixin:
+    """
+    Answer `If-None-Match` / `If-Modified-Since` with 304 before the view's
+    queries and serializers run. Views implement `get_validators`, which runs
+    after authentication so validators can depend on the caller's profile.
+    """
+
+    vary_headers = ("Accept", "Authorization")
+
+    def get_validators(self, request, *args, **kwargs) -> Tuple[Optional[str], Optional[datetime]]:
+        """Return `(etag, last_modified)`; either may be None."""
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        etag, last_modified = self.get_validators(request, *args, **kwargs)
+        response = self.get_not_modified(request, etag, last_modified)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        return self.add_validators(response, etag, last_modified)
+
+    async def aget_conditional(self, request, handler, *args, **kwargs):
+        """Async counterpart of `get`; `handler` is awaited for the full response."""
+        etag, last_modified = await sync_to_async(self.get_validators)(request, *args, **kwargs)
+        response = self.get_not_modified(request, etag, last_modified)
+        if response is None:
+            response = await handler(request, *args, **kwargs)
+        return self.add_validators(response, etag, last_modified)
+
+    def get_not_modified(self, request, etag, last_modified):
+        """A 304 (or 412) response if the request's validators match, else None."""
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        return get_conditional_response(request, etag=etag, last_modified=timestamp)
+
+    def add_validators(self, response, etag, last_modified):
+        timestamp = int(last_modified.timestamp()) if last_modified else None
+        if response.status_code in (200, 304):
+            if etag:
+                response["ETag"] = etag
+            if timestamp is not None:
+                response["Last-Modified"] = http_date(timestamp)
+        patch_vary_headers(response, self.vary_headers)
+        return response
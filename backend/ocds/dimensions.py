@@ -0,0 +1,160 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, Optional, Tuple
+
+from django.db.models import Count, F, Q, Value
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import ScoreSweep, Tender, TenderDimension
+
+
+# TenderDimension.kind -> Tender field path holding the value
+DIMENSION_FIELDS = {
+    "category": "category",
+    "province": "province",
+    "buyer": "procuring_entity__name",
+}
+
+# (dimension values, counted as active) for one tender
+Snapshot = Tuple[Dict[str, str], bool]
+
+
+def active_tender_q(now: datetime) -> Q:
+    """
+    Tenders still open for submissions at `now`. Archived tenders are never
+    open; saying so lets the hot-set partial indexes apply.
+    """
+    return Q(status="active", archived=False) & (Q(tender_end_date__isnull=True) | Q(tender_end_date__gte=now))
+
+
+def dimension_snapshot(tender: Optional[Tender], now: Optional[datetime] = None) -> Optional[Snapshot]:
+    """What a tender currently contributes to the dimension tables."""
+    if tender is None:
+        return None
+    now = now or timezone.now()
+    values = {
+        "category": tender.category,
+        "province": tender.province,
+        "buyer": tender.procuring_entity.name if tender.procuring_entity else "",
+    }
+    active = (
+        tender.status == "active"
+        and not tender.archived
+        and (tender.tender_end_date is None or tender.tender_end_date >= now)
+    )
+    return values, active
+
+
+def recorded_snapshot(tender: Optional[Tender]) -> Optional[Snapshot]:
+    """
+    What the dimension tables currently hold for a stored tender. It counts
+    as active if it was still open at its last upsert and, if it has closed
+    since, no sweep has taken it out yet.
+    """
+    if tender is None:
+        return None
+    last_sweep = ScoreSweep.objects.order_by("-ran_at").values_list("ran_at", flat=True).first()
+    as_of = max(filter(None, [tender.updated_at, last_sweep]))
+    return dimension_snapshot(tender, as_of)
+
+
+def _adjust(kind: str, value: str, tender_delta: int, active_delta: int) -> None:
+    changes = {
+        "tender_count": Greatest(F("tender_count") + tender_delta, Value(0)),
+        "active_count": Greatest(F("active_count") + active_delta, Value(0)),
+    }
+    if TenderDimension.objects.filter(kind=kind, value=value).update(**changes):
+        return
+    _dimension, created = TenderDimension.objects.get_or_create(
+        kind=kind,
+        value=value,
+        defaults={"tender_count": max(tender_delta, 0), "active_count": max(active_delta, 0)},
+    )
+    if not created:
+        TenderDimension.objects.filter(kind=kind, value=value).update(**changes)
+
+
+def apply_dimension_change(before: Optional[Snapshot], after: Optional[Snapshot]) -> None:
+    """Move a tender's contribution from `before` to `after` (either may be None)."""
+    deltas = defaultdict(lambda: [0, 0])
+    for snapshot, sign in ((before, -1), (after, 1)):
+        if snapshot is None:
+            continue
+        values, active = snapshot
+        for kind, value in values.items():
+            if not value:
+                continue
+            deltas[(kind, value)][0] += sign
+            if active:
+                deltas[(kind, value)][1] += sign
+
+    for (kind, value), (tender_delta, active_delta) in deltas.items():
+        if tender_delta or active_delta:
+            _adjust(kind, value, tender_delta, active_delta)
+
+
+def rename_buyer_dimension(entity, old_name: str, exclude_pk: Optional[int] = None) -> None:
+    """
+    Move the buyer counts of an entity's other tenders from `old_name` to
+    its current name after a rename (the upserted tender itself, `exclude_pk`,
+    moves through `apply_dimension_change`). Tenders count as active if they
+    were still open at the last sweep.
+    """
+    last_sweep = ScoreSweep.objects.order_by("-ran_at").values_list("ran_at", flat=True).first()
+    counts = (
+        Tender.objects.filter(procuring_entity=entity)
+        .exclude(pk=exclude_pk)
+        .aggregate(total=Count("pk"), active=Count("pk", filter=active_tender_q(last_sweep or timezone.now())))
+    )
+    if not counts["total"]:
+        return
+    if old_name:
+        _adjust("buyer", old_name, -counts["total"], -counts["active"])
+    if entity.name:
+        _adjust("buyer", entity.name, counts["total"], counts["active"])
+
+
+def close_expired_dimensions(since: datetime, until: datetime) -> int:
+    """
+    Drop active counts for tenders whose closing date passed between two
+    sweeps. Tenders last upserted after they had already closed were never
+    counted as active and are skipped. Returns the number of tenders.
+    """
+    closed = Tender.objects.filter(
+        status="active",
+        tender_end_date__gte=since,
+        tender_end_date__lt=until,
+        updated_at__lte=F("tender_end_date"),
+    )
+    total = 0
+    for kind, field in DIMENSION_FIELDS.items():
+        rows = closed.exclude(**{f"{field}__isnull": True}).exclude(**{field: ""}).values_list(field).annotate(
+            n=Count("pk")
+        )
+        for value, count in rows.order_by():
+            _adjust(kind, value, 0, -count)
+            if kind == "category":
+                total += count
+    return total
+
+
+def rebuild_tender_dimensions(now: Optional[datetime] = None) -> int:
+    """Recount every dimension from the tender table. Returns the row count."""
+    now = now or timezone.now()
+    dimensions = []
+    for kind, field in DIMENSION_FIELDS.items():
+        rows = (
+            Tender.objects.exclude(**{f"{field}__isnull": True})
+            .exclude(**{field: ""})
+            .values_list(field)
+            .annotate(total=Count("pk"), active=Count("pk", filter=active_tender_q(now)))
+            .order_by()
+        )
+        dimensions.extend(
+            TenderDimension(kind=kind, value=value, tender_count=total, active_count=active)
+            for value, total, active in rows
+        )
+    TenderDimension.objects.all().delete()
+    TenderDimension.objects.bulk_create(dimensions, batch_size=1000)
+    return len(dimensions)
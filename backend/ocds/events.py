@@ -0,0 +1,295 @@
+"""
+Server-sent events for new and updated tenders matching a supplier's
+profile (`TenderEventStreamView`).
+
+Each ASGI worker runs one `TenderEventBroker`. It LISTENs for ingestion
+commits on a dedicated PostgreSQL connection (or polls, on other
+databases), fetches the changed tenders once per wake-up and fans them out
+to the connected subscribers, each matched with its own ScoringContext.
+Matching (scoring and encoding) runs in worker threads, a batch of
+subscribers at a time, so the event loop only moves finished events into
+queues. Idle subscribers are just a queue: no database connection, no
+polling.
+
+Event ids are `(updated_at, id)` positions, so a reconnecting client
+resumes from its `Last-Event-ID`.
+"""
+import asyncio
+import logging
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from typing import List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection, connections
+from django.db.models import Q
+
+from .models import Tender
+from .renderers import dumps
+from .scoring import ScoringContext
+from .serializers import SCORING_COLUMNS, TenderListSerializer
+
+logger = logging.getLogger(__name__)
+
+TENDER_EVENTS_CHANNEL = "ocds_tender_events"
+
+# Changed tenders fetched per query
+EVENT_BATCH_SIZE = 500
+# Events buffered per subscriber; a subscriber that falls further behind
+# (or resumes from further back) gets a `resync` event instead
+SUBSCRIBER_QUEUE_SIZE = 1000
+# Client reconnect delay sent with the `retry:` field
+RECONNECT_DELAY_MS = 5000
+# Subscribers matched per hop to a worker thread
+MATCH_BATCH_SIZE = 200
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+
+# (updated_at, id) of a tender; events are ordered by it
+Cursor = Tuple[datetime, int]
+
+
+def encode_event_id(cursor: Cursor) -> str:
+    updated_at, pk = cursor
+    return f"{(updated_at - EPOCH) // timedelta(microseconds=1)}-{pk}"
+
+
+def decode_event_id(value: Optional[str]) -> Optional[Cursor]:
+    try:
+        micros, pk = value.split("-")
+        return EPOCH + timedelta(microseconds=int(micros)), int(pk)
+    except (AttributeError, ValueError):
+        return None
+
+
+def format_event(event_id: str, event: str, data: str) -> str:
+    return f"id: {event_id}\nevent: {event}\ndata: {data}\n\n"
+
+
+def current_cursor() -> Cursor:
+    """Position of the most recently changed tender."""
+    row = Tender.objects.order_by("-updated_at", "-id").values_list("updated_at", "id").first()
+    return row or (EPOCH, 0)
+
+
+def load_changes(after: Cursor, upto: Optional[Cursor] = None, limit: int = EVENT_BATCH_SIZE):
+    """
+    Active hot-set tenders changed after `after` (and at or before `upto`),
+    oldest first, with their cards (compact representation minus
+    `matchScore`, which is per subscriber).
+    """
+    columns, _documents = TenderListSerializer.get_queryset_columns()
+    updated_at, pk = after
+    qs = (
+        Tender.objects.hot()
+        .filter(status="active")
+        .filter(Q(updated_at__gt=updated_at) | Q(updated_at=updated_at, pk__gt=pk))
+        .select_related("procuring_entity")
+        .only("id", "updated_at", *columns, *SCORING_COLUMNS)
+    )
+    if upto is not None:
+        updated_at, pk = upto
+        qs = qs.filter(Q(updated_at__lt=updated_at) | Q(updated_at=updated_at, pk__lte=pk))
+    tenders = list(qs.order_by("updated_at", "id")[:limit])
+    fields = set(TenderListSerializer.Meta.fields) - {"matchScore"}
+    cards = TenderListSerializer(tenders, many=True, context={"fields": fields}).data
+    return tenders, cards
+
+
+def _run_and_close(fn, *args):
+    """Run `fn` in a worker thread and release that thread's DB connection."""
+    try:
+        return fn(*args)
+    finally:
+        connection.close()
+
+
+def notify_tender_changes() -> None:
+    """Wake every worker's broker; call once ingested tenders are committed."""
+    if connection.vendor == "postgresql":
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_notify(%s, '')", [TENDER_EVENTS_CHANNEL])
+    elif _broker is not None:
+        # No LISTEN/NOTIFY: only a broker in this process can be woken early
+        _broker.loop.call_soon_threadsafe(_broker.wakeup.set)
+
+
+def open_listen_connection():
+    """A dedicated autocommit connection LISTENing on the events channel."""
+    wrapper = connections["default"]
+    conn = wrapper.get_new_connection(wrapper.get_connection_params())
+    conn.autocommit = True
+    with conn.cursor() as cursor:
+        cursor.execute(f"LISTEN {TENDER_EVENTS_CHANNEL}")
+    return conn
+
+
+class Subscription:
+    """One connected client: its scoring context, threshold and event queue."""
+
+    def __init__(self, scoring: ScoringContext, min_score: int):
+        self.scoring = scoring
+        self.min_score = min_score
+        self.queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+
+    def match(self, tenders: List[Tender], cards) -> List[str]:
+        """Formatted events for the tenders scoring at least `min_score`."""
+        self.scoring.refresh()
+        events = []
+        for tender, card in zip(tenders, cards):
+            score = self.scoring.score(tender)
+            if score >= self.min_score:
+                data = dumps({**card, "matchScore": score}).decode("utf-8")
+                events.append(format_event(encode_event_id((tender.updated_at, tender.pk)), "tender", data))
+        return events
+
+    def catch_up(self, after: Cursor, upto: Cursor) -> List[str]:
+        """Events missed between `after` (the client's last event id) and `upto`."""
+        tenders, cards = load_changes(after, upto, limit=SUBSCRIBER_QUEUE_SIZE)
+        if len(tenders) >= SUBSCRIBER_QUEUE_SIZE:
+            return [self.resync_event(upto)]
+        return self.match(tenders, cards)
+
+    def offer(self, events: List[str], head: Cursor) -> None:
+        """Queue events produced by `match`; runs on the event loop."""
+        for event in events:
+            try:
+                self.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                while not self.queue.empty():
+                    self.queue.get_nowait()
+                self.queue.put_nowait(self.resync_event(head))
+                return
+
+    def resync_event(self, head: Cursor) -> str:
+        """Tell the client to reload its feed; resuming continues from `head`."""
+        return format_event(encode_event_id(head), "resync", "{}")
+
+
+def match_subscribers(subscriptions: List[Subscription], tenders: List[Tender], cards) -> List[List[str]]:
+    """`Subscription.match` for a batch of subscribers, off the event loop."""
+    return [subscription.match(tenders, cards) for subscription in subscriptions]
+
+
+class TenderEventBroker:
+    """Per-process fan-out of tender changes to the connected subscribers."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.subscribers = set()
+        self.cursor: Optional[Cursor] = None
+        self.wakeup = asyncio.Event()
+        self.listener = None
+        self.task = None
+
+    async def subscribe(self, subscription: Subscription) -> Cursor:
+        """Register a subscriber; returns the position live events start after."""
+        if self.cursor is None:
+            self.cursor = await sync_to_async(_run_and_close, thread_sensitive=False)(current_cursor)
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+        self.subscribers.add(subscription)
+        return self.cursor
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self.subscribers.discard(subscription)
+        if not self.subscribers:
+            # Start from the then-current head when someone connects again
+            self.cursor = None
+
+    async def run(self):
+        while True:
+            if self.listener is None:
+                await self.listen()
+            timeout = None if self.listener is not None else settings.TENDER_EVENTS_POLL_INTERVAL
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self.wakeup.clear()
+            try:
+                await self.publish_changes()
+            except Exception:
+                logger.exception("Failed to publish tender events")
+
+    async def publish_changes(self):
+        while self.subscribers and self.cursor is not None:
+            tenders, cards = await sync_to_async(_run_and_close, thread_sensitive=False)(
+                load_changes, self.cursor
+            )
+            if not tenders:
+                return
+            self.cursor = (tenders[-1].updated_at, tenders[-1].pk)
+            subscribers = list(self.subscribers)
+            for start in range(0, len(subscribers), MATCH_BATCH_SIZE):
+                batch = subscribers[start : start + MATCH_BATCH_SIZE]
+                matched = await sync_to_async(_run_and_close, thread_sensitive=False)(
+                    match_subscribers, batch, tenders, cards
+                )
+                for subscription, events in zip(batch, matched):
+                    subscription.offer(events, self.cursor)
+                    # Let other tasks run between subscribers
+                    await asyncio.sleep(0)
+            if len(tenders) < EVENT_BATCH_SIZE:
+                return
+
+    async def listen(self):
+        """Register a LISTEN connection with the loop; polling is the fallback."""
+        if connection.vendor != "postgresql":
+            return
+        try:
+            conn = await sync_to_async(open_listen_connection, thread_sensitive=False)()
+        except Exception:
+            logger.exception("Could not LISTEN for tender events; polling instead")
+            return
+        if not hasattr(conn, "poll"):
+            # psycopg 3 delivers notifications differently; poll instead
+            conn.close()
+            return
+        self.listener = conn
+        self.loop.add_reader(conn.fileno(), self.on_notify)
+
+    def on_notify(self):
+        conn = self.listener
+        try:
+            conn.poll()
+        except Exception:
+            logger.exception("Tender events LISTEN connection lost")
+            self.loop.remove_reader(conn.fileno())
+            conn.close()
+            self.listener = None
+            self.wakeup.set()
+            return
+        if conn.notifies:
+            del conn.notifies[:]
+            self.wakeup.set()
+
+
+_broker: Optional[TenderEventBroker] = None
+
+
+def get_broker() -> TenderEventBroker:
+    """This process's broker, bound to the running event loop."""
+    global _broker
+    loop = asyncio.get_running_loop()
+    if _broker is None or _broker.loop is not loop:
+        _broker = TenderEventBroker(loop)
+    return _broker
+
+
+async def event_stream(broker: TenderEventBroker, subscription: Subscription, backlog: List[str]):
+    """The SSE body: missed events, then live events with keep-alive comments."""
+    try:
+        yield f"retry: {RECONNECT_DELAY_MS}\n\n"
+        for event in backlog:
+            yield event
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), settings.TENDER_EVENTS_HEARTBEAT)
+            except asyncio.TimeoutError:
+                yield ": keep-alive\n\n"
+                continue
+            yield event
+    finally:
+        broker.unsubscribe(subscription)
@@ -0,0 +1,199 @@
+"""
+Streaming tender exports (CSV, NDJSON, Parquet) for `TenderExportView`.
+Rows come from a server-side cursor and are written out chunk by chunk, so
+memory use does not grow with the size of the export. Under ASGI the sync
+generators are driven through `stream_async` (Django would otherwise
+consume them into a list before sending anything).
+"""
+import csv
+from typing import AsyncIterator, Iterable, Iterator, List, Tuple
+
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+
+from .renderers import dumps
+from .scoring import _cpv_code
+
+# Rows fetched per round trip from the server-side cursor
+EXPORT_CHUNK_SIZE = 2000
+
+# Output gathered per hop to the sync thread when streaming under ASGI
+ASYNC_EXPORT_BATCH_SIZE = 64 * 1024
+
+# (output column, queryset field or annotation)
+EXPORT_COLUMNS: List[Tuple[str, str]] = [
+    ("tenderId", "tender_id"),
+    ("ocid", "ocid"),
+    ("title", "title"),
+    ("description", "description"),
+    ("status", "status"),
+    ("category", "category"),
+    ("province", "province"),
+    ("city", "city"),
+    ("valueAmount", "value_amount"),
+    ("valueCurrency", "value_currency"),
+    ("tenderStartDate", "tender_start_date"),
+    ("tenderEndDate", "tender_end_date"),
+    ("procuringEntity", "procuring_entity__name"),
+    ("cpvCodes", "cpv_codes"),
+    ("matchScore", "export_score"),
+]
+
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "ndjson": ("application/x-ndjson", "ndjson"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def export_rows(queryset: QuerySet) -> Iterator[dict]:
+    """Stream export rows as dicts keyed by output column."""
+    names = [name for name, _field in EXPORT_COLUMNS]
+    fields = [field for _name, field in EXPORT_COLUMNS]
+    for values in queryset.values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+        row = dict(zip(names, values))
+        row["cpvCodes"] = [code for code in map(_cpv_code, row["cpvCodes"] or []) if code]
+        yield row
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for csv.writer."""
+
+    def write(self, value):
+        return value
+
+
+def stream_csv(rows: Iterable[dict]) -> Iterator[str]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _field in EXPORT_COLUMNS])
+    for row in rows:
+        values = []
+        for name, _field in EXPORT_COLUMNS:
+            value = row[name]
+            if name == "cpvCodes":
+                value = ";".join(value)
+            elif hasattr(value, "isoformat"):
+                value = value.isoformat()
+            values.append("" if value is None else value)
+        yield writer.writerow(values)
+
+
+def stream_ndjson(rows: Iterable[dict]) -> Iterator[bytes]:
+    for row in rows:
+        yield dumps(row) + b"\n"
+
+
+class _ChunkSink:
+    """
+    Write-only file for pyarrow that hands written bytes back to the
+    response generator instead of keeping them. `tell()` keeps counting so
+    the Parquet footer offsets stay correct.
+    """
+
+    closed = False
+
+    def __init__(self):
+        self.position = 0
+        self.chunks = []
+
+    def write(self, data):
+        data = bytes(data)
+        self.chunks.append(data)
+        self.position += len(data)
+        return len(data)
+
+    def tell(self):
+        return self.position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks = []
+        return data
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def stream_parquet(rows: Iterable[dict]) -> Iterator[bytes]:
+    """
+    Parquet output, one row group per `EXPORT_CHUNK_SIZE` rows. Needs the
+    optional `pyarrow` package (check `parquet_available()` first).
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    timestamp = pa.timestamp("us", tz="UTC")
+    schema = pa.schema(
+        [
+            ("tenderId", pa.string()),
+            ("ocid", pa.string()),
+            ("title", pa.string()),
+            ("description", pa.string()),
+            ("status", pa.string()),
+            ("category", pa.string()),
+            ("province", pa.string()),
+            ("city", pa.string()),
+            ("valueAmount", pa.float64()),
+            ("valueCurrency", pa.string()),
+            ("tenderStartDate", timestamp),
+            ("tenderEndDate", timestamp),
+            ("procuringEntity", pa.string()),
+            ("cpvCodes", pa.list_(pa.string())),
+            ("matchScore", pa.int32()),
+        ]
+    )
+
+    def to_batch(batch):
+        columns = {name: [row[name] for row in batch] for name in schema.names}
+        columns["valueAmount"] = [None if value is None else float(value) for value in columns["valueAmount"]]
+        return pa.RecordBatch.from_pydict(columns, schema=schema)
+
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(pa.PythonFile(sink, mode="w"), schema)
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= EXPORT_CHUNK_SIZE:
+            writer.write_batch(to_batch(batch))
+            batch = []
+            yield sink.drain()
+    if batch:
+        writer.write_batch(to_batch(batch))
+    writer.close()
+    yield sink.drain()
+
+
+async def stream_async(chunks: Iterator, batch_size: int = ASYNC_EXPORT_BATCH_SIZE) -> AsyncIterator:
+    """
+    Serve one of the sync export streams from an ASGI server without
+    buffering it. The generator (and its server-side cursor) advances in the
+    request's sync thread, about `batch_size` bytes of output per hop, and
+    each batch is sent before the next one is produced.
+    """
+
+    def next_batch():
+        parts, size = [], 0
+        for part in chunks:
+            parts.append(part)
+            size += len(part)
+            if size >= batch_size:
+                break
+        return parts
+
+    while True:
+        parts = await sync_to_async(next_batch, thread_sensitive=True)()
+        if not parts:
+            return
+        # str for CSV, bytes for NDJSON / Parquet
+        yield parts[0][:0].join(parts)
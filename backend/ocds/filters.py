@@ -0,0 +1,224 @@
+import operator
+import re
+from functools import reduce
+from typing import Dict, List, Optional, Tuple
+
+from django.contrib.postgres.search import (
+    SearchQuery,
+    SearchRank,
+    SearchVector,
+    TrigramWordSimilarity,
+)
+from django.db import connections
+from django.db.models import Case, CharField, F, FloatField, IntegerField, Q, QuerySet, Value, When
+from django.db.models.functions import Cast
+
+
+# Text search configuration used both for the stored vector and for queries
+SEARCH_CONFIG = "english"
+
+# Terms shorter than this cannot use trigrams and fall back to a title scan
+TRIGRAM_MIN_LENGTH = 3
+
+# Terms that get the trigram (partial word) fallback: one word, no syntax
+PARTIAL_WORD_RE = re.compile(r"\w+")
+
+# Points added to the match score for a perfect text match (rank 1.0)
+SEARCH_RANK_WEIGHT = 50
+
+
+def tender_search_vector(buyer_name: str = "") -> SearchVector:
+    """
+    Weighted document for `Tender.search_vector`: title (A), description (B)
+    and buyer name (C). The buyer name is passed in because UPDATE cannot
+    reference joined columns.
+    """
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="B", config=SEARCH_CONFIG)
+        + SearchVector(Value(buyer_name or ""), weight="C", config=SEARCH_CONFIG)
+    )
+
+
+def history_requested(params) -> bool:
+    """`?history=1` also serves archived tenders (see `Tender.archived`)."""
+    return params.get("history") in ("1", "true")
+
+
+def split_by_archive(*conditions) -> Q:
+    """
+    Any of `conditions`, as one OR arm per condition and side of the archive.
+    The search indexes are partial (hot set and archive); a query over both
+    sides only reaches them when each arm names its side.
+    """
+    split = Q(pk__in=[])
+    for archived in (False, True):
+        for condition in conditions:
+            split |= Q(condition, archived=archived)
+    return split
+
+
+def apply_tender_search(qs: QuerySet, term: str, history: bool = False) -> Tuple[QuerySet, Cast]:
+    """
+    Filter tenders by a free-text search term.
+
+    Full words go through the GIN-indexed `search_vector` with websearch
+    syntax ("quoted phrases", -exclusions, OR). A single partial word
+    ("constr") is also caught by a trigram word-similarity match on the
+    title only, also GIN-indexed. Returns the filtered queryset and an integer relevance
+    expression (0..SEARCH_RANK_WEIGHT) to add to the feed score. Pass
+    `history=True` when `qs` includes archived tenders.
+
+    Full-text matches rank in the upper half by `ts_rank`, partial title
+    matches in the lower half by word similarity. Word similarity is the
+    expensive part, so it is only computed for rows the full-text query
+    missed.
+    """
+    term = term.strip()
+    query = SearchQuery(term, search_type="websearch", config=SEARCH_CONFIG)
+    rank = SearchRank(F("search_vector"), query, normalization=32)
+
+    if len(term) < TRIGRAM_MIN_LENGTH:
+        conditions = [Q(search_vector=query), Q(title__istartswith=term)]
+    elif not PARTIAL_WORD_RE.fullmatch(term):
+        # Several words or websearch syntax: matching each row's title
+        # against the whole string is costly and rarely what was meant
+        conditions = [Q(search_vector=query)]
+    else:
+        conditions = [Q(search_vector=query), Q(title__trigram_word_similar=term)]
+        rank = Case(
+            When(search_vector=query, then=(rank + 1) / 2),
+            default=TrigramWordSimilarity(term, "title") / 2,
+            output_field=FloatField(),
+        )
+
+    if history:
+        qs = qs.filter(split_by_archive(*conditions))
+    else:
+        qs = qs.filter(reduce(operator.or_, conditions))
+    return qs, Cast(rank * SEARCH_RANK_WEIGHT, IntegerField())
+
+
+def parse_tender_ids(params) -> List[str]:
+    """
+    `?ids=a,b,c` (or repeated `ids=`) as a de-duplicated list of tender ids,
+    in the order given.
+    """
+    ids = []
+    for raw in params.getlist("ids"):
+        ids.extend(value.strip() for value in raw.split(","))
+    return list(dict.fromkeys(value for value in ids if value))
+
+
+def apply_feed_filters(qs: QuerySet, params) -> Tuple[QuerySet, Optional[Cast]]:
+    """
+    Apply the feed's query parameters (ids, search, status, categories,
+    provinces, minValue, maxValue). Returns the filtered queryset and the
+    search relevance expression, or None when there is no search term.
+    """
+    ids = parse_tender_ids(params)
+    search = params.get("search") or ""
+    categories = params.getlist("categories")
+    provinces = params.getlist("provinces")
+    status_list = params.getlist("status")
+    min_value = params.get("minValue")
+    max_value = params.get("maxValue")
+
+    if ids:
+        # Batch lookup, e.g. the cards for a list of saved tenders
+        qs = qs.filter(tender_id__in=ids)
+
+    search_rank = None
+    if search.strip():
+        qs, search_rank = apply_tender_search(qs, search, history=history_requested(params))
+
+    if status_list:
+        qs = qs.filter(status__in=status_list)
+
+    if categories:
+        # Category name, or a CPV code present in the tender's code list
+        qs = qs.filter(Q(category__in=categories) | Q(cpv_codes__has_any_keys=categories))
+
+    if provinces:
+        qs = qs.filter(province__in=provinces)
+
+    if min_value:
+        qs = qs.filter(value_amount__gte=min_value)
+    if max_value:
+        qs = qs.filter(value_amount__lte=max_value)
+
+    return qs, search_rank
+
+
+# (label, lower bound inclusive, upper bound exclusive) for the value facet
+VALUE_BUCKETS = (
+    ("0-1m", 0, 1_000_000),
+    ("1m-10m", 1_000_000, 10_000_000),
+    ("10m-50m", 10_000_000, 50_000_000),
+    ("50m+", 50_000_000, None),
+)
+
+# Facet name in the response -> column of the grouped subquery
+FACET_COLUMNS = {
+    "categories": "category",
+    "provinces": "province",
+    "status": "status",
+    "valueRanges": "value_bucket",
+}
+
+
+def value_bucket_expression() -> Case:
+    """SQL CASE mapping `value_amount` to a `VALUE_BUCKETS` label (NULL if unknown)."""
+    whens = []
+    for label, lower, upper in VALUE_BUCKETS:
+        condition = Q(value_amount__gte=lower)
+        if upper is not None:
+            condition &= Q(value_amount__lt=upper)
+        whens.append(When(condition, then=Value(label)))
+    return Case(*whens, default=None, output_field=CharField())
+
+
+def facet_counts(qs: QuerySet) -> Dict[str, List[dict]]:
+    """
+    Counts per category, province, status and value bucket for an already
+    filtered tender queryset, computed in one `GROUP BY GROUPING SETS`
+    query (the empty set gives the total).
+    """
+    columns = list(FACET_COLUMNS.values())
+    inner = qs.annotate(value_bucket=value_bucket_expression()).values(*columns).order_by()
+    inner_sql, params = inner.query.sql_with_params()
+    grouping = ", ".join(f"GROUPING({column})" for column in columns)
+    sets = ", ".join(f"({column})" for column in columns)
+    sql = (
+        f"SELECT {grouping}, {', '.join(columns)}, COUNT(*) "
+        f"FROM ({inner_sql}) AS feed "
+        f"GROUP BY GROUPING SETS ({sets}, ())"
+    )
+
+    facets: Dict[str, List[dict]] = {name: [] for name in FACET_COLUMNS}
+    total = 0
+    with connections[qs.db].cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    n = len(columns)
+    for row in rows:
+        grouped, values, count = row[:n], row[n : 2 * n], row[-1]
+        if all(grouped):
+            total = count
+            continue
+        # GROUPING(col) is 0 for the column this row is grouped by
+        index = grouped.index(0)
+        value = values[index]
+        if value in (None, ""):
+            continue
+        facets[list(FACET_COLUMNS)[index]].append({"value": value, "count": count})
+
+    for name, entries in facets.items():
+        entries.sort(key=lambda entry: (-entry["count"], entry["value"]))
+    bounds = {label: (lower, upper) for label, lower, upper in VALUE_BUCKETS}
+    facets["valueRanges"] = [
+        {**entry, "min": bounds[entry["value"]][0], "max": bounds[entry["value"]][1]}
+        for entry in sorted(facets["valueRanges"], key=lambda entry: bounds[entry["value"]][0])
+    ]
+    return {"total": total, **facets}
@@ -0,0 +1,106 @@
+"""
+Synthetic tender data for the benchmark command and the query-plan tests.
+Not a management command (leading underscore).
+"""
+import random
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from ocds.filters import tender_search_vector
+from ocds.models import ProcuringEntity, Release, Tender
+
+SYNTHETIC_PREFIX = "synthetic-"
+
+PROVINCES = [
+    "Eastern Cape",
+    "Free State",
+    "Gauteng",
+    "KwaZulu-Natal",
+    "Limpopo",
+    "Mpumalanga",
+    "North West",
+    "Northern Cape",
+    "Western Cape",
+]
+CATEGORIES = ["goods", "services", "works", "consultingServices"]
+STATUSES = ["active"] * 6 + ["complete", "cancelled", "planning"]
+CPVS = ["72000000", "33000000", "45000000", "79000000", "90000000", "50000000", "48000000", "71000000"]
+WORDS = (
+    "supply delivery maintenance construction repair upgrade installation provision "
+    "security cleaning catering software network medical equipment school clinic road "
+    "water sanitation electrical consulting audit training vehicles fencing renovation"
+).split()
+# Specialist phrases in about one title in 500, so searches for them are
+# selective the way real searches are (every word above is in most rows)
+RARE_PHRASES = ["desalination plant", "borehole drilling", "photovoltaic array", "geotechnical survey"]
+RARE_PHRASE_RATE = 0.002
+
+
+def seed_synthetic_tenders(count: int, batch_size: int = 5000, seed: int = 42) -> int:
+    """
+    Bulk-insert `count` synthetic releases/tenders (idempotent per index) and
+    fill their search vectors. Returns the number of tenders created.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+
+    entities = []
+    for i in range(200):
+        entity, _ = ProcuringEntity.objects.get_or_create(
+            party_id=f"{SYNTHETIC_PREFIX}buyer-{i}",
+            defaults={"name": f"{rng.choice(PROVINCES)} Department of {rng.choice(WORDS).title()} {i}"},
+        )
+        entities.append(entity)
+
+    existing = Tender.objects.filter(tender_id__startswith=SYNTHETIC_PREFIX).count()
+    created = 0
+    for start in range(existing, count, batch_size):
+        stop = min(start + batch_size, count)
+        with transaction.atomic():
+            releases = Release.objects.bulk_create(
+                [
+                    Release(
+                        release_id=f"{SYNTHETIC_PREFIX}{i}",
+                        ocid=f"ocds-{SYNTHETIC_PREFIX}{i}",
+                        date=now - timedelta(days=rng.randint(0, 720)),
+                        tag=["tender"],
+                        initiation_type="tender",
+                        raw_json={"id": f"{SYNTHETIC_PREFIX}{i}", "tender": {"procurementMethod": "open"}},
+                    )
+                    for i in range(start, stop)
+                ]
+            )
+            tenders = []
+            for i, release in zip(range(start, stop), releases):
+                title = " ".join(rng.choice(WORDS) for _ in range(rng.randint(3, 8))).capitalize()
+                if rng.random() < RARE_PHRASE_RATE:
+                    title = f"{title} {rng.choice(RARE_PHRASES)}"
+                tenders.append(
+                    Tender(
+                        release=release,
+                        tender_id=f"{SYNTHETIC_PREFIX}{i}",
+                        ocid=release.ocid,
+                        title=title,
+                        description=" ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 80))),
+                        status=rng.choice(STATUSES),
+                        category=rng.choice(CATEGORIES),
+                        province=rng.choice(PROVINCES),
+                        city="",
+                        value_amount=rng.randint(10_000, 200_000_000) if rng.random() > 0.1 else None,
+                        tender_start_date=release.date,
+                        tender_end_date=now + timedelta(days=rng.randint(-540, 90)),
+                        procuring_entity=rng.choice(entities),
+                        cpv_codes=rng.sample(CPVS, rng.randint(0, 3)),
+                        match_score=rng.randint(0, 90),
+                    )
+                )
+            Tender.objects.bulk_create(tenders)
+        created += stop - start
+
+    for entity in entities:
+        Tender.objects.filter(procuring_entity=entity, search_vector__isnull=True).update(
+            search_vector=tender_search_vector(entity.name)
+        )
+    return created
@@ -0,0 +1,34 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from ocds.services import archivable_tenders, archive_closed_tenders
+
+
+class Command(BaseCommand):
+    help = "Move tenders that closed a while ago out of the hot set served by the feed."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.TENDER_ARCHIVE_AFTER_DAYS,
+            help=f"Archive tenders closed more than this many days ago (default: {settings.TENDER_ARCHIVE_AFTER_DAYS}).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many tenders would be archived.",
+        )
+
+    def handle(self, *args, **options):
+        if options["dry_run"]:
+            cutoff = timezone.now() - timedelta(days=options["days"])
+            count = archivable_tenders(cutoff).count()
+            self.stdout.write(self.style.NOTICE(f"{count} tenders would be archived."))
+            return
+
+        archived = archive_closed_tenders(days=options["days"])
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} tenders."))
@@ -0,0 +1,134 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.test import Client
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+from django.db.models import Q
+
+from ocds.filters import apply_tender_search
+from ocds.models import Tender
+from ocds.renderers import FastJSONRenderer, orjson
+from ocds.scoring import ScoringContext
+from ocds.serializers import ReleaseSerializer
+from ocds.views import TenderListView, get_cached_default_profile
+
+from ._synthetic import seed_synthetic_tenders
+
+DEFAULT_SEARCH_TERMS = ["water", "construction of school", "maintenance -cleaning", "sec", "renovat"]
+
+# (label, query string) for the serialization suite
+SERIALIZE_CASES = [
+    ("full", ""),
+    ("compact", "view=compact"),
+    ("sparse", "view=compact&fields=title,status,tenderPeriod,matchScore"),
+]
+
+
+class Command(BaseCommand):
+    help = "Time feed queries against the current database (optionally seeding synthetic tenders first)."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=0,
+            help="Ensure at least this many synthetic tenders exist before benchmarking.",
+        )
+        parser.add_argument(
+            "--suite",
+            choices=["search", "serialize", "render"],
+            default="search",
+            help="Which benchmark to run (default: search).",
+        )
+        parser.add_argument("--repeat", type=int, default=5, help="Timed repetitions per case (default: 5).")
+        parser.add_argument("--term", action="append", dest="terms", help="Search term (repeatable).")
+
+    def handle(self, *args, **options):
+        if options["seed"]:
+            created = seed_synthetic_tenders(options["seed"])
+            self.stdout.write(self.style.NOTICE(f"Seeded {created} synthetic tenders."))
+
+        self.stdout.write(f"Tenders in table: {Tender.objects.count()}")
+        getattr(self, f"run_{options['suite']}")(options)
+
+    def _time(self, fn, repeat):
+        fn()  # warm-up
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            fn()
+            samples.append((time.perf_counter() - start) * 1000)
+        return statistics.median(samples), max(samples)
+
+    def _report(self, label, timings):
+        median, worst = timings
+        self.stdout.write(f"  {label:<10} median {median:8.2f} ms   max {worst:8.2f} ms")
+
+    def run_serialize(self, options):
+        """
+        Size of the first feed page in each representation, the time to
+        serve it (response cache bypassed) and, separately, the time to
+        serialise and render the already-fetched page.
+        """
+        client = Client()
+        factory = APIRequestFactory()
+        for n, (label, query) in enumerate(SERIALIZE_CASES):
+            url = f"/api/tenders/?{query}" if query else "/api/tenders/"
+            size = len(client.get(url).content)
+            requests = iter(range(10**9))
+
+            def fetch():
+                # A throwaway parameter gives every request its own cache key
+                return client.get(url, {"_": f"{n}.{next(requests)}"})
+
+            view = TenderListView(args=(), kwargs={}, format_kwarg=None)
+            view.request = view.initialize_request(factory.get(url))
+            tenders = view.paginate_queryset(view.filter_queryset(view.get_queryset()))
+
+            def serialise():
+                response = view.get_page_response(view.request, tenders)
+                return FastJSONRenderer().render(response.data)
+
+            self._report(label, self._time(fetch, options["repeat"]))
+            self._report("serialise", self._time(serialise, options["repeat"]))
+            self.stdout.write(f"  {'':<10} {size / 1024:8.1f} KiB per page")
+
+    def run_search(self, options):
+        """Legacy triple ILIKE vs. full-text + trigram search, first feed page."""
+        for term in options["terms"] or DEFAULT_SEARCH_TERMS:
+            self.stdout.write(f"search={term!r}")
+
+            def legacy():
+                qs = Tender.objects.hot().filter(
+                    Q(title__icontains=term)
+                    | Q(description__icontains=term)
+                    | Q(procuring_entity__name__icontains=term)
+                ).order_by("-match_score", "tender_end_date")
+                return list(qs.values_list("pk", flat=True)[:20])
+
+            def fulltext():
+                qs, rank = apply_tender_search(Tender.objects.hot(), term)
+                qs = qs.annotate(search_score=rank).order_by("-search_score", "tender_end_date")
+                return list(qs.values_list("pk", flat=True)[:20])
+
+            self._report("ilike", self._time(legacy, options["repeat"]))
+            self._report("fulltext", self._time(fulltext, options["repeat"]))
+
+    def run_render(self, options):
+        """JSON rendering of full feed pages: DRF's stdlib renderer vs. orjson."""
+        if orjson is None:
+            self.stdout.write(self.style.WARNING("orjson is not installed; both renderers use the stdlib."))
+        tenders = list(
+            Tender.objects.select_related("release", "procuring_entity")
+            .prefetch_related("documents")
+            .order_by("id")[:100]
+        )
+        context = {"scoring": ScoringContext(get_cached_default_profile(), stored_scores=True)}
+        for size in (20, 100):
+            results = ReleaseSerializer([t.release for t in tenders[:size]], many=True, context=context).data
+            page = {"next": None, "previous": None, "results": results}
+            self.stdout.write(f"page of {len(results)} ({len(JSONRenderer().render(page)) / 1024:.1f} KiB)")
+            self._report("stdlib", self._time(lambda: JSONRenderer().render(page), options["repeat"]))
+            self._report("orjson", self._time(lambda: FastJSONRenderer().render(page), options["repeat"]))
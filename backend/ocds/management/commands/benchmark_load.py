@@ -0,0 +1,99 @@
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+from django.core.management.base import BaseCommand, CommandError
+
+# Request paths cycled through by each client (override with --path)
+DEFAULT_PATHS = [
+    "/api/tenders/?view=compact",
+    "/api/tenders/?view=compact&provinces=Gauteng",
+    "/api/tenders/?view=compact&search=water",
+    "/api/meta/categories/",
+]
+
+
+def percentile(samples, fraction):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class Command(BaseCommand):
+    help = (
+        "HTTP load test against a running server: requests/sec and latency "
+        "percentiles at a fixed concurrency. Run it once against the WSGI "
+        "deployment and once against the ASGI one (DJANGO_ASYNC_VIEWS=true) "
+        "with the same worker count to compare them."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://localhost:8000", help="Server base URL.")
+        parser.add_argument("--path", action="append", dest="paths", help="Request path (repeatable).")
+        parser.add_argument("--concurrency", type=int, default=32, help="Concurrent clients (default: 32).")
+        parser.add_argument("--requests", type=int, default=1000, help="Total requests (default: 1000).")
+        parser.add_argument(
+            "--bust-cache",
+            action="store_true",
+            help="Add a unique query parameter to every request so the response cache never hits.",
+        )
+        parser.add_argument("--token", help="Send `Authorization: Token <token>` (per-profile scoring).")
+
+    def handle(self, *args, **options):
+        base_url = options["url"].rstrip("/")
+        paths = options["paths"] or DEFAULT_PATHS
+        total = options["requests"]
+        headers = {"Authorization": f"Token {options['token']}"} if options["token"] else {}
+
+        local = threading.local()
+        counter = iter(range(total))
+        lock = threading.Lock()
+
+        def fetch(n):
+            session = getattr(local, "session", None)
+            if session is None:
+                session = local.session = requests.Session()
+            url = base_url + paths[n % len(paths)]
+            if options["bust_cache"]:
+                url += ("&" if "?" in url else "?") + f"_={n}"
+            start = time.perf_counter()
+            try:
+                status = session.get(url, headers=headers, timeout=60).status_code
+            except requests.RequestException:
+                status = None
+            return status, (time.perf_counter() - start) * 1000
+
+        def client():
+            results = []
+            while True:
+                with lock:
+                    n = next(counter, None)
+                if n is None:
+                    return results
+                results.append(fetch(n))
+
+        try:
+            requests.get(base_url + paths[0], headers=headers, timeout=60)  # warm-up
+        except requests.RequestException as exc:
+            raise CommandError(f"Server not reachable at {base_url}: {exc}")
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as pool:
+            futures = [pool.submit(client) for _ in range(options["concurrency"])]
+            results = [result for future in futures for result in future.result()]
+        elapsed = time.perf_counter() - start
+
+        latencies = [latency for status, latency in results if status == 200]
+        errors = len(results) - len(latencies)
+        self.stdout.write(f"{len(results)} requests, concurrency {options['concurrency']}, {elapsed:.2f} s")
+        self.stdout.write(f"  throughput {len(results) / elapsed:8.1f} req/s")
+        if latencies:
+            self.stdout.write(
+                f"  latency    p50 {percentile(latencies, 0.50):8.2f} ms   "
+                f"p95 {percentile(latencies, 0.95):8.2f} ms   "
+                f"p99 {percentile(latencies, 0.99):8.2f} ms   "
+                f"mean {statistics.mean(latencies):8.2f} ms"
+            )
+        if errors:
+            self.stdout.write(self.style.WARNING(f"  {errors} requests failed or returned non-200"))
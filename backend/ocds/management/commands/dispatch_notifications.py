@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from ocds.notifications import dispatch_notifications, flush_digests, queue_tender_notifications
+
+
+class Command(BaseCommand):
+    help = (
+        "Queue alerts for tenders changed since the last run, roll closed "
+        "digest windows up, then send due notifications from the outbox. With --loop, keep doing so every "
+        "--interval seconds."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=200, help="Rows claimed per batch (default: 200).")
+        parser.add_argument("--workers", type=int, default=8, help="Concurrent sends (default: 8).")
+        parser.add_argument("--loop", action="store_true", help="Run until stopped.")
+        parser.add_argument("--interval", type=int, default=60, help="Seconds between loop passes (default: 60).")
+        parser.add_argument("--skip-matching", action="store_true", help="Only drain the outbox.")
+
+    def handle(self, *args, **options):
+        while True:
+            if not options["skip_matching"]:
+                queued = queue_tender_notifications()
+                if queued:
+                    self.stdout.write(f"Queued {queued} notifications.")
+            digests = flush_digests()
+            if digests:
+                self.stdout.write(f"Queued {digests} digests.")
+            counts = dispatch_notifications(batch_size=options["batch_size"], workers=options["workers"])
+            if any(counts.values()) or not options["loop"]:
+                self.stdout.write(
+                    self.style.SUCCESS(
+                        f"Sent {counts['sent']}, retrying {counts['retried']}, failed {counts['failed']}."
+                    )
+                )
+            if not options["loop"]:
+                return
+            time.sleep(options["interval"])
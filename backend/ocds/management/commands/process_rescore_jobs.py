@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ocds.services import run_queued_rescore_jobs
+
+
+class Command(BaseCommand):
+    help = "Run queued supplier rescoring jobs (e.g. ones left behind by a restart)."
+
+    def handle(self, *args, **options):
+        processed = run_queued_rescore_jobs()
+        self.stdout.write(self.style.SUCCESS(f"Processed {processed} rescoring jobs."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from ocds.rollups import rebuild_ingestion_rollups
+
+
+class Command(BaseCommand):
+    help = "Add finished ingestion runs that are missing from the dashboard rollups (e.g. after upgrading)."
+
+    def handle(self, *args, **options):
+        added = rebuild_ingestion_rollups()
+        self.stdout.write(self.style.SUCCESS(f"Added {added} ingestion runs to the rollups."))
@@ -0,0 +1,31 @@
+from django.core.management.base import BaseCommand
+
+from ocds.services import rescore_default_profile_static_scores, sweep_recency_scores
+
+
+class Command(BaseCommand):
+    help = "Refresh stored recency bonuses for tenders that crossed a bucket boundary since the last sweep."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--full",
+            action="store_true",
+            help="Re-check every tender instead of only those near a bucket boundary.",
+        )
+        parser.add_argument(
+            "--rescore-static",
+            action="store_true",
+            help="Also recompute the stored static match_score for the default profile.",
+        )
+
+    def handle(self, *args, **options):
+        if options["rescore_static"]:
+            rescored = rescore_default_profile_static_scores()
+            self.stdout.write(self.style.NOTICE(f"Recomputed static match scores for {rescored} tenders."))
+
+        sweep = sweep_recency_scores(full=options["full"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recency sweep {sweep.id} at {sweep.ran_at.isoformat()}: {sweep.tenders_updated} tenders updated."
+            )
+        )
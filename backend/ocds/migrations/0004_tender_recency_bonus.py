@@ -0,0 +1,27 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:00
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0003_supplierprofile_is_paused'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScoreSweep',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('ran_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('tenders_updated', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='tender',
+            name='recency_bonus',
+            field=models.SmallIntegerField(default=0),
+        ),
+    ]
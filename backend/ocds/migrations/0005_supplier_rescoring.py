@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:02
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0004_tender_recency_bonus'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RescoreJob',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(choices=[('queued', 'Queued'), ('running', 'Running'), ('done', 'Done'), ('cancelled', 'Cancelled'), ('failed', 'Failed')], db_index=True, default='queued', max_length=16)),
+                ('requested_at', models.DateTimeField(auto_now_add=True)),
+                ('started_at', models.DateTimeField(blank=True, null=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+                ('tenders_scored', models.PositiveIntegerField(default=0)),
+                ('details', models.TextField(blank=True)),
+                ('supplier', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='rescore_jobs', to='ocds.supplierprofile')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='SupplierTenderScore',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('score', models.SmallIntegerField()),
+                ('computed_at', models.DateTimeField(auto_now=True)),
+                ('supplier', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='tender_scores', to='ocds.supplierprofile')),
+                ('tender', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='supplier_scores', to='ocds.tender')),
+            ],
+            options={
+                'unique_together': {('supplier', 'tender')},
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:03
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+BACKFILL_SEARCH_VECTOR = """
+UPDATE ocds_tender AS t
+SET search_vector =
+    setweight(to_tsvector('english', coalesce(t.title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(t.description, '')), 'B')
+    || setweight(to_tsvector('english', coalesce(
+        (SELECT pe.name FROM ocds_procuringentity AS pe WHERE pe.id = t.procuring_entity_id), ''
+    )), 'C')
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0005_supplier_rescoring'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name='tender',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        migrations.RunSQL(BACKFILL_SEARCH_VECTOR, reverse_sql=migrations.RunSQL.noop),
+        migrations.AddIndex(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='tender_search_vector_gin'),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['title'], name='tender_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:16
+
+from django.db import migrations, models
+
+
+BACKFILL_TENDER_DIMENSIONS = """
+WITH counted AS (
+    SELECT
+        t.category,
+        t.province,
+        pe.name AS buyer,
+        (t.status = 'active' AND (t.tender_end_date IS NULL OR t.tender_end_date >= now())) AS is_active
+    FROM ocds_tender AS t
+    LEFT JOIN ocds_procuringentity AS pe ON pe.id = t.procuring_entity_id
+)
+INSERT INTO ocds_tenderdimension (kind, value, tender_count, active_count)
+SELECT 'category', category, COUNT(*), COUNT(*) FILTER (WHERE is_active)
+FROM counted WHERE category <> '' GROUP BY category
+UNION ALL
+SELECT 'province', province, COUNT(*), COUNT(*) FILTER (WHERE is_active)
+FROM counted WHERE province <> '' GROUP BY province
+UNION ALL
+SELECT 'buyer', buyer, COUNT(*), COUNT(*) FILTER (WHERE is_active)
+FROM counted WHERE buyer <> '' GROUP BY buyer
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0007_data_version'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenderDimension',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('category', 'Category'), ('province', 'Province'), ('buyer', 'Buyer')], max_length=16)),
+                ('value', models.CharField(max_length=512)),
+                ('tender_count', models.PositiveIntegerField(default=0)),
+                ('active_count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'unique_together': {('kind', 'value')},
+            },
+        ),
+        migrations.RunSQL(BACKFILL_TENDER_DIMENSIONS, reverse_sql=migrations.RunSQL.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:18
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Build the indexes without locking the tender table against writes
+    atomic = False
+
+    dependencies = [
+        ('ocds', '0008_tender_dimension'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(models.OrderBy(django.db.models.functions.comparison.Least(django.db.models.expressions.CombinedExpression(django.db.models.functions.comparison.Coalesce(models.F('match_score'), models.Value(0)), '+', models.F('recency_bonus')), models.Value(100)), descending=True), models.OrderBy(models.F('tender_end_date'), nulls_last=True), models.OrderBy(models.F('id')), condition=models.Q(('status', 'active')), name='tender_active_feed_order'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['province', 'value_amount'], name='tender_active_province_value'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(condition=models.Q(('status', 'active')), fields=['tender_end_date'], name='tender_active_end_date'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(fields=['category', 'status'], name='tender_category_status'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['cpv_codes'], name='tender_cpv_codes_gin'),
+        ),
+    ]
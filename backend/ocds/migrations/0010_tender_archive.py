@@ -0,0 +1,48 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:20
+
+import django.db.models.expressions
+import django.db.models.functions.comparison
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Rebuild the feed indexes on the hot set without blocking writes
+    atomic = False
+
+    dependencies = [
+        ('ocds', '0009_feed_indexes'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_active_feed_order',
+        ),
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_active_province_value',
+        ),
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_active_end_date',
+        ),
+        migrations.AddField(
+            model_name='tender',
+            name='archived',
+            field=models.BooleanField(default=False),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(models.OrderBy(django.db.models.functions.comparison.Least(django.db.models.expressions.CombinedExpression(django.db.models.functions.comparison.Coalesce(models.F('match_score'), models.Value(0)), '+', models.F('recency_bonus')), models.Value(100)), descending=True), models.OrderBy(models.F('tender_end_date'), nulls_last=True), models.OrderBy(models.F('id')), condition=models.Q(('archived', False), ('status', 'active')), name='tender_active_feed_order'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(condition=models.Q(('archived', False), ('status', 'active')), fields=['province', 'value_amount'], name='tender_active_province_value'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(condition=models.Q(('archived', False), ('status', 'active')), fields=['tender_end_date'], name='tender_active_end_date'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:23
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0010_tender_archive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TenderDetailSnapshot',
+            fields=[
+                ('tender', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='detail_snapshot', serialize=False, to='ocds.tender')),
+                ('payload', models.JSONField()),
+                ('tender_updated_at', models.DateTimeField()),
+                ('rendered_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:33
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('ocds', '0011_tender_detail_snapshot'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(fields=['updated_at', 'id'], name='tender_updated_at_id'),
+        ),
+    ]
@@ -0,0 +1,38 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:35
+
+import ocds.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0012_tender_updated_at_index'),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            "CREATE SEQUENCE IF NOT EXISTS ocds_tender_change_seq",
+            "DROP SEQUENCE IF EXISTS ocds_tender_change_seq",
+        ),
+        migrations.CreateModel(
+            name='TenderTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('tender_id', models.CharField(max_length=128)),
+                ('change_seq', models.BigIntegerField(db_default=ocds.models.NextChangeSeq(), unique=True)),
+                ('deleted_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+        # nextval() is volatile, so existing rows each get their own value
+        # (this rewrites the tender table)
+        migrations.AddField(
+            model_name='tender',
+            name='change_seq',
+            field=models.BigIntegerField(db_default=ocds.models.NextChangeSeq()),
+        ),
+        migrations.AddIndex(
+            model_name='tender',
+            index=models.Index(fields=['change_seq'], name='tender_change_seq'),
+        ),
+    ]
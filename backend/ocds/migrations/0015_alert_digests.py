@@ -0,0 +1,52 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0014_notification_outbox'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='digest',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='digest_total',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='notificationoutbox',
+            name='digest_window',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='supplierprofile',
+            name='alert_frequency',
+            field=models.CharField(choices=[('immediate', 'Immediate'), ('hourly', 'Hourly digest'), ('daily', 'Daily digest')], default='immediate', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='notificationoutbox',
+            name='status',
+            field=models.CharField(choices=[('pending', 'Pending'), ('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed'), ('buffered', 'Buffered for digest'), ('digested', 'Sent in a digest')], default='pending', max_length=16),
+        ),
+        migrations.AlterField(
+            model_name='notificationoutbox',
+            name='tender',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='notifications', to='ocds.tender'),
+        ),
+        migrations.AddIndex(
+            model_name='notificationoutbox',
+            index=models.Index(condition=models.Q(('status', 'buffered')), fields=['supplier', 'channel'], name='notification_outbox_buffered'),
+        ),
+        migrations.AddConstraint(
+            model_name='notificationoutbox',
+            constraint=models.UniqueConstraint(condition=models.Q(('digest_window__isnull', False)), fields=('supplier', 'channel', 'digest_window'), name='notification_outbox_digest_window'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:46
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0015_alert_digests'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='rolled_up',
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name='ingestionrun',
+            name='tenders_added',
+            field=models.JSONField(blank=True, default=dict),
+        ),
+        migrations.CreateModel(
+            name='IngestionRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hourly'), ('day', 'Daily')], max_length=8)),
+                ('bucket', models.DateTimeField()),
+                ('source', models.CharField(choices=[('api', 'OCDSReleases API'), ('bulk', 'Bulk file import')], max_length=16)),
+                ('runs', models.PositiveIntegerField(default=0)),
+                ('failed_runs', models.PositiveIntegerField(default=0)),
+                ('items_ingested', models.PositiveIntegerField(default=0)),
+                ('items_failed', models.PositiveIntegerField(default=0)),
+                ('errors', models.PositiveIntegerField(default=0)),
+                ('duration_seconds', models.FloatField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('granularity', 'bucket', 'source'), name='ingestion_rollup_bucket')],
+            },
+        ),
+        migrations.CreateModel(
+            name='TenderRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('granularity', models.CharField(choices=[('hour', 'Hourly'), ('day', 'Daily')], max_length=8)),
+                ('bucket', models.DateTimeField()),
+                ('province', models.CharField(blank=True, max_length=128)),
+                ('tenders_added', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('granularity', 'bucket', 'province'), name='tender_rollup_bucket')],
+            },
+        ),
+    ]
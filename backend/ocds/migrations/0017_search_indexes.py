@@ -0,0 +1,42 @@
+# Generated by Django 6.0.2 on 2026-10-18 23:49
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('ocds', '0016_ingestion_rollups'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='supplierprofile',
+            index=models.Index(fields=['company_name', 'id'], name='supplier_company_name_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='supplierprofile',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('company_name'), name='gin_trgm_ops'), name='supplier_company_name_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='supplierprofile',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('email'), name='gin_trgm_ops'), name='supplier_email_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='supplierprofile',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('province'), name='gin_trgm_ops'), name='supplier_province_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('title'), name='gin_trgm_ops'), name='tender_title_upper_trgm'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description'), name='gin_trgm_ops'), name='tender_description_trgm'),
+        ),
+    ]
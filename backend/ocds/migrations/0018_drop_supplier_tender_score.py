@@ -0,0 +1,16 @@
+# Generated by Django 6.0.2 on 2026-10-19 00:12
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('ocds', '0017_search_indexes'),
+    ]
+
+    operations = [
+        migrations.DeleteModel(
+            name='SupplierTenderScore',
+        ),
+    ]
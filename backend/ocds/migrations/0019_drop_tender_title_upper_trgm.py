@@ -0,0 +1,20 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:10
+
+from django.contrib.postgres.operations import RemoveIndexConcurrently
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    atomic = False
+
+    dependencies = [
+        ('ocds', '0018_drop_supplier_tender_score'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_title_upper_trgm',
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-19 01:21
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    # Rebuild the search and category indexes on the hot set without blocking writes
+    atomic = False
+
+    dependencies = [
+        ('ocds', '0019_drop_tender_title_upper_trgm'),
+    ]
+
+    operations = [
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_search_vector_gin',
+        ),
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_title_trgm',
+        ),
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_category_status',
+        ),
+        RemoveIndexConcurrently(
+            model_name='tender',
+            name='tender_cpv_codes_gin',
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('archived', False)), fields=['search_vector'], name='tender_search_vector_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('archived', False)), fields=['title'], name='tender_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('archived', True)), fields=['search_vector'], name='tender_archive_search_gin'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('archived', True)), fields=['title'], name='tender_archive_title_trgm', opclasses=['gin_trgm_ops']),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=models.Index(condition=models.Q(('archived', False)), fields=['category', 'status'], name='tender_category_status'),
+        ),
+        AddIndexConcurrently(
+            model_name='tender',
+            index=django.contrib.postgres.indexes.GinIndex(condition=models.Q(('archived', False)), fields=['cpv_codes'], name='tender_cpv_codes_gin'),
+        ),
+    ]
@@ -1,5 +1,9 @@
 from django.conf import settings
-from django.db import models
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
+from django.db import connection, models
+from django.db.models import F, Q, Value
+from django.db.models.functions import Coalesce, Least, Upper
 from django.utils import timezone
 
 
@@ -39,6 +43,57 @@ class Release(models.Model):
         return self.release_id
 
 
+class NextChangeSeq(models.Func):
+    """`nextval()` of the tender change sequence (see `Tender.change_seq`)."""
+
+    template = "nextval('ocds_tender_change_seq')"
+    output_field = models.BigIntegerField()
+
+
+# `nextval()` hands out change_seq values in statement order, but they
+# become visible in commit order. Writers hold this advisory lock (shared)
+# from taking a value until they commit; readers take it exclusively for a
+# moment to find the highest value with no writer still in flight.
+CHANGE_SEQ_LOCK = "ocds_tender_change_seq"
+
+
+def lock_change_seq_for_write() -> None:
+    """
+    Call inside `transaction.atomic()` before taking a change_seq value; the
+    lock is released when the transaction ends. No-op off PostgreSQL.
+    """
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT pg_advisory_xact_lock_shared(hashtext(%s))", [CHANGE_SEQ_LOCK])
+
+
+def change_seq_high_water():
+    """
+    The highest change_seq at or below which every change is committed:
+    read the feed up to here and nothing can appear behind a reader's
+    position later. None off PostgreSQL (read everything).
+    """
+    if connection.vendor != "postgresql":
+        return None
+    with connection.cursor() as cursor:
+        # Session-level, so it is released straight away even inside a transaction
+        cursor.execute("SELECT pg_advisory_lock(hashtext(%s))", [CHANGE_SEQ_LOCK])
+        try:
+            cursor.execute(
+                "SELECT CASE WHEN is_called THEN last_value ELSE last_value - 1 END FROM ocds_tender_change_seq"
+            )
+            return cursor.fetchone()[0]
+        finally:
+            cursor.execute("SELECT pg_advisory_unlock(hashtext(%s))", [CHANGE_SEQ_LOCK])
+
+
+class TenderQuerySet(models.QuerySet):
+    def hot(self):
+        """Tenders not yet archived; what the feed and detail views serve by default."""
+        return self.filter(archived=False)
+
+
 class Tender(models.Model):
     """
     Normalised subset of OCDS tender data optimised for the supplier feed.
@@ -83,12 +138,82 @@ class Tender(models.Model):
     cpv_codes = models.JSONField(default=list, blank=True)
     submission_methods = models.JSONField(default=list, blank=True)
 
-    # Pre-computed match score for the "current" default profile (optional)
+    # Pre-computed static match score (CPV, keyword, location, value, buyer)
+    # for the "current" default profile (optional). The time-dependent recency
+    # bonus is not included; see `recency_bonus` and `ocds.scoring`.
     match_score = models.IntegerField(null=True, blank=True)
+    # Recency bucket bonus as of the last ingest/sweep, kept by
+    # `sweep_recency_scores`. The default-profile feed orders by
+    # match_score + recency_bonus (see the `tender_active_feed_order` index).
+    recency_bonus = models.SmallIntegerField(default=0)
+
+    # Weighted full-text document (title A, description B, buyer name C),
+    # maintained by the ingestion upsert; see `ocds.filters`.
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
+    # Closed long enough ago to drop out of the hot set; set by
+    # `archive_closed_tenders` and cleared when a release re-ingests the tender.
+    archived = models.BooleanField(default=False)
+
+    # Position in the delta-sync change feed (/api/tenders/changes/): a new
+    # value from `ocds_tender_change_seq` on insert and whenever ingestion
+    # rewrites the tender. Deletions get a `TenderTombstone` from the same
+    # sequence.
+    change_seq = models.BigIntegerField(db_default=NextChangeSeq())
 
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = TenderQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # Feed search, on the hot set. Searches that include the archive
+            # (?history=1, the Django admin) split their conditions by side
+            # (`ocds.filters.split_by_archive`) to use the archive indexes.
+            GinIndex(fields=["search_vector"], name="tender_search_vector_gin", condition=Q(archived=False)),
+            GinIndex(
+                fields=["title"], opclasses=["gin_trgm_ops"], name="tender_title_trgm", condition=Q(archived=False)
+            ),
+            GinIndex(fields=["search_vector"], name="tender_archive_search_gin", condition=Q(archived=True)),
+            GinIndex(
+                fields=["title"],
+                opclasses=["gin_trgm_ops"],
+                name="tender_archive_title_trgm",
+                condition=Q(archived=True),
+            ),
+            # Substring search in the Django admin: titles go through the
+            # title trigram indexes (ILIKE); icontains compares UPPER(column),
+            # so the description index is on that expression
+            GinIndex(OpClass(Upper("description"), name="gin_trgm_ops"), name="tender_description_trgm"),
+            # Feed indexes. The feed defaults to status=active on the hot set,
+            # so these (like the filter indexes below) are partial and stay
+            # small as history accumulates.
+            models.Index(
+                Least(Coalesce(F("match_score"), Value(0)) + F("recency_bonus"), Value(100)).desc(),
+                F("tender_end_date").asc(nulls_last=True),
+                F("id").asc(),
+                name="tender_active_feed_order",
+                condition=Q(status="active", archived=False),
+            ),
+            models.Index(
+                fields=["province", "value_amount"],
+                name="tender_active_province_value",
+                condition=Q(status="active", archived=False),
+            ),
+            models.Index(
+                fields=["tender_end_date"],
+                name="tender_active_end_date",
+                condition=Q(status="active", archived=False),
+            ),
+            models.Index(fields=["category", "status"], name="tender_category_status", condition=Q(archived=False)),
+            # jsonb_ops (not jsonb_path_ops): the categories filter uses ?|
+            GinIndex(fields=["cpv_codes"], name="tender_cpv_codes_gin", condition=Q(archived=False)),
+            # Change position read by the tender event stream (ocds.events)
+            models.Index(fields=["updated_at", "id"], name="tender_updated_at_id"),
+            models.Index(fields=["change_seq"], name="tender_change_seq"),
+        ]
+
     def __str__(self) -> str:  
         return f"{self.tender_id} - {self.title[:50]}"
 
@@ -145,6 +270,12 @@ class SupplierProfile(models.Model):
     email_notifications = models.BooleanField(default=True)
     sms_notifications = models.BooleanField(default=False)
     whatsapp_notifications = models.BooleanField(default=False)
+    ALERT_FREQUENCY_CHOICES = [
+        ("immediate", "Immediate"),
+        ("hourly", "Hourly digest"),
+        ("daily", "Daily digest"),
+    ]
+    alert_frequency = models.CharField(max_length=16, choices=ALERT_FREQUENCY_CHOICES, default="immediate")
 
     # Admin controls
     is_paused = models.BooleanField(default=False)
@@ -152,6 +283,16 @@ class SupplierProfile(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            # Admin directory order (SupplierDirectoryPagination)
+            models.Index(fields=["company_name", "id"], name="supplier_company_name_id"),
+            # Admin substring search; icontains compares UPPER(column)
+            GinIndex(OpClass(Upper("company_name"), name="gin_trgm_ops"), name="supplier_company_name_trgm"),
+            GinIndex(OpClass(Upper("email"), name="gin_trgm_ops"), name="supplier_email_trgm"),
+            GinIndex(OpClass(Upper("province"), name="gin_trgm_ops"), name="supplier_province_trgm"),
+        ]
+
     def __str__(self) -> str:  # pragma: no cover - trivial
         return self.company_name
 
@@ -171,6 +312,31 @@ class SavedTender(models.Model):
         unique_together = ("supplier", "tender")
 
 
+class RescoreJob(models.Model):
+    """
+    Background job recomputing the stored `Tender.match_score` after the
+    default profile's scoring preferences change (other profiles are scored
+    in SQL at query time). A newer job supersedes older ones.
+    """
+
+    STATUS_CHOICES = [
+        ("queued", "Queued"),
+        ("running", "Running"),
+        ("done", "Done"),
+        ("cancelled", "Cancelled"),
+        ("failed", "Failed"),
+    ]
+    PENDING_STATUSES = ("queued", "running")
+
+    supplier = models.ForeignKey(SupplierProfile, related_name="rescore_jobs", on_delete=models.CASCADE)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="queued", db_index=True)
+    requested_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    tenders_scored = models.PositiveIntegerField(default=0)
+    details = models.TextField(blank=True)
+
+
 class IngestionRun(models.Model):
     """
     Tracks ingestion executions (manual or scheduled) for the admin dashboard.
@@ -188,6 +354,10 @@ class IngestionRun(models.Model):
     items_failed = models.PositiveIntegerField(default=0)
     success = models.BooleanField(default=False)
     details = models.TextField(blank=True)
+    # New tenders per province, counted while the run upserts releases
+    tenders_added = models.JSONField(default=dict, blank=True)
+    # Set once the run has been added to the dashboard rollups
+    rolled_up = models.BooleanField(default=False)
 
 
 class IngestionError(models.Model):
@@ -207,3 +377,216 @@ class IngestionError(models.Model):
     message = models.TextField()
     payload_snippet = models.TextField(blank=True)
 
+
+
+class IngestionRollup(models.Model):
+    """
+    Finished ingestion runs per source, summed per hour or day. Each run is
+    added once when it finishes, so trend charts read a handful of rows
+    instead of scanning runs and errors.
+    """
+
+    GRANULARITY_CHOICES = [
+        ("hour", "Hourly"),
+        ("day", "Daily"),
+    ]
+
+    granularity = models.CharField(max_length=8, choices=GRANULARITY_CHOICES)
+    bucket = models.DateTimeField()
+    source = models.CharField(max_length=16, choices=IngestionRun.SOURCE_CHOICES)
+    runs = models.PositiveIntegerField(default=0)
+    failed_runs = models.PositiveIntegerField(default=0)
+    items_ingested = models.PositiveIntegerField(default=0)
+    items_failed = models.PositiveIntegerField(default=0)
+    errors = models.PositiveIntegerField(default=0)
+    duration_seconds = models.FloatField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["granularity", "bucket", "source"], name="ingestion_rollup_bucket"),
+        ]
+
+
+class TenderRollup(models.Model):
+    """New tenders per province, summed per hour or day (see IngestionRollup)."""
+
+    granularity = models.CharField(max_length=8, choices=IngestionRollup.GRANULARITY_CHOICES)
+    bucket = models.DateTimeField()
+    province = models.CharField(max_length=128, blank=True)
+    tenders_added = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["granularity", "bucket", "province"], name="tender_rollup_bucket"),
+        ]
+
+
+class ScoreSweep(models.Model):
+    """
+    Tracks recency sweeps so each run only revisits tenders that crossed a
+    bucket boundary since the previous one.
+    """
+
+    ran_at = models.DateTimeField(default=timezone.now, db_index=True)
+    tenders_updated = models.PositiveIntegerField(default=0)
+
+
+class DataVersion(models.Model):
+    """
+    Monotonic counter bumped whenever feed-visible data changes (an ingestion
+    run finishing, a recency sweep, a default-profile rescore). Read
+    endpoints derive their ETags and cache keys from it.
+    """
+
+    name = models.CharField(max_length=32, primary_key=True)
+    version = models.PositiveBigIntegerField(default=0)
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f"{self.name} v{self.version}"
+
+
+class TenderDimension(models.Model):
+    """
+    Distinct category / province / buyer values with tender counts, kept up
+    to date by the ingestion upsert and the recency sweep so the meta
+    endpoints never scan the tender table.
+    """
+
+    KIND_CHOICES = [
+        ("category", "Category"),
+        ("province", "Province"),
+        ("buyer", "Buyer"),
+    ]
+
+    kind = models.CharField(max_length=16, choices=KIND_CHOICES)
+    value = models.CharField(max_length=512)
+    tender_count = models.PositiveIntegerField(default=0)
+    active_count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        unique_together = ("kind", "value")
+
+    def __str__(self):
+        return f"{self.kind}: {self.value}"
+
+
+class TenderDetailSnapshot(models.Model):
+    """
+    Pre-rendered, non-personalised detail JSON (`TenderSerializer` output
+    without `matchScore`) for one tender. Written at ingest and re-rendered
+    lazily whenever the tender's `updated_at` has moved on.
+    """
+
+    tender = models.OneToOneField(
+        Tender, related_name="detail_snapshot", on_delete=models.CASCADE, primary_key=True
+    )
+    payload = models.JSONField()
+    tender_updated_at = models.DateTimeField()
+    rendered_at = models.DateTimeField(auto_now=True)
+
+
+class TenderTombstone(models.Model):
+    """
+    A deleted tender, kept so delta-sync clients (/api/tenders/changes/)
+    learn to drop it. Shares `Tender.change_seq`'s sequence.
+    """
+
+    tender_id = models.CharField(max_length=128)
+    change_seq = models.BigIntegerField(db_default=NextChangeSeq(), unique=True)
+    deleted_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self) -> str:
+        return f"{self.tender_id} (deleted)"
+
+
+class ChangeFeedConsumer(models.Model):
+    """
+    How far a background consumer (e.g. notification matching) has read the
+    tender change feed: the last `Tender.change_seq` it processed.
+    """
+
+    name = models.CharField(max_length=32, primary_key=True)
+    position = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} @ {self.position}"
+
+
+class NotificationOutbox(models.Model):
+    """
+    One alert waiting to go out: a matching tender for a supplier on one
+    channel. Rows are queued after ingestion and drained by the
+    `dispatch_notifications` command; (supplier, tender, channel) is unique,
+    so a re-ingested tender never notifies twice.
+
+    Matches for suppliers on an hourly or daily digest are held as
+    "buffered" rows until their window closes, then rolled up into one
+    digest row per channel (no tender, `digest` holding the top matches)
+    and marked "digested".
+    """
+
+    CHANNEL_CHOICES = [
+        ("email", "Email"),
+        ("sms", "SMS"),
+        ("whatsapp", "WhatsApp"),
+    ]
+    STATUS_CHOICES = [
+        ("pending", "Pending"),
+        ("sending", "Sending"),
+        ("sent", "Sent"),
+        ("failed", "Failed"),
+        ("buffered", "Buffered for digest"),
+        ("digested", "Sent in a digest"),
+    ]
+
+    supplier = models.ForeignKey(SupplierProfile, related_name="notifications", on_delete=models.CASCADE)
+    tender = models.ForeignKey(
+        Tender,
+        related_name="notifications",
+        on_delete=models.CASCADE,
+        null=True,
+        blank=True,
+    )
+    channel = models.CharField(max_length=16, choices=CHANNEL_CHOICES)
+    # Best score in a digest
+    match_score = models.SmallIntegerField()
+    # Digest rows: end of the window they cover, its ranked [[tender pk, score], ...]
+    # (capped at NOTIFICATION_DIGEST_SIZE) and how many matches it had in total
+    digest_window = models.DateTimeField(null=True, blank=True)
+    digest = models.JSONField(default=list, blank=True)
+    digest_total = models.PositiveIntegerField(default=0)
+    status = models.CharField(max_length=16, choices=STATUS_CHOICES, default="pending")
+    attempts = models.PositiveSmallIntegerField(default=0)
+    # When a pending row may next be tried; for a claimed ("sending") row,
+    # when the claim expires and another dispatcher may retry it
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["supplier", "tender", "channel"],
+                name="notification_outbox_idempotency",
+            ),
+            models.UniqueConstraint(
+                fields=["supplier", "channel", "digest_window"],
+                name="notification_outbox_digest_window",
+                condition=Q(digest_window__isnull=False),
+            ),
+        ]
+        indexes = [
+            models.Index(
+                fields=["next_attempt_at"],
+                name="notification_outbox_due",
+                condition=Q(status__in=["pending", "sending"]),
+            ),
+            models.Index(
+                fields=["supplier", "channel"],
+                name="notification_outbox_buffered",
+                condition=Q(status="buffered"),
+            ),
+        ]
@@ -0,0 +1,468 @@
+"""
+Supplier alerts for newly matching tenders.
+
+Ingestion never sends anything itself. After a run, `queue_tender_notifications`
+reads the tender change feed from where it last stopped, scores the changed
+tenders for every supplier with alerts switched on and writes one
+`NotificationOutbox` row per (supplier, tender, channel) in the same
+transaction that advances its feed position. The `dispatch_notifications`
+command then drains the outbox in batches: a worker pool sends through the
+channel's backend under a per-channel rate limit, and failures are retried
+with exponential backoff.
+
+Suppliers on an hourly or daily digest (`SupplierProfile.alert_frequency`)
+get their matches buffered instead; `flush_digests` rolls each closed
+window up into a single message per channel listing the best
+`NOTIFICATION_DIGEST_SIZE` matches.
+
+Backends are configured per channel in `settings.NOTIFICATION_BACKENDS`
+(dotted paths); `ConsoleBackend` and `FileBackend` are stand-ins for local
+development and testing.
+"""
+import json
+import logging
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.module_loading import import_string
+
+from .models import ChangeFeedConsumer, NotificationOutbox, SupplierProfile, Tender, change_seq_high_water
+from .scoring import ScoringContext
+from .serializers import SCORING_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+# Channel -> SupplierProfile opt-in flag
+CHANNEL_FLAGS = {
+    "email": "email_notifications",
+    "sms": "sms_notifications",
+    "whatsapp": "whatsapp_notifications",
+}
+
+# Feed position of the matching step (ChangeFeedConsumer.name)
+OUTBOX_CONSUMER = "notifications"
+# Changed tenders scored per matching transaction
+MATCH_BATCH_SIZE = 1000
+# A claimed row not finished within this time is retried by another dispatcher
+CLAIM_TIMEOUT = timedelta(minutes=10)
+# Retry delays: RETRY_BASE_DELAY * 2^(attempts - 1), capped at RETRY_MAX_DELAY
+RETRY_BASE_DELAY = timedelta(minutes=1)
+RETRY_MAX_DELAY = timedelta(hours=6)
+# Attempts before a row is marked failed for good
+MAX_ATTEMPTS = 6
+
+
+class Message(NamedTuple):
+    channel: str
+    recipient: str
+    subject: str
+    body: str
+
+
+class BaseBackend:
+    """Sends one rendered message; raise to have the notification retried."""
+
+    def send(self, message: Message) -> None:
+        raise NotImplementedError
+
+
+class ConsoleBackend(BaseBackend):
+    """Writes messages to stdout."""
+
+    lock = threading.Lock()
+
+    def send(self, message: Message) -> None:
+        with self.lock:
+            sys.stdout.write(
+                f"[{message.channel}] to {message.recipient}: {message.subject}\n{message.body}\n\n"
+            )
+            sys.stdout.flush()
+
+
+class FileBackend(BaseBackend):
+    """Appends messages as JSON lines to `<NOTIFICATION_FILE_DIR>/<channel>.jsonl`."""
+
+    lock = threading.Lock()
+
+    def send(self, message: Message) -> None:
+        directory = Path(settings.NOTIFICATION_FILE_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        line = json.dumps({**message._asdict(), "sentAt": timezone.now().isoformat()})
+        with self.lock, open(directory / f"{message.channel}.jsonl", "a", encoding="utf-8") as fh:
+            fh.write(line + "\n")
+
+
+class EmailBackend(BaseBackend):
+    """Sends through Django's configured email backend (`EMAIL_*` settings)."""
+
+    def send(self, message: Message) -> None:
+        send_mail(message.subject, message.body, None, [message.recipient])
+
+
+_backends: Dict[str, BaseBackend] = {}
+
+
+def get_backend(channel: str) -> BaseBackend:
+    backend = _backends.get(channel)
+    if backend is None:
+        backend = _backends[channel] = import_string(settings.NOTIFICATION_BACKENDS[channel])()
+    return backend
+
+
+class RateLimiter:
+    """Token bucket shared by the dispatcher's worker threads."""
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.tokens = rate
+        self.updated = time.monotonic()
+        self.lock = threading.Lock()
+
+    def acquire(self) -> None:
+        while True:
+            with self.lock:
+                now = time.monotonic()
+                self.tokens = min(self.rate, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait = (1 - self.tokens) / self.rate
+            time.sleep(wait)
+
+
+_rate_limiters: Dict[str, RateLimiter] = {}
+_rate_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(channel: str) -> Optional[RateLimiter]:
+    rate = settings.NOTIFICATION_RATE_LIMITS.get(channel)
+    if not rate:
+        return None
+    with _rate_limiters_lock:
+        limiter = _rate_limiters.get(channel)
+        if limiter is None:
+            limiter = _rate_limiters[channel] = RateLimiter(rate)
+    return limiter
+
+
+def recipient_for(profile: SupplierProfile, channel: str) -> str:
+    return profile.email if channel == "email" else profile.phone
+
+
+def render_digest(notification: NotificationOutbox) -> Message:
+    matches = notification.digest_matches
+    total = notification.digest_total
+    noun = "match" if total == 1 else "matches"
+    if notification.channel != "email":
+        body = f"{total} new tender {noun}."
+        if matches:
+            tender, score = matches[0]
+            body += f" Top: {tender.title} ({score}%)"
+        subject = ""
+    else:
+        subject = f"{total} new tender {noun}"
+        lines = []
+        for tender, score in matches:
+            line = f"{score}%  {tender.title} ({tender.tender_id})"
+            if tender.tender_end_date:
+                line += f", closes {tender.tender_end_date:%Y-%m-%d}"
+            lines.append(line)
+        if total > len(matches):
+            lines.append(f"...and {total - len(matches)} more")
+        body = "\n".join(lines)
+    return Message(
+        channel=notification.channel,
+        recipient=recipient_for(notification.supplier, notification.channel),
+        subject=subject,
+        body=body,
+    )
+
+
+def render_notification(notification: NotificationOutbox) -> Message:
+    if notification.tender_id is None:
+        return render_digest(notification)
+    tender = notification.tender
+    subject = f"New tender match ({notification.match_score}%): {tender.title}"
+    lines = [tender.title, f"Reference: {tender.tender_id}"]
+    if tender.procuring_entity:
+        lines.append(f"Buyer: {tender.procuring_entity.name}")
+    if tender.value_amount is not None:
+        currency = f"{tender.value_currency} " if tender.value_currency else ""
+        lines.append(f"Value: {currency}{tender.value_amount:,.2f}")
+    if tender.tender_end_date:
+        lines.append(f"Closes: {tender.tender_end_date:%Y-%m-%d %H:%M}")
+    if notification.channel != "email":
+        # Keep SMS / WhatsApp short
+        subject = ""
+        lines = lines[:2]
+    return Message(
+        channel=notification.channel,
+        recipient=recipient_for(notification.supplier, notification.channel),
+        subject=subject,
+        body="\n".join(lines),
+    )
+
+
+def alert_recipients() -> List[Tuple[SupplierProfile, ScoringContext, List[str]]]:
+    """Suppliers with at least one alert channel on and an address for it."""
+    flags = Q()
+    for flag in CHANNEL_FLAGS.values():
+        flags |= Q(**{flag: True})
+    recipients = []
+    for profile in SupplierProfile.objects.filter(flags, user__isnull=False, is_paused=False):
+        channels = [
+            channel
+            for channel, flag in CHANNEL_FLAGS.items()
+            if getattr(profile, flag) and recipient_for(profile, channel)
+        ]
+        if channels:
+            recipients.append((profile, ScoringContext(profile), channels))
+    return recipients
+
+
+def queue_tender_notifications(min_score: Optional[int] = None) -> int:
+    """
+    The post-ingestion matching step: queue outbox rows for tenders changed
+    since the last call. Returns the number of matches (rows that already
+    existed are skipped, not queued again). On the first call
+    the position starts at the current head, so the existing backlog is not
+    announced.
+    """
+    if min_score is None:
+        min_score = settings.NOTIFICATION_MIN_SCORE
+    recipients = alert_recipients()
+    queued = 0
+    while True:
+        # Changes up to here are committed; later ones may still be in flight
+        high_water = change_seq_high_water()
+        with transaction.atomic():
+            consumer, created = ChangeFeedConsumer.objects.select_for_update().get_or_create(
+                name=OUTBOX_CONSUMER
+            )
+            if created:
+                head = high_water
+                if head is None:
+                    head = Tender.objects.order_by("-change_seq").values_list("change_seq", flat=True).first()
+                consumer.position = head or 0
+                consumer.save(update_fields=["position", "updated_at"])
+                return queued
+
+            window = Q(change_seq__gt=consumer.position)
+            if high_water is not None:
+                window &= Q(change_seq__lte=high_water)
+            tenders = list(
+                Tender.objects.filter(window)
+                .select_related("procuring_entity")
+                .only("id", "change_seq", "status", "archived", "tender_end_date", *SCORING_COLUMNS)
+                .order_by("change_seq")[:MATCH_BATCH_SIZE]
+            )
+            if not tenders:
+                return queued
+
+            now = timezone.now()
+            candidates = [
+                tender
+                for tender in tenders
+                if tender.status == "active"
+                and not tender.archived
+                and (tender.tender_end_date is None or tender.tender_end_date > now)
+            ]
+            rows = []
+            for profile, scoring, channels in recipients:
+                scoring.refresh(now)
+                status = "pending" if profile.alert_frequency == "immediate" else "buffered"
+                for tender in candidates:
+                    score = scoring.score(tender)
+                    if score >= min_score:
+                        rows.extend(
+                            NotificationOutbox(
+                                supplier=profile,
+                                tender=tender,
+                                channel=channel,
+                                match_score=score,
+                                status=status,
+                            )
+                            for channel in channels
+                        )
+            # Rows already queued for the same (supplier, tender, channel) are skipped
+            NotificationOutbox.objects.bulk_create(rows, batch_size=1000, ignore_conflicts=True)
+            queued += len(rows)
+
+            consumer.position = tenders[-1].change_seq
+            consumer.save(update_fields=["position", "updated_at"])
+        if len(tenders) < MATCH_BATCH_SIZE:
+            return queued
+
+
+def digest_window_end(frequency: str, now: datetime) -> datetime:
+    """End of the most recently closed digest window for `frequency`."""
+    now = timezone.localtime(now)
+    if frequency == "hourly":
+        return now.replace(minute=0, second=0, microsecond=0)
+    if frequency == "daily":
+        return now.replace(hour=0, minute=0, second=0, microsecond=0)
+    # Switched back to immediate alerts: flush whatever is still buffered
+    return now
+
+
+def flush_digests(now: Optional[datetime] = None) -> int:
+    """
+    Roll buffered matches from closed windows into one digest row per
+    supplier, channel and window: the best NOTIFICATION_DIGEST_SIZE matches
+    by score plus the total count. Matches that arrive after their window's
+    digest was queued are merged into it while it is still pending, and
+    otherwise wait for the supplier's next window. Returns the number of
+    digests queued or extended.
+    """
+    now = now or timezone.now()
+    size = settings.NOTIFICATION_DIGEST_SIZE
+    closed = Q(pk__in=[])
+    for frequency, _label in SupplierProfile.ALERT_FREQUENCY_CHOICES:
+        closed |= Q(supplier__alert_frequency=frequency, created_at__lt=digest_window_end(frequency, now))
+    buffers = (
+        NotificationOutbox.objects.filter(closed, status="buffered", supplier__is_paused=False)
+        .values_list("supplier_id", "channel", "supplier__alert_frequency")
+        .order_by()
+        .distinct()
+    )
+    queued = 0
+    for supplier_id, channel, frequency in buffers:
+        window_end = digest_window_end(frequency, now)
+        with transaction.atomic():
+            buffered = NotificationOutbox.objects.filter(
+                supplier_id=supplier_id,
+                channel=channel,
+                status="buffered",
+                created_at__lt=window_end,
+            )
+            top = [
+                list(match)
+                for match in buffered.select_for_update()
+                .order_by("-match_score", "created_at")
+                .values_list("tender_id", "match_score")[:size]
+            ]
+            if not top:
+                continue
+            existing = NotificationOutbox.objects.select_for_update().filter(
+                supplier_id=supplier_id, channel=channel, digest_window=window_end
+            )
+            digest = existing.first()
+            if digest is None:
+                try:
+                    with transaction.atomic():
+                        NotificationOutbox.objects.create(
+                            supplier_id=supplier_id,
+                            channel=channel,
+                            match_score=top[0][1],
+                            digest_window=window_end,
+                            digest=top,
+                            digest_total=buffered.count(),
+                        )
+                except IntegrityError:
+                    # Another flush queued this window's digest first
+                    digest = existing.get()
+            if digest is not None:
+                if digest.status != "pending":
+                    # Already on its way: these go out with the next window
+                    continue
+                digest.digest = sorted([*digest.digest, *top], key=lambda match: -match[1])[:size]
+                digest.digest_total += buffered.count()
+                digest.match_score = digest.digest[0][1]
+                digest.save(update_fields=["digest", "digest_total", "match_score"])
+            buffered.update(status="digested")
+        queued += 1
+    return queued
+
+
+def claim_notifications(limit: int) -> List[NotificationOutbox]:
+    """
+    Claim up to `limit` due rows for this dispatcher. Concurrent dispatchers
+    skip each other's locked rows; a claim that is never finished (a crashed
+    dispatcher) expires after CLAIM_TIMEOUT.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        batch = list(
+            NotificationOutbox.objects.filter(status__in=["pending", "sending"], next_attempt_at__lte=now)
+            .select_related("supplier", "tender__procuring_entity")
+            .order_by("next_attempt_at")
+            .select_for_update(skip_locked=True, of=("self",))[:limit]
+        )
+        NotificationOutbox.objects.filter(pk__in=[n.pk for n in batch]).update(
+            status="sending", next_attempt_at=now + CLAIM_TIMEOUT
+        )
+
+    # Load digest tenders here, so the send workers never touch the database
+    digests = [n for n in batch if n.tender_id is None]
+    tenders = Tender.objects.select_related("procuring_entity").in_bulk(
+        [pk for n in digests for pk, _score in n.digest]
+    )
+    for notification in digests:
+        notification.digest_matches = [
+            (tenders[pk], score) for pk, score in notification.digest if pk in tenders
+        ]
+    return batch
+
+
+def deliver(notification: NotificationOutbox) -> Optional[str]:
+    """Send one notification; returns the error message if it failed."""
+    try:
+        message = render_notification(notification)
+        limiter = get_rate_limiter(notification.channel)
+        if limiter is not None:
+            limiter.acquire()
+        get_backend(notification.channel).send(message)
+    except Exception as exc:
+        logger.warning("Sending notification %s failed: %s", notification.pk, exc)
+        return str(exc) or exc.__class__.__name__
+    return None
+
+
+def retry_delay(attempts: int) -> timedelta:
+    return min(RETRY_BASE_DELAY * 2 ** (attempts - 1), RETRY_MAX_DELAY)
+
+
+def dispatch_notifications(batch_size: int = 200, workers: int = 8) -> Dict[str, int]:
+    """
+    Drain due outbox rows in batches until none are left. Sends run on a
+    worker pool; outcomes are written back once per batch. Returns counts of
+    sent, retried and failed rows.
+    """
+    counts = {"sent": 0, "retried": 0, "failed": 0}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="notify") as pool:
+        while True:
+            batch = claim_notifications(batch_size)
+            if not batch:
+                return counts
+            errors = list(pool.map(deliver, batch))
+            now = timezone.now()
+            for notification, error in zip(batch, errors):
+                notification.attempts += 1
+                if error is None:
+                    notification.status = "sent"
+                    notification.sent_at = now
+                    notification.last_error = ""
+                    counts["sent"] += 1
+                elif notification.attempts >= MAX_ATTEMPTS:
+                    notification.status = "failed"
+                    notification.last_error = error
+                    counts["failed"] += 1
+                else:
+                    notification.status = "pending"
+                    notification.next_attempt_at = now + retry_delay(notification.attempts)
+                    notification.last_error = error
+                    counts["retried"] += 1
+            NotificationOutbox.objects.bulk_update(
+                batch, ["status", "attempts", "next_attempt_at", "last_error", "sent_at"]
+            )
@@ -0,0 +1,326 @@
+import base64
+import binascii
+import json
+from collections import OrderedDict
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import F, Q
+from django.utils.functional import cached_property
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+def _encode_value(value):
+    if isinstance(value, datetime):
+        return {"dt": value.isoformat()}
+    if isinstance(value, Decimal):
+        return {"dec": str(value)}
+    return value
+
+
+def _decode_value(value):
+    if isinstance(value, dict):
+        if "dt" in value:
+            return datetime.fromisoformat(value["dt"])
+        if "dec" in value:
+            return Decimal(value["dec"])
+    return value
+
+
+# Estimates below this are replaced by an exact COUNT(*), cheap at that size
+ESTIMATE_EXACT_BELOW = 1000
+
+
+def estimated_count(queryset):
+    """
+    `(count, is_estimate)` for a queryset. On PostgreSQL the count is the
+    planner's row estimate (EXPLAIN, from table statistics) instead of a
+    COUNT(*) that visits every matching row; small results are counted
+    exactly. Other databases always count.
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count(), False
+    sql, params = queryset.order_by().values("pk").query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute("EXPLAIN (FORMAT JSON) " + sql, params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    estimate = int(plan[0]["Plan"]["Plan Rows"])
+    if estimate < ESTIMATE_EXACT_BELOW:
+        return queryset.count(), False
+    return estimate, True
+
+
+class EstimatedCountPaginator(Paginator):
+    """Paginator for Django admin changelists of large tables (see `estimated_count`)."""
+
+    @cached_property
+    def count(self):
+        return estimated_count(self.object_list)[0]
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination over a composite sort key. Each page is a single
+    `WHERE (key) after (cursor) ORDER BY key LIMIT n+1` query, so the cost
+    of a page does not depend on how deep it is or on the table size.
+
+    `keyset` lists `(field, descending, nullable)` tuples, most significant
+    first, and must end with a unique field. NULLs sort last.
+
+    `?page=N` keeps the classic page-number mode working for existing
+    clients; it uses OFFSET/LIMIT with one extra row to detect a next page
+    and never runs COUNT(*). Pages beyond `max_page_number` are refused;
+    deep pages should be reached with cursors.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    max_page_number = 10_000
+    cursor_query_param = "cursor"
+    page_query_param = "page"
+    invalid_cursor_message = "Invalid cursor"
+    invalid_page_message = "Invalid page."
+    keyset = (("id", False, False),)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        return self.get_page_rows(list(self.get_page_queryset(queryset, request)))
+
+    async def apaginate_queryset(self, queryset, request, view=None):
+        """`paginate_queryset` for async views: the page is fetched with the async ORM."""
+        return self.get_page_rows([row async for row in self.get_page_queryset(queryset, request)])
+
+    def get_page_queryset(self, queryset, request):
+        """The single sliced query for the requested page (not evaluated)."""
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.next_url = None
+        self.previous_url = None
+
+        if self.page_query_param in request.query_params:
+            return self._page_number_queryset(queryset)
+        return self._cursor_queryset(queryset)
+
+    def get_page_rows(self, rows):
+        """Trim the fetched rows to the page and work out next/previous links."""
+        if self.page_number is not None:
+            return self._page_number_rows(rows)
+        return self._cursor_rows(rows)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("next", self.next_url),
+                    ("previous", self.previous_url),
+                    ("results", data),
+                ]
+            )
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    # Ordering -----------------------------------------------------------
+
+    def get_ordering(self, reverse=False):
+        ordering = []
+        for field, descending, nullable in self.keyset:
+            if reverse:
+                descending = not descending
+            # NULLs sort last going forward, so first when walking backwards
+            null_kwargs = {("nulls_first" if reverse else "nulls_last"): True} if nullable else {}
+            expression = F(field).desc(**null_kwargs) if descending else F(field).asc(**null_kwargs)
+            ordering.append(expression)
+        return ordering
+
+    def _after(self, field, descending, nullable, value, reverse):
+        """Rows strictly after `value` on one key, in the walking direction."""
+        if not reverse:
+            if value is None:
+                return None
+            condition = Q(**{f"{field}__lt" if descending else f"{field}__gt": value})
+            if nullable:
+                condition |= Q(**{f"{field}__isnull": True})
+            return condition
+        if value is None:
+            return Q(**{f"{field}__isnull": False})
+        return Q(**{f"{field}__gt" if descending else f"{field}__lt": value})
+
+    def _equal(self, field, value):
+        if value is None:
+            return Q(**{f"{field}__isnull": True})
+        return Q(**{field: value})
+
+    def get_keyset_filter(self, position, reverse=False):
+        condition = None
+        prefix = Q()
+        for (field, descending, nullable), value in zip(self.keyset, position):
+            after = self._after(field, descending, nullable, value, reverse)
+            if after is not None:
+                branch = prefix & after
+                condition = branch if condition is None else condition | branch
+            prefix &= self._equal(field, value)
+        return condition if condition is not None else Q(pk__in=[])
+
+    # Cursors ------------------------------------------------------------
+
+    def get_position(self, instance):
+        return [getattr(instance, field) for field, _descending, _nullable in self.keyset]
+
+    def encode_cursor(self, position, reverse):
+        payload = {"p": [_encode_value(value) for value in position]}
+        if reverse:
+            payload["r"] = 1
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        token = base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+        url = remove_query_param(self.base_url, self.page_query_param)
+        return replace_query_param(url, self.cursor_query_param, token)
+
+    def decode_cursor(self, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+        try:
+            raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4))
+            payload = json.loads(raw.decode("utf-8"))
+            position = [_decode_value(value) for value in payload["p"]]
+        except (TypeError, ValueError, KeyError, UnicodeDecodeError, binascii.Error, InvalidOperation):
+            raise NotFound(self.invalid_cursor_message)
+        if len(position) != len(self.keyset):
+            raise NotFound(self.invalid_cursor_message)
+        return position, bool(payload.get("r"))
+
+    def get_keyset_field(self, queryset, name):
+        """The model field or annotation output field a keyset entry sorts on."""
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        return queryset.model._meta.get_field(name)
+
+    def clean_position(self, queryset, position):
+        """
+        Coerce each decoded cursor value to its keyset field's type and run
+        the field's validators (which include the database integer range),
+        so a tampered cursor is a 404 rather than a database error.
+        """
+        cleaned = []
+        try:
+            for (name, _descending, nullable), value in zip(self.keyset, position):
+                if value is None:
+                    if not nullable:
+                        raise ValueError(f"{name} is not nullable")
+                    cleaned.append(None)
+                    continue
+                field = self.get_keyset_field(queryset, name)
+                value = field.to_python(value)
+                field.run_validators(value)
+                cleaned.append(value)
+        except (TypeError, ValueError, ValidationError, InvalidOperation):
+            raise NotFound(self.invalid_cursor_message)
+        return cleaned
+
+    # Modes --------------------------------------------------------------
+
+    def _cursor_queryset(self, queryset):
+        self.page_number = None
+        self.position, self.reverse = self.decode_cursor(self.request)
+        if self.position is not None:
+            self.position = self.clean_position(queryset, self.position)
+            queryset = queryset.filter(self.get_keyset_filter(self.position, self.reverse))
+        return queryset.order_by(*self.get_ordering(self.reverse))[: self.page_size + 1]
+
+    def _cursor_rows(self, rows):
+        position, reverse = self.position, self.reverse
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if reverse:
+            rows.reverse()
+        if not rows:
+            return rows
+
+        first, last = self.get_position(rows[0]), self.get_position(rows[-1])
+        if reverse:
+            self.next_url = self.encode_cursor(last, reverse=False)
+            if has_more:
+                self.previous_url = self.encode_cursor(first, reverse=True)
+        else:
+            if has_more:
+                self.next_url = self.encode_cursor(last, reverse=False)
+            if position is not None:
+                self.previous_url = self.encode_cursor(first, reverse=True)
+        return rows
+
+    def _page_number_queryset(self, queryset):
+        try:
+            self.page_number = int(self.request.query_params.get(self.page_query_param))
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_page_message)
+        if not 1 <= self.page_number <= self.max_page_number:
+            raise NotFound(self.invalid_page_message)
+
+        offset = (self.page_number - 1) * self.page_size
+        return queryset.order_by(*self.get_ordering())[offset : offset + self.page_size + 1]
+
+    def _page_number_rows(self, rows):
+        page_number = self.page_number
+        if not rows and page_number > 1:
+            raise NotFound(self.invalid_page_message)
+
+        url = remove_query_param(self.base_url, self.cursor_query_param)
+        if len(rows) > self.page_size:
+            self.next_url = replace_query_param(url, self.page_query_param, page_number + 1)
+        if page_number == 2:
+            self.previous_url = remove_query_param(url, self.page_query_param)
+        elif page_number > 2:
+            self.previous_url = replace_query_param(url, self.page_query_param, page_number - 1)
+        return rows[: self.page_size]
+
+
+class TenderFeedPagination(KeysetPagination):
+    """
+    Feed order: best match first, then soonest closing, then id as tie-breaker.
+    Expects the queryset to be annotated with `feed_score`.
+    """
+
+    keyset = (
+        ("feed_score", True, False),
+        ("tender_end_date", False, True),
+        ("id", False, False),
+    )
+
+
+class SupplierDirectoryPagination(KeysetPagination):
+    """Admin supplier directory, alphabetical."""
+
+    page_size = 50
+    keyset = (
+        ("company_name", False, False),
+        ("id", False, False),
+    )
+
+
+class SavedTenderPagination(KeysetPagination):
+    """Saved tenders, most recently saved first."""
+
+    page_size = 50
+    keyset = (
+        ("saved_at", True, False),
+        ("id", True, False),
+    )
@@ -0,0 +1,44 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speed-up
+    orjson = None
+
+
+_fallback_encoder = JSONEncoder()
+
+
+def _default(obj):
+    """
+    Types orjson doesn't handle natively (Decimal, lazy strings, querysets,
+    ...) get the same treatment as DRF's stdlib encoder.
+    """
+    return _fallback_encoder.default(obj)
+
+
+def dumps(data, indent=False) -> bytes:
+    """Serialise `data` to UTF-8 JSON bytes with orjson, or the stdlib if it's missing."""
+    if orjson is None:
+        return JSONRenderer().render(data, renderer_context={"indent": 2 if indent else None})
+    option = orjson.OPT_UTC_Z
+    if indent:
+        option |= orjson.OPT_INDENT_2
+    return orjson.dumps(data, default=_default, option=option)
+
+
+class FastJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson: datetime, date, time and UUID are encoded
+    natively and Decimal falls back to DRF's encoder. Behaves exactly like
+    `JSONRenderer` when orjson is not installed.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b""
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        return dumps(data, indent=bool(indent))
@@ -0,0 +1,85 @@
+"""
+Hourly and daily rollups of ingestion runs for the admin dashboard trends
+(`IngestionRollupView`). A run is added to its buckets once, when it
+finishes, so reading a range costs one indexed query per table however
+long the history is.
+"""
+from datetime import datetime
+from typing import Optional
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import IngestionError, IngestionRollup, IngestionRun, TenderRollup
+
+ROLLUP_GRANULARITIES = ("hour", "day")
+
+
+def rollup_bucket(granularity: str, moment: datetime) -> datetime:
+    """Start of the hour or day containing `moment`."""
+    moment = timezone.localtime(moment)
+    if granularity == "hour":
+        return moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _add(model, key: dict, increments: dict) -> None:
+    changes = {field: F(field) + value for field, value in increments.items()}
+    if model.objects.filter(**key).update(**changes):
+        return
+    _row, created = model.objects.get_or_create(**key, defaults=increments)
+    if not created:
+        model.objects.filter(**key).update(**changes)
+
+
+def record_ingestion_rollups(run_id: int) -> bool:
+    """
+    Add a finished run to the hourly and daily rollups. Returns False if it
+    was already added (or has not finished).
+    """
+    with transaction.atomic():
+        claimed = IngestionRun.objects.filter(pk=run_id, finished_at__isnull=False, rolled_up=False).update(
+            rolled_up=True
+        )
+        if not claimed:
+            return False
+        run = IngestionRun.objects.get(pk=run_id)
+        errors = IngestionError.objects.filter(run_id=run_id).count()
+        duration = max((run.finished_at - run.started_at).total_seconds(), 0)
+        for granularity in ROLLUP_GRANULARITIES:
+            bucket = rollup_bucket(granularity, run.finished_at)
+            _add(
+                IngestionRollup,
+                {"granularity": granularity, "bucket": bucket, "source": run.source},
+                {
+                    "runs": 1,
+                    "failed_runs": 0 if run.success else 1,
+                    "items_ingested": run.items_ingested,
+                    "items_failed": run.items_failed,
+                    "errors": errors,
+                    "duration_seconds": duration,
+                },
+            )
+            for province, count in (run.tenders_added or {}).items():
+                _add(
+                    TenderRollup,
+                    {"granularity": granularity, "bucket": bucket, "province": province},
+                    {"tenders_added": count},
+                )
+    return True
+
+
+def rebuild_ingestion_rollups(since: Optional[datetime] = None) -> int:
+    """
+    Add every finished run not rolled up yet (e.g. runs from before the
+    rollups existed; those have no per-province counts). Returns the
+    number of runs added.
+    """
+    runs = IngestionRun.objects.filter(finished_at__isnull=False, rolled_up=False)
+    if since is not None:
+        runs = runs.filter(finished_at__gte=since)
+    added = 0
+    for run_id in runs.order_by("finished_at").values_list("pk", flat=True).iterator():
+        added += record_ingestion_rollups(run_id)
+    return added
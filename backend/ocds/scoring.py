@@ -0,0 +1,314 @@
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from django.db.models import Case, DateTimeField, ExpressionWrapper, F, IntegerField, Q, TextField, Value, When
+from django.db.models.functions import Coalesce, Concat, Least, Lower, StrIndex
+from django.db.models.lookups import Exact, GreaterThan, GreaterThanOrEqual
+from django.utils import timezone
+
+from .models import Tender, SupplierProfile
+
+
+# (minimum whole days until closing, bonus) checked in order; anything
+# closing in under a day (or already closed) gets no recency bonus.
+RECENCY_BUCKETS = (
+    (14, 10),
+    (7, 7),
+    (1, 4),
+)
+
+
+def compute_recency_bonus(tender_end_date: Optional[datetime], now: Optional[datetime] = None) -> int:
+    """
+    Time-dependent part of the match score, bucketed on days to closing.
+    """
+    if not tender_end_date:
+        return 0
+    now = now or timezone.now()
+    days_remaining = (tender_end_date - now).days
+    for min_days, bonus in RECENCY_BUCKETS:
+        if days_remaining >= min_days:
+            return bonus
+    return 0
+
+
+def recency_bonus_expression(now: Optional[datetime] = None) -> Case:
+    """
+    SQL equivalent of `compute_recency_bonus` evaluated against `tender_end_date`.
+    `(end - now).days >= n` is the same as `end >= now + n days`.
+    """
+    now = now or timezone.now()
+    return Case(
+        *[
+            When(tender_end_date__gte=now + timedelta(days=min_days), then=Value(bonus))
+            for min_days, bonus in RECENCY_BUCKETS
+        ],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+
+
+def recency_boundary_filter(since: datetime, until: datetime) -> Q:
+    """
+    Tenders whose recency bucket can have changed between `since` and `until`:
+    those whose closing date minus a bucket threshold (or minus zero, for the
+    bucket that drops to no bonus) fell inside the window.
+    """
+    condition = Q(pk__in=[])
+    for days in [min_days for min_days, _bonus in RECENCY_BUCKETS] + [0]:
+        offset = timedelta(days=days)
+        condition |= Q(tender_end_date__gt=since + offset, tender_end_date__lte=until + offset)
+    return condition
+
+
+def recency_epoch(now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    The latest moment at or before `now` at which some tender dropped to a
+    lower recency bucket (its closing date minus a bucket threshold, or the
+    closing date itself). Scores with a live recency bonus can only have
+    changed since then, so responses showing them are versioned by it.
+    One index probe on `tender_end_date` per threshold, in a single query.
+    """
+    now = now or timezone.now()
+    offsets = [timedelta(days=min_days) for min_days, _bonus in RECENCY_BUCKETS] + [timedelta(0)]
+    probes = [
+        Tender.objects.filter(tender_end_date__lte=now + offset)
+        .order_by("-tender_end_date")
+        .annotate(crossed_at=ExpressionWrapper(F("tender_end_date") - offset, output_field=DateTimeField()))
+        .values_list("crossed_at", flat=True)[:1]
+        for offset in offsets
+    ]
+    return max(probes[0].union(*probes[1:], all=True), default=None)
+
+
+def _cpv_code(value):
+    """CPV entries may be plain codes or OCDS classification objects."""
+    if isinstance(value, dict):
+        return value.get("id")
+    return value
+
+
+class ScoringContext:
+    """
+    A supplier profile prepared for scoring many tenders: preference sets and
+    lowercased keywords are built once, and `now` is fixed so every tender in
+    a request is scored against the same clock.
+    """
+
+    def __init__(self, profile: SupplierProfile, now: Optional[datetime] = None, stored_scores: bool = False):
+        self.profile = profile
+        self.now = now or timezone.now()
+        # True when `Tender.match_score` already holds this profile's static
+        # scores (the default profile): ordering and display then both read
+        # the stored columns, recency bonus as of the last sweep included.
+        self.stored_scores = stored_scores
+        self.preferred_cpvs = frozenset(_cpv_code(c) for c in profile.preferred_cpvs or [])
+        self.preferred_buyers = frozenset(profile.preferred_buyers or [])
+        self.keywords = tuple(
+            kw.lower() for kw in [profile.company_name] + list(profile.preferred_buyers or []) if kw
+        )
+        self.province = (profile.province or "").lower()
+        self.city = (profile.city or "").lower()
+        self.min_value = profile.min_value
+        self.max_value = profile.max_value
+        self._scores: Dict[int, int] = {}
+        self._recency_epoch = None
+
+    def refresh(self, now: Optional[datetime] = None) -> None:
+        """
+        Start a new scoring round for a long-lived context (e.g. an event
+        stream): move the clock on and forget memoised scores.
+        """
+        self.now = now or timezone.now()
+        self._scores.clear()
+        self._recency_epoch = None
+
+    def recency_epoch(self) -> Optional[datetime]:
+        """
+        `recency_epoch` at this context's clock, looked up once. None with
+        stored scores, whose bonus only moves with a sweep (which bumps the
+        data version).
+        """
+        if self.stored_scores:
+            return None
+        if self._recency_epoch is None:
+            self._recency_epoch = (recency_epoch(self.now),)
+        return self._recency_epoch[0]
+
+    def static_score(self, tender: Tender) -> int:
+        """
+        Time-independent part of the match score. This is what gets stored in
+        `Tender.match_score`; the recency bonus is added at read time.
+        Weighting (coarse):
+          - CPV / classification exact match (up to 40)
+          - Keyword in title/description (up to 25)
+          - Location match (up to 15)
+          - Contract value in range (up to 10)
+          - Buyer preference (up to 10)
+        """
+        score = 0
+
+        # CPV match
+        if self.preferred_cpvs and tender.cpv_codes:
+            overlap = len(self.preferred_cpvs.intersection(_cpv_code(c) for c in tender.cpv_codes))
+            if overlap:
+                score += min(40, 20 + overlap * 10)
+
+        # Keyword match
+        text = f"{tender.title} {tender.description}".lower()
+        hits = sum(1 for kw in self.keywords if kw in text)
+        if hits:
+            score += min(25, 10 + hits * 5)
+
+        # Location
+        if self.province and self.province == (tender.province or "").lower():
+            score += 10
+            if self.city and self.city == (tender.city or "").lower():
+                score += 5
+
+        # Value range
+        if tender.value_amount is not None:
+            if self.min_value <= tender.value_amount <= self.max_value:
+                score += 10
+
+        # Buyer preference
+        if tender.procuring_entity and tender.procuring_entity.name in self.preferred_buyers:
+            score += 10
+
+        return score
+
+    def score(self, tender: Tender) -> int:
+        """Full 0-100 match score, memoised per tender for this context."""
+        cached = self._scores.get(tender.pk)
+        if cached is not None:
+            return cached
+        if self.stored_scores:
+            # Same columns `as_expression` sorts on
+            score = (tender.match_score or 0) + tender.recency_bonus
+        else:
+            score = self.static_score(tender) + compute_recency_bonus(tender.tender_end_date, self.now)
+        score = max(0, min(100, int(score)))
+        if tender.pk is not None:
+            self._scores[tender.pk] = score
+        return score
+
+    def score_many(self, tenders: Iterable[Tender]) -> Dict[int, int]:
+        """Score a batch (e.g. a feed page) up front, before serialisation."""
+        return {tender.pk: self.score(tender) for tender in tenders}
+
+    def static_score_expression(self):
+        """
+        `static_score` as an ORM expression over Tender columns, so the
+        database can sort and paginate on the personalised score.
+        Must stay in step with `static_score` (see `ScoreParityTests`).
+        """
+        parts = []
+
+        # CPV match: count preferred codes present in the JSON list, either as
+        # plain codes or as classification objects with a matching id
+        codes = [code for code in self.preferred_cpvs if code is not None]
+        if codes:
+            overlap = sum(
+                (
+                    Case(
+                        When(Q(cpv_codes__contains=[code]) | Q(cpv_codes__contains=[{"id": code}]), then=Value(1)),
+                        default=Value(0),
+                    )
+                    for code in codes
+                ),
+                Value(0),
+            )
+            parts.append(
+                Case(
+                    When(GreaterThanOrEqual(overlap, 2), then=Value(40)),
+                    When(GreaterThanOrEqual(overlap, 1), then=Value(30)),
+                    default=Value(0),
+                )
+            )
+
+        # Keyword match
+        if self.keywords:
+            text = Lower(Concat("title", Value(" "), "description", output_field=TextField()))
+            hits = sum(
+                (
+                    Case(When(GreaterThan(StrIndex(text, Value(kw)), 0), then=Value(1)), default=Value(0))
+                    for kw in self.keywords
+                ),
+                Value(0),
+            )
+            parts.append(
+                Case(
+                    When(GreaterThanOrEqual(hits, 3), then=Value(25)),
+                    When(GreaterThanOrEqual(hits, 2), then=Value(20)),
+                    When(GreaterThanOrEqual(hits, 1), then=Value(15)),
+                    default=Value(0),
+                )
+            )
+
+        # Location
+        if self.province:
+            location = Value(10)
+            if self.city:
+                location = location + Case(
+                    When(Exact(Lower("city"), self.city), then=Value(5)), default=Value(0)
+                )
+            parts.append(
+                Case(When(Exact(Lower("province"), self.province), then=location), default=Value(0))
+            )
+
+        # Value range
+        parts.append(
+            Case(
+                When(value_amount__gte=self.min_value, value_amount__lte=self.max_value, then=Value(10)),
+                default=Value(0),
+            )
+        )
+
+        # Buyer preference
+        if self.preferred_buyers:
+            parts.append(
+                Case(
+                    When(procuring_entity__name__in=sorted(self.preferred_buyers), then=Value(10)),
+                    default=Value(0),
+                )
+            )
+
+        return sum(parts[1:], parts[0])
+
+    def as_expression(self):
+        """
+        Full match score (static part plus recency bucket, capped at 100) as
+        an integer ORM expression for annotate/order_by.
+
+        With stored scores this reads `match_score + recency_bonus` (the
+        swept copy of the bucket), which matches the
+        `tender_active_feed_order` expression index.
+        """
+        if self.stored_scores:
+            return Least(
+                Coalesce(F("match_score"), Value(0)) + F("recency_bonus"),
+                Value(100),
+                output_field=IntegerField(),
+            )
+        return Least(
+            self.static_score_expression() + recency_bonus_expression(self.now),
+            Value(100),
+            output_field=IntegerField(),
+        )
+
+
+def compute_static_match_score(tender: Tender, profile: SupplierProfile) -> int:
+    """
+    Time-independent part of the match score for a single tender.
+    See `ScoringContext.static_score`.
+    """
+    return ScoringContext(profile).static_score(tender)
+
+
+def compute_match_score(tender: Tender, profile: SupplierProfile) -> int:
+    """
+    scoring function.
+    Static part (see `ScoringContext.static_score`) plus a recency bonus of
+    up to 10 based on days to closing, clamped to a 0-100 scale.
+    """
+    return ScoringContext(profile).score(tender)
@@ -7,9 +7,12 @@ from .models import (
     SupplierProfile,
     SavedTender,
     IngestionRun,
+    IngestionRollup,
+    TenderDimension,
+    TenderRollup,
     IngestionError,
+    RescoreJob,
 )
-from .services import compute_match_score
 
 
 class TenderDocumentSerializer(serializers.ModelSerializer):
@@ -45,14 +48,164 @@ class ProcuringEntitySerializer(serializers.Serializer):
         }
 
 
-class TenderSerializer(serializers.ModelSerializer):
-    procuringEntity = ProcuringEntitySerializer(source="procuring_entity", read_only=True)
-    documents = TenderDocumentSerializer(many=True, read_only=True)
+# Most tender ids accepted by one bulk save/unsave request
+MAX_BULK_SAVED_TENDERS = 500
+
+
+# Model columns read by each tender API field, so views can push a sparse
+# fieldset down into the queryset with `.only()`. Paths are relative to Tender.
+SCORING_COLUMNS = (
+    "title",
+    "description",
+    "province",
+    "city",
+    "value_amount",
+    "cpv_codes",
+    "tender_end_date",
+    "match_score",
+    "recency_bonus",
+    "procuring_entity__name",
+)
+RAW_JSON_COLUMNS = ("release__raw_json",)
+TENDER_FIELD_COLUMNS = {
+    "tender_id": ("tender_id",),
+    "ocid": ("ocid",),
+    "title": ("title",),
+    "description": ("description",),
+    "status": ("status",),
+    "category": ("category",),
+    "additional_procurement_categories": ("additional_procurement_categories",),
+    "province": ("province",),
+    "city": ("city",),
+    "value": ("value_amount", "value_currency"),
+    "tenderPeriod": ("tender_start_date", "tender_end_date"),
+    "procuringEntity": (
+        "procuring_entity__party_id",
+        "procuring_entity__name",
+        "procuring_entity__contact_name",
+        "procuring_entity__contact_email",
+        "procuring_entity__contact_phone",
+    ),
+    "documents": (),
+    "matchScore": SCORING_COLUMNS,
+    "cpvCodes": ("cpv_codes",),
+    "submissionMethod": ("submission_methods",),
+    "briefingSession": RAW_JSON_COLUMNS,
+    "deliveryLocation": RAW_JSON_COLUMNS,
+    "procurementMethod": RAW_JSON_COLUMNS,
+    "procurementMethodDetails": RAW_JSON_COLUMNS,
+    "specialConditions": RAW_JSON_COLUMNS,
+    "contactPerson": RAW_JSON_COLUMNS,
+}
+
+
+class SparseFieldsetMixin:
+    """
+    Honour a `fields` entry in the serializer context (the `?fields=` query
+    parameter): fields that were not requested are dropped from the output.
+    """
+
+    always_included = ("tender_id",)
+    field_columns = TENDER_FIELD_COLUMNS
+
+    def get_fields(self):
+        fields = super().get_fields()
+        requested = self.context.get("fields")
+        if requested:
+            for name in list(fields):
+                if name not in requested and name not in self.always_included:
+                    del fields[name]
+        return fields
+
+    @classmethod
+    def get_queryset_columns(cls, requested=None):
+        """
+        Columns the (requested) fields read, for `.only()`, and whether the
+        documents relation needs prefetching.
+        """
+        columns = set()
+        documents = False
+        for name in cls.Meta.fields:
+            if requested and name not in requested and name not in cls.always_included:
+                continue
+            if name == "documents":
+                documents = True
+            columns.update(cls.field_columns.get(name, ()))
+        return sorted(columns), documents
+
+
+class ProcuringEntitySummarySerializer(serializers.Serializer):
+    id = serializers.CharField(source="party_id")
+    name = serializers.CharField()
+
+
+class TenderListSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    Compact tender representation for feed cards: no documents, no contact
+    details and nothing read from the release's raw JSON.
+    """
+
+    procuringEntity = ProcuringEntitySummarySerializer(source="procuring_entity", read_only=True)
     value = serializers.SerializerMethodField()
     tenderPeriod = serializers.SerializerMethodField()
+    matchScore = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Tender
+        fields = [
+            "tender_id",
+            "ocid",
+            "title",
+            "description",
+            "status",
+            "category",
+            "province",
+            "city",
+            "value",
+            "tenderPeriod",
+            "procuringEntity",
+            "matchScore",
+        ]
+
+    def get_value(self, obj):
+        if obj.value_amount is None:
+            return None
+        return {
+            "amount": float(obj.value_amount),
+            "currency": obj.value_currency,
+        }
+
+    def get_tenderPeriod(self, obj):
+        if not (obj.tender_start_date or obj.tender_end_date):
+            return None
+        return {
+            "startDate": obj.tender_start_date,
+            "endDate": obj.tender_end_date,
+        }
+
+    def get_matchScore(self, obj):
+        """
+        Score against the request's ScoringContext (resolved once per request
+        by the view). Falls back to the stored score (as anonymous feeds
+        show it) if no scoring context is available.
+        """
+        scoring = self.context.get("scoring")
+        if scoring is not None:
+            try:
+                return scoring.score(obj)
+            except Exception:
+                pass
+
+        if obj.match_score is None:
+            return None
+        return min(100, obj.match_score + obj.recency_bonus)
+
+
+class TenderSerializer(TenderListSerializer):
+    procuringEntity = ProcuringEntitySerializer(source="procuring_entity", read_only=True)
+    documents = TenderDocumentSerializer(many=True, read_only=True)
     cpvCodes = serializers.ListField(source="cpv_codes")
     submissionMethod = serializers.ListField(source="submission_methods")
-    matchScore = serializers.SerializerMethodField()
     briefingSession = serializers.SerializerMethodField()
     deliveryLocation = serializers.SerializerMethodField()
     procurementMethod = serializers.SerializerMethodField()
@@ -87,22 +240,6 @@ class TenderSerializer(serializers.ModelSerializer):
             "contactPerson",
         ]
 
-    def get_value(self, obj):
-        if obj.value_amount is None:
-            return None
-        return {
-            "amount": float(obj.value_amount),
-            "currency": obj.value_currency,
-        }
-
-    def get_tenderPeriod(self, obj):
-        if not (obj.tender_start_date or obj.tender_end_date):
-            return None
-        return {
-            "startDate": obj.tender_start_date,
-            "endDate": obj.tender_end_date,
-        }
-
     def _get_raw_tender_data(self, obj):
         """Extract tender data from the release's raw JSON."""
         if not obj.release or not obj.release.raw_json:
@@ -151,31 +288,6 @@ class TenderSerializer(serializers.ModelSerializer):
             "telephone": contact.get("telephoneNumber") or contact.get("telephone"),
         }
 
-    def get_matchScore(self, obj):
-        """
-        Compute match score dynamically based on the current user's profile.
-        Falls back to stored match_score if no user context is available.
-        """
-        request = self.context.get('request')
-        if request and request.user and request.user.is_authenticated:
-            try:
-                # Imported here to avoid circular dependency with views.py
-                from .views import get_or_create_profile_for_user
-                profile = get_or_create_profile_for_user(request.user)
-                return compute_match_score(obj, profile)
-            except Exception:
-                pass
-        
-        # Fallback to default profile or stored score
-        try:
-            from .views import get_default_profile
-            profile = get_default_profile()
-            return compute_match_score(obj, profile)
-        except Exception:
-            # return stored score if available
-            return obj.match_score
-
-
 class ReleaseSerializer(serializers.Serializer):
     """
     Lightweight wrapper to match the frontend `Release` type.
@@ -188,6 +300,14 @@ class ReleaseSerializer(serializers.Serializer):
     tender = TenderSerializer()
 
 
+class ReleaseListSerializer(ReleaseSerializer):
+    """
+    `ReleaseSerializer` with the compact tender representation.
+    """
+
+    tender = TenderListSerializer()
+
+
 class SupplierProfileSerializer(serializers.ModelSerializer):
     # Expose camelCase fields to match frontend types while mapping to model's snake_case
     companyName = serializers.CharField(source="company_name")
@@ -201,9 +321,15 @@ class SupplierProfileSerializer(serializers.ModelSerializer):
     emailNotifications = serializers.BooleanField(source="email_notifications")
     smsNotifications = serializers.BooleanField(source="sms_notifications")
     whatsappNotifications = serializers.BooleanField(source="whatsapp_notifications")
+    alertFrequency = serializers.ChoiceField(
+        source="alert_frequency",
+        choices=SupplierProfile.ALERT_FREQUENCY_CHOICES,
+        required=False,
+    )
     isPaused = serializers.BooleanField(source="is_paused")
     createdAt = serializers.DateTimeField(source="created_at", read_only=True)
     updatedAt = serializers.DateTimeField(source="updated_at", read_only=True)
+    scoresStatus = serializers.SerializerMethodField()
 
     class Meta:
         model = SupplierProfile
@@ -223,11 +349,26 @@ class SupplierProfileSerializer(serializers.ModelSerializer):
             "emailNotifications",
             "smsNotifications",
             "whatsappNotifications",
+            "alertFrequency",
             "isPaused",
             "createdAt",
             "updatedAt",
+            "scoresStatus",
         ]
 
+    def get_scoresStatus(self, obj):
+        """
+        "updating" while a background rescore for this profile is queued or
+        running, "ready" otherwise. Uses the `scores_updating` annotation
+        when the queryset provides it.
+        """
+        updating = getattr(obj, "scores_updating", None)
+        if updating is None:
+            updating = RescoreJob.objects.filter(
+                supplier=obj, status__in=RescoreJob.PENDING_STATUSES
+            ).exists()
+        return "updating" if updating else "ready"
+
 
 class SavedTenderSerializer(serializers.ModelSerializer):
     tenderId = serializers.CharField(source="tender.tender_id", read_only=True)
@@ -245,6 +386,34 @@ class SavedTenderSerializer(serializers.ModelSerializer):
         ]
 
 
+class SavedTenderExpandedSerializer(SavedTenderSerializer):
+    """A saved tender with its compact tender card (`?expand=1`)."""
+
+    tender = TenderListSerializer(read_only=True)
+
+    class Meta(SavedTenderSerializer.Meta):
+        fields = SavedTenderSerializer.Meta.fields + ["tender"]
+
+
+class SavedTenderBulkSerializer(serializers.Serializer):
+    """Tender ids to save (`add`) and/or unsave (`remove`) in one request."""
+
+    add = serializers.ListField(
+        child=serializers.CharField(), required=False, default=list, max_length=MAX_BULK_SAVED_TENDERS
+    )
+    remove = serializers.ListField(
+        child=serializers.CharField(), required=False, default=list, max_length=MAX_BULK_SAVED_TENDERS
+    )
+
+    def validate(self, attrs):
+        both = set(attrs["add"]) & set(attrs["remove"])
+        if both:
+            raise serializers.ValidationError(
+                f"Tender ids cannot be both added and removed: {', '.join(sorted(both))}"
+            )
+        return attrs
+
+
 class IngestionRunSerializer(serializers.ModelSerializer):
     """
     Expose ingestion run history for the admin dashboard.
@@ -264,6 +433,14 @@ class IngestionRunSerializer(serializers.ModelSerializer):
         ]
 
 
+class TenderDimensionSerializer(serializers.ModelSerializer):
+    tenderCount = serializers.IntegerField(source="tender_count")
+    activeCount = serializers.IntegerField(source="active_count")
+
+    class Meta:
+        model = TenderDimension
+        fields = ["value", "tenderCount", "activeCount"]
+
 class IngestionSourceStatsSerializer(serializers.Serializer):
     name = serializers.CharField()
     lastSync = serializers.DateTimeField()
@@ -279,6 +456,44 @@ class IngestionStatsSerializer(serializers.Serializer):
     sources = IngestionSourceStatsSerializer(many=True)
 
 
+class IngestionRollupSerializer(serializers.ModelSerializer):
+    failedRuns = serializers.IntegerField(source="failed_runs")
+    itemsIngested = serializers.IntegerField(source="items_ingested")
+    itemsFailed = serializers.IntegerField(source="items_failed")
+    failureRate = serializers.SerializerMethodField()
+    avgDurationSeconds = serializers.SerializerMethodField()
+
+    class Meta:
+        model = IngestionRollup
+        fields = [
+            "bucket",
+            "source",
+            "runs",
+            "failedRuns",
+            "itemsIngested",
+            "itemsFailed",
+            "errors",
+            "failureRate",
+            "avgDurationSeconds",
+        ]
+
+    def get_failureRate(self, obj):
+        """Share of failed items among all items processed in the bucket."""
+        total = obj.items_ingested + obj.items_failed
+        return round(obj.items_failed / total, 4) if total else 0
+
+    def get_avgDurationSeconds(self, obj):
+        return round(obj.duration_seconds / obj.runs, 1) if obj.runs else 0
+
+
+class TenderRollupSerializer(serializers.ModelSerializer):
+    tendersAdded = serializers.IntegerField(source="tenders_added")
+
+    class Meta:
+        model = TenderRollup
+        fields = ["bucket", "province", "tendersAdded"]
+
+
 class IngestionErrorSerializer(serializers.ModelSerializer):
     class Meta:
         model = IngestionError
@@ -1,7 +1,8 @@
 import logging
 import io
 import json
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 from pathlib import Path
 
@@ -9,9 +10,12 @@ import requests
 import pandas as pd
 from django.conf import settings
 from django.core.files.uploadedfile import UploadedFile
+from django.db import close_old_connections, transaction
+from django.db.models import Q
 from django.utils import timezone
 
 from .models import (
+    NextChangeSeq,
     Release,
     Tender,
     TenderDocument,
@@ -19,6 +23,29 @@ from .models import (
     IngestionRun,
     IngestionError,
     SupplierProfile,
+    RescoreJob,
+    ScoreSweep,
+    TenderDetailSnapshot,
+    lock_change_seq_for_write,
+)
+from .caching import bump_data_version
+from .dimensions import (
+    apply_dimension_change,
+    close_expired_dimensions,
+    dimension_snapshot,
+    rebuild_tender_dimensions,
+    recorded_snapshot,
+    rename_buyer_dimension,
+)
+from .filters import tender_search_vector
+from .renderers import dumps
+from .serializers import TenderSerializer
+from .scoring import (
+    ScoringContext,
+    compute_recency_bonus,
+    compute_static_match_score,
+    recency_bonus_expression,
+    recency_boundary_filter,
 )
 
 logger = logging.getLogger(__name__)
@@ -64,13 +91,36 @@ def upsert_release_from_payload(payload: dict, run: Optional[IngestionRun] = Non
 
         tender_data = payload.get("tender") or {}
 
+        # What the dimension tables hold for this tender, read before the
+        # buyer upsert below can rename its procuring entity
+        previous = (
+            Tender.objects.filter(release=release)
+            .select_related("procuring_entity")
+            .only(
+                "status",
+                "tender_end_date",
+                "category",
+                "province",
+                "archived",
+                "updated_at",
+                "procuring_entity__name",
+            )
+            .first()
+        )
+        before = recorded_snapshot(previous)
+
         # Procuring entity
         pe_data = (tender_data.get("procuringEntity") or {}) or {}
         pe_contact = pe_data.get("contactPoint") or {}
         procuring_entity = None
+        previous_buyer_name = None
         if pe_data.get("id") or pe_data.get("name"):
+            party_id = pe_data.get("id") or pe_data.get("name")
+            previous_buyer_name = (
+                ProcuringEntity.objects.filter(party_id=party_id).values_list("name", flat=True).first()
+            )
             procuring_entity, _ = ProcuringEntity.objects.update_or_create(
-                party_id=pe_data.get("id") or pe_data.get("name"),
+                party_id=party_id,
                 defaults={
                     "name": pe_data.get("name") or pe_data.get("id") or "",
                     "contact_name": pe_contact.get("name") or "",
@@ -95,16 +145,34 @@ def upsert_release_from_payload(payload: dict, run: Optional[IngestionRun] = Non
             "cpv_codes": tender_data.get("additionalClassifications") or tender_data.get("cpvCodes") or [],
             "submission_methods": tender_data.get("submissionMethod") or [],
             "procuring_entity": procuring_entity,
+            # A new release brings the tender back into the hot set until
+            # the next archival run decides again
+            "archived": False,
         }
 
-        tender, _ = Tender.objects.update_or_create(
-            release=release,
-            defaults={
-                "tender_id": tender_data.get("id") or release_id,
-                **tender_defaults,
-            },
+        with transaction.atomic():
+            # A new row takes a change_seq on insert
+            lock_change_seq_for_write()
+            tender, _ = Tender.objects.update_or_create(
+                release=release,
+                defaults={
+                    "tender_id": tender_data.get("id") or release_id,
+                    **tender_defaults,
+                },
+            )
+
+        Tender.objects.filter(pk=tender.pk).update(
+            search_vector=tender_search_vector(procuring_entity.name if procuring_entity else "")
         )
 
+        try:
+            apply_dimension_change(before, dimension_snapshot(tender))
+            if previous_buyer_name is not None and previous_buyer_name != procuring_entity.name:
+                rename_buyer_dimension(procuring_entity, previous_buyer_name, exclude_pk=tender.pk)
+        except Exception:
+            # Counts self-heal on the next full sweep
+            logger.exception("Failed to update tender dimensions")
+
         # Documents
         TenderDocument.objects.filter(tender=tender).delete()
         for doc in tender_data.get("documents") or []:
@@ -118,15 +186,34 @@ def upsert_release_from_payload(payload: dict, run: Optional[IngestionRun] = Non
                 format=doc.get("format") or "",
             )
 
-        # update match score for default profile
+        # update the stored scores for the default profile: the static match
+        # score, and the recency bonus as of now, which `sweep_recency_scores`
+        # keeps current as tender_end_date draws nearer
         try:
+            tender.recency_bonus = compute_recency_bonus(tender.tender_end_date)
             profile = SupplierProfile.objects.first()
             if profile:
-                tender.match_score = compute_match_score(tender, profile)
-                tender.save(update_fields=["match_score"])
+                tender.match_score = compute_static_match_score(tender, profile)
+            tender.save(update_fields=["match_score", "recency_bonus", "updated_at"])
         except Exception:
             logger.exception("Failed to compute match score")
 
+        try:
+            render_detail_snapshot(tender)
+        except Exception:
+            # The detail view re-renders missing or stale snapshots itself
+            logger.exception("Failed to render detail snapshot")
+
+        # Stamp last, so a delta-sync client that sees this position also
+        # sees the rewritten documents and snapshot
+        with transaction.atomic():
+            lock_change_seq_for_write()
+            Tender.objects.filter(pk=tender.pk).update(change_seq=NextChangeSeq())
+
+        if previous is None and run is not None:
+            # Saved with the run; feeds the per-province dashboard rollups
+            run.tenders_added[tender.province] = run.tenders_added.get(tender.province, 0) + 1
+
         return release
     except Exception as exc:  # pragma: no cover - defensive
         logger.exception("Failed to upsert release %s", release_id)
@@ -139,6 +226,34 @@ def upsert_release_from_payload(payload: dict, run: Optional[IngestionRun] = Non
         return None
 
 
+def render_detail_snapshot(tender: Tender) -> TenderDetailSnapshot:
+    """
+    Render and store the non-personalised detail JSON for a tender, exactly
+    as the API would render it minus `matchScore`.
+    """
+    fields = set(TenderSerializer.Meta.fields) - {"matchScore"}
+    data = TenderSerializer(tender, context={"fields": fields}).data
+    snapshot, _created = TenderDetailSnapshot.objects.update_or_create(
+        tender=tender,
+        defaults={"payload": json.loads(dumps(data)), "tender_updated_at": tender.updated_at},
+    )
+    return snapshot
+
+
+def current_detail_snapshot(tender: Tender) -> Optional[TenderDetailSnapshot]:
+    """
+    The tender's snapshot if it is up to date, else None. Reads
+    `tender.detail_snapshot`, so select it along with the tender.
+    """
+    try:
+        snapshot = tender.detail_snapshot
+    except TenderDetailSnapshot.DoesNotExist:
+        return None
+    if snapshot is None or snapshot.tender_updated_at != tender.updated_at:
+        return None
+    return snapshot
+
+
 def fetch_and_ingest_releases(
     page_number: int = 1,
     page_size: int = 100,
@@ -202,64 +317,248 @@ def fetch_and_ingest_releases(
         return run
 
 
-def compute_match_score(tender: Tender, profile: SupplierProfile) -> int:
+def sweep_recency_scores(now: Optional[datetime] = None, full: bool = False) -> ScoreSweep:
+    """
+    Refresh the stored `Tender.recency_bonus` for tenders that crossed a
+    recency bucket boundary since the previous sweep. The new bucket is
+    computed in SQL; only rows whose stored value differs are written.
+    Also takes tenders that closed since the previous sweep out of the
+    dimension tables' active counts (a full sweep recounts them).
+    """
+    now = now or timezone.now()
+    qs = Tender.objects.all()
+    last_sweep = ScoreSweep.objects.order_by("-ran_at").first()
+    if last_sweep and not full:
+        qs = qs.filter(recency_boundary_filter(last_sweep.ran_at, now))
+        closed = close_expired_dimensions(last_sweep.ran_at, now)
+    else:
+        closed = rebuild_tender_dimensions(now)
+
+    expression = recency_bonus_expression(now)
+    updated = qs.exclude(recency_bonus=expression).update(recency_bonus=expression)
+    if updated or closed:
+        # Some tenders crossed a bucket boundary or closed
+        bump_data_version()
+    return ScoreSweep.objects.create(ran_at=now, tenders_updated=updated)
+
+
+# Tender statuses that can be archived without a closing date
+FINAL_STATUSES = ("complete", "cancelled", "unsuccessful", "withdrawn")
+ARCHIVE_BATCH_SIZE = 5000
+
+
+def archivable_tenders(cutoff: datetime):
+    """Hot tenders that closed before `cutoff` (or finished without a closing date)."""
+    return Tender.objects.hot().filter(
+        Q(tender_end_date__lt=cutoff)
+        | Q(tender_end_date__isnull=True, status__in=FINAL_STATUSES, updated_at__lt=cutoff)
+    )
+
+
+def archive_closed_tenders(days: Optional[int] = None, now: Optional[datetime] = None) -> int:
+    """
+    Move tenders that closed more than `days` ago (default
+    `settings.TENDER_ARCHIVE_AFTER_DAYS`) out of the hot set, in batches so
+    no single UPDATE holds row locks for long. Returns the number archived.
+    """
+    days = settings.TENDER_ARCHIVE_AFTER_DAYS if days is None else days
+    cutoff = (now or timezone.now()) - timedelta(days=days)
+    archived = 0
+    while True:
+        batch = list(archivable_tenders(cutoff).values_list("pk", flat=True)[:ARCHIVE_BATCH_SIZE])
+        if not batch:
+            break
+        archived += Tender.objects.filter(pk__in=batch).update(archived=True)
+    if archived:
+        bump_data_version()
+    return archived
+
+
+def rescore_default_profile_static_scores(batch_size: int = 1000) -> int:
+    """
+    Recompute the stored static `match_score` of every tender for the default
+    profile. Needed once for rows scored before the recency bonus was split
+    out, and whenever the default profile's preferences change.
+    """
+    profile = SupplierProfile.objects.first()
+    if not profile:
+        return 0
+
+    updated = 0
+    batch = []
+    for tender in Tender.objects.select_related("procuring_entity").iterator(chunk_size=batch_size):
+        tender.match_score = compute_static_match_score(tender, profile)
+        batch.append(tender)
+        if len(batch) >= batch_size:
+            updated += len(batch)
+            Tender.objects.bulk_update(batch, ["match_score"])
+            batch = []
+    if batch:
+        updated += len(batch)
+        Tender.objects.bulk_update(batch, ["match_score"])
+    if updated:
+        bump_data_version()
+    return updated
+
+
+# Profile fields that feed into the static match score
+SCORING_PROFILE_FIELDS = (
+    "company_name",
+    "province",
+    "city",
+    "preferred_cpvs",
+    "preferred_buyers",
+    "min_value",
+    "max_value",
+)
+
+RESCORE_CHUNK_SIZE = 2000
+
+_rescore_executor: Optional[ThreadPoolExecutor] = None
+
+
+def scoring_snapshot(profile: SupplierProfile) -> tuple:
+    """Values of the scoring-relevant profile fields, for change detection."""
+    return tuple(
+        list(value) if isinstance(value, list) else value
+        for value in (getattr(profile, field) for field in SCORING_PROFILE_FIELDS)
+    )
+
+
+def default_profile_id() -> Optional[int]:
+    """The profile whose static scores are stored in `Tender.match_score`."""
+    return SupplierProfile.objects.order_by("pk").values_list("pk", flat=True).first()
+
+
+def enqueue_rescore(profile: SupplierProfile) -> RescoreJob:
+    """
+    Queue a background rescore of the stored `Tender.match_score` for the
+    default `profile` (other profiles are scored in SQL at query time and
+    need no job). A job that is still queued already reads the latest
+    profile when it starts, so it is reused; a running job stops at its
+    next chunk once it sees this newer one.
+
+    A reused job is submitted again: its first submission may have been
+    lost with the process that made it. `run_rescore_job` claims a job
+    only once, so a duplicate submission is a no-op.
     """
-    scoring function.
-    Weighting (0-100 scale, coarse):
-      - CPV / classification exact match (up to 40)
-      - Keyword in title/description (up to 25)
-      - Location match (up to 15)
-      - Contract value in range (up to 10)
-      - Buyer preference (up to 10)
-      - Recency bonus (up to 10)
+    job = (
+        RescoreJob.objects.filter(supplier=profile, status="queued")
+        .order_by("-requested_at")
+        .first()
+    )
+    if job is None:
+        job = RescoreJob.objects.create(supplier=profile)
+    transaction.on_commit(lambda: _submit_rescore_job(job.pk))
+    return job
+
+
+def _submit_rescore_job(job_id: int) -> None:
+    global _rescore_executor
+    if _rescore_executor is None:
+        _rescore_executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, "RESCORE_JOB_WORKERS", 2),
+            thread_name_prefix="rescore",
+        )
+    _rescore_executor.submit(_run_rescore_job_in_thread, job_id)
+
+
+def _run_rescore_job_in_thread(job_id: int) -> None:
+    try:
+        run_rescore_job(job_id)
+    finally:
+        close_old_connections()
+
+
+def _write_rescore_chunk(context: ScoringContext, tenders: List[Tender]) -> None:
+    for tender in tenders:
+        tender.match_score = context.static_score(tender)
+    Tender.objects.bulk_update(tenders, ["match_score"])
+
+
+def run_rescore_job(job_id: int) -> Optional[RescoreJob]:
+    """
+    Stream tenders through a server-side cursor, score them in chunks for
+    the default profile and bulk-write `Tender.match_score`. Every tender
+    is rescored, not just active ones: the anonymous feed reads the column
+    for anything it serves. Returns None if the job was already claimed or
+    superseded before it started.
     """
-    score = 0
-
-    # CPV match
-    preferred_cpvs = set(profile.preferred_cpvs or [])
-    tender_cpvs = set(tender.cpv_codes or [])
-    if preferred_cpvs and tender_cpvs:
-        overlap = len(preferred_cpvs & tender_cpvs)
-        if overlap:
-            score += min(40, 20 + overlap * 10)
-
-    # Keyword match
-    keywords = [profile.company_name] + (profile.preferred_buyers or [])
-    text = f"{tender.title} {tender.description}".lower()
-    if text:
-        hits = 0
-        for kw in keywords:
-            if kw and kw.lower() in text:
-                hits += 1
-        if hits:
-            score += min(25, 10 + hits * 5)
-
-    # Location
-    if profile.province and profile.province.lower() == (tender.province or "").lower():
-        score += 10
-        if profile.city and profile.city.lower() == (tender.city or "").lower():
-            score += 5
-
-    # Value range
-    if tender.value_amount is not None:
-        if profile.min_value <= tender.value_amount <= profile.max_value:
-            score += 10
-
-    # Buyer preference
-    if tender.procuring_entity and tender.procuring_entity.name in (profile.preferred_buyers or []):
-        score += 10
-
-    # Recency: newer tenders score higher based on days to closing
-    if tender.tender_end_date:
-        days_remaining = (tender.tender_end_date - timezone.now()).days
-        if days_remaining >= 14:
-            score += 10
-        elif days_remaining >= 7:
-            score += 7
-        elif days_remaining >= 1:
-            score += 4
-
-    return max(0, min(100, int(score)))
+    started_at = timezone.now()
+    claimed = RescoreJob.objects.filter(pk=job_id, status="queued").update(
+        status="running", started_at=started_at
+    )
+    if not claimed:
+        return None
+
+    job = RescoreJob.objects.select_related("supplier").get(pk=job_id)
+    if job.supplier.pk != default_profile_id():
+        # Nothing is stored for other profiles (e.g. a job queued by an older release)
+        job.status = "cancelled"
+        job.details = "Not the default profile"
+        job.finished_at = timezone.now()
+        job.save(update_fields=["status", "details", "finished_at"])
+        return job
+    try:
+        context = ScoringContext(job.supplier)
+
+        tenders = (
+            Tender.objects.select_related("procuring_entity")
+            .only(
+                "id",
+                "title",
+                "description",
+                "province",
+                "city",
+                "value_amount",
+                "cpv_codes",
+                "tender_end_date",
+                "procuring_entity__name",
+            )
+            .order_by("pk")
+        )
+
+        scored = 0
+        chunk: List[Tender] = []
+        for tender in tenders.iterator(chunk_size=RESCORE_CHUNK_SIZE):
+            chunk.append(tender)
+            if len(chunk) < RESCORE_CHUNK_SIZE:
+                continue
+            if RescoreJob.objects.filter(supplier=job.supplier, pk__gt=job.pk).exists():
+                job.status = "cancelled"
+                job.details = "Superseded by a newer job"
+                break
+            _write_rescore_chunk(context, chunk)
+            scored += len(chunk)
+            chunk = []
+        else:
+            if chunk:
+                _write_rescore_chunk(context, chunk)
+                scored += len(chunk)
+            job.status = "done"
+            job.details = f"Scored {scored} tenders"
+
+        job.tenders_scored = scored
+    except Exception as exc:
+        logger.exception("Rescore job %s failed", job_id)
+        job.status = "failed"
+        job.details = str(exc)
+
+    job.finished_at = timezone.now()
+    job.save(update_fields=["status", "details", "tenders_scored", "finished_at"])
+    if job.tenders_scored:
+        # Stored `Tender.match_score` values changed
+        bump_data_version()
+    return job
+
+
+def run_queued_rescore_jobs() -> int:
+    """Drain queued jobs synchronously (e.g. ones left over from a restart)."""
+    processed = 0
+    for job_id in RescoreJob.objects.filter(status="queued").order_by("requested_at").values_list("pk", flat=True):
+        if run_rescore_job(job_id):
+            processed += 1
+    return processed
 
 
 def _convert_row_to_ocds_release(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -0,0 +1,81 @@
+import logging
+
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .authentication import invalidate_token
+from .caching import bump_data_version
+from .dimensions import apply_dimension_change, recorded_snapshot
+from .events import notify_tender_changes
+from .models import IngestionRun, SupplierProfile, Tender, TenderTombstone, lock_change_seq_for_write
+from .rollups import record_ingestion_rollups
+
+logger = logging.getLogger(__name__)
+
+
+@receiver([post_save, post_delete], sender=SupplierProfile)
+def invalidate_default_profile_cache(sender, instance, **kwargs):
+    """Drop the per-process default profile copy when that profile changes."""
+    # Imported here to avoid a circular import at app loading time
+    from .views import clear_default_profile_cache
+
+    clear_default_profile_cache(instance.pk)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_token(instance.key)
+
+
+@receiver([post_save, post_delete], sender=get_user_model())
+@receiver([post_save, post_delete], sender=SupplierProfile)
+def invalidate_user_tokens(sender, instance, **kwargs):
+    """Cached token lookups carry the user and profile; drop them on changes."""
+    user_id = instance.pk if sender is not SupplierProfile else instance.user_id
+    if user_id is not None:
+        for key in Token.objects.filter(user_id=user_id).values_list("key", flat=True):
+            invalidate_token(key)
+
+
+@receiver(post_save, sender=IngestionRun)
+def bump_data_version_on_ingestion(sender, instance, **kwargs):
+    """A finished ingestion run may have changed any tender."""
+    if instance.finished_at:
+        transaction.on_commit(bump_data_version)
+        transaction.on_commit(notify_tender_changes)
+
+
+@receiver(post_save, sender=IngestionRun)
+def roll_up_finished_ingestion(sender, instance, **kwargs):
+    """Add the run to the dashboard rollups once it has finished."""
+    if instance.finished_at and not instance.rolled_up:
+        try:
+            record_ingestion_rollups(instance.pk)
+        except Exception:
+            # rebuild_ingestion_rollups adds it later
+            logger.exception("Failed to roll up ingestion run %s", instance.pk)
+            return
+        # A later save of this same object must not clear the flag
+        instance.rolled_up = True
+
+
+@receiver(post_delete, sender=Tender)
+def record_tender_tombstone(sender, instance, **kwargs):
+    """Tell delta-sync clients about the deletion (see /api/tenders/changes/)."""
+    with transaction.atomic():
+        lock_change_seq_for_write()
+        TenderTombstone.objects.create(tender_id=instance.tender_id)
+
+
+@receiver(post_delete, sender=Tender)
+def remove_tender_dimensions(sender, instance, **kwargs):
+    """Take a deleted tender out of the dimension counts behind the facets."""
+    try:
+        with transaction.atomic():
+            apply_dimension_change(recorded_snapshot(instance), None)
+    except Exception:
+        # Counts self-heal on the next full sweep
+        logger.exception("Failed to update dimensions for deleted tender %s", instance.pk)
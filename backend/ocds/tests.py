@@ -1,3 +1,436 @@
-from django.test import TestCase
+import base64
+import json
+import os
+from datetime import datetime, timedelta
+from datetime import timezone as dt_timezone
+from decimal import Decimal
+from itertools import product
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import sync_to_async
+from django.contrib.auth.models import User
+from django.db import connection
+from django.test import AsyncClient, TestCase
+from django.utils import timezone
+from rest_framework.authtoken.models import Token
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from .management.commands._synthetic import seed_synthetic_tenders
+from .caching import bump_data_version
+from .dimensions import rebuild_tender_dimensions
+from .models import (
+    DataVersion,
+    NotificationOutbox,
+    ProcuringEntity,
+    Release,
+    RescoreJob,
+    SupplierProfile,
+    Tender,
+    TenderDimension,
+)
+from .notifications import flush_digests
+from .pagination import KeysetPagination
+from .scoring import RECENCY_BUCKETS, ScoringContext, compute_recency_bonus, recency_boundary_filter
+from .services import enqueue_rescore, run_rescore_job, sweep_recency_scores
+from .views import TenderListView, clear_default_profile_cache, get_default_profile
+
+postgres_only = skipUnless(connection.vendor == "postgresql", "requires PostgreSQL")
+
+
+def make_tender(n, **fields):
+    release = Release.objects.create(
+        release_id=f"test-{n}",
+        ocid=f"ocds-test-{n}",
+        date=timezone.now(),
+        raw_json={"id": f"test-{n}"},
+    )
+    return Tender.objects.create(release=release, tender_id=f"test-{n}", ocid=release.ocid, **fields)
+
+
+@postgres_only
+class FeedPaginationTests(TestCase):
+    """Malformed cursors and page numbers are a 404, never a database error."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for n in range(3):
+            make_tender(n, title=f"Tender {n}", tender_end_date=timezone.now() + timedelta(days=n))
+
+    def encode_cursor(self, position):
+        raw = json.dumps({"p": position}).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+    def test_valid_cursor(self):
+        cursor = self.encode_cursor([5, {"dt": timezone.now().isoformat()}, 1])
+        self.assertEqual(self.client.get("/api/tenders/", {"cursor": cursor}).status_code, 200)
+
+    def test_cursor_values_must_fit_their_fields(self):
+        positions = [
+            [1, {"dt": "2020-01-01"}, "abc"],
+            [None, None, 1],
+            [1, None, 10**20],
+            [1, {"dt": 5}, 1],
+            [1, {"dec": "abc"}, 1],
+            [1, 2],
+        ]
+        for position in positions:
+            with self.subTest(position=position):
+                response = self.client.get("/api/tenders/", {"cursor": self.encode_cursor(position)})
+                self.assertEqual(response.status_code, 404)
+
+    def test_page_number_is_bounded(self):
+        self.assertEqual(self.client.get("/api/tenders/", {"page": "1"}).status_code, 200)
+        for page in ["0", "x", str(KeysetPagination.max_page_number + 1), "9" * 20]:
+            with self.subTest(page=page):
+                self.assertEqual(self.client.get("/api/tenders/", {"page": page}).status_code, 404)
+
+
+@postgres_only
+class TenderDetailConditionalGetTests(TestCase):
+    """A detail 304 is only sent while the tender's displayed score is unchanged."""
+
+    def setUp(self):
+        past = timezone.now() - timedelta(hours=1)
+        make_tender(
+            1, title="Tender 1", tender_end_date=timezone.now() + timedelta(days=30), match_score=14, recency_bonus=10
+        )
+        Tender.objects.update(updated_at=past)
+        get_default_profile()
+        SupplierProfile.objects.update(updated_at=past)
+        clear_default_profile_cache()
+        bump_data_version()
+        DataVersion.objects.update(changed_at=past)
+
+        self.url = "/api/tenders/test-1/"
+        response = self.client.get(self.url)
+        self.etag, self.last_modified = response["ETag"], response["Last-Modified"]
+        self.score = response.json()["matchScore"]
+
+    def assertRefetched(self, score):
+        for headers in [{"HTTP_IF_NONE_MATCH": self.etag}, {"HTTP_IF_MODIFIED_SINCE": self.last_modified}]:
+            with self.subTest(headers=headers):
+                response = self.client.get(self.url, **headers)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(response.json()["matchScore"], score)
+
+    def test_unchanged_tender_is_not_modified(self):
+        self.assertEqual(self.client.get(self.url, HTTP_IF_NONE_MATCH=self.etag).status_code, 304)
+        self.assertEqual(self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=self.last_modified).status_code, 304)
+
+    def test_rescored_match_score(self):
+        Tender.objects.update(match_score=44)
+        bump_data_version()
+        self.assertRefetched(self.score + 30)
+
+    def test_swept_recency_bonus(self):
+        Tender.objects.update(recency_bonus=7)
+        bump_data_version()
+        self.assertRefetched(self.score - 3)
+
+
+@postgres_only
+class ScoreParityTests(TestCase):
+    """
+    `ScoringContext.as_expression` (SQL, used for feed ordering) gives the
+    same score as `ScoringContext.score` (Python, used for display) for
+    every branch of the weighting.
+    """
+
+    CPVS = [
+        [],
+        ["72000000"],
+        [{"id": "45000000", "scheme": "CPV"}],
+        ["72000000", {"id": "45000000"}],
+        ["99999999", {"id": "11111111"}],
+    ]
+    # Days to closing: each recency bucket, its exact boundary, closed, and no date
+    END_DAYS = [30, 14, 10, 7, 3, 1, 0.5, -2, None]
+    TEXTS = [
+        ("Office furniture", "Supply of desks"),
+        ("Acme Water pipes", "Bulk water"),
+        ("Road repairs", "For the city of johannesburg and Tshwane Metro"),
+        ("ACME WATER for Tshwane Metro", "city of Johannesburg depots"),
+    ]
+    LOCATIONS = [("Gauteng", "Johannesburg"), ("gauteng", "Pretoria"), ("Limpopo", "Johannesburg"), ("", "")]
+    VALUES = [None, Decimal("50000"), Decimal("100000"), Decimal("750000.50"), Decimal("2000000"), Decimal("10")]
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.now = timezone.now()
+        buyers = [
+            ProcuringEntity.objects.create(party_id="pe-jhb", name="City of Johannesburg"),
+            ProcuringEntity.objects.create(party_id="pe-tsh", name="Tshwane Metro"),
+            ProcuringEntity.objects.create(party_id="pe-other", name="Department of Health"),
+            None,
+        ]
+        for n, (cpvs, days) in enumerate(product(cls.CPVS, cls.END_DAYS)):
+            title, description = cls.TEXTS[n % len(cls.TEXTS)]
+            province, city = cls.LOCATIONS[n % len(cls.LOCATIONS)]
+            make_tender(
+                n,
+                title=title,
+                description=description,
+                province=province,
+                city=city,
+                value_amount=cls.VALUES[n % len(cls.VALUES)],
+                tender_end_date=None if days is None else cls.now + timedelta(days=days),
+                procuring_entity=buyers[n % len(buyers)],
+                cpv_codes=cpvs,
+            )
+
+        cls.profiles = [
+            SupplierProfile.objects.create(
+                company_name="Acme Water",
+                email="acme@example.com",
+                province="Gauteng",
+                city="Johannesburg",
+                preferred_cpvs=["72000000", {"id": "45000000"}],
+                preferred_buyers=["City of Johannesburg", "Tshwane Metro"],
+                min_value=Decimal("100000"),
+                max_value=Decimal("1000000"),
+            ),
+            SupplierProfile.objects.create(
+                company_name="Acme Water",
+                email="acme-cpv@example.com",
+                province="Gauteng",
+                preferred_cpvs=[{"id": "72000000", "scheme": "CPV"}],
+            ),
+            SupplierProfile.objects.create(company_name="", email="empty@example.com", min_value=Decimal("1e12")),
+        ]
+
+    def test_fixture_covers_every_recency_bucket(self):
+        bonuses = {compute_recency_bonus(t.tender_end_date, self.now) for t in Tender.objects.all()}
+        self.assertEqual(bonuses, {0} | {bonus for _days, bonus in RECENCY_BUCKETS})
+
+    def test_sql_score_matches_python_score(self):
+        for profile in self.profiles:
+            context = ScoringContext(profile, now=self.now)
+            tenders = Tender.objects.select_related("procuring_entity").annotate(sql_score=context.as_expression())
+            for tender in tenders:
+                with self.subTest(profile=profile.email, tender=tender.tender_id):
+                    self.assertEqual(tender.sql_score, context.score(tender))
+
+    def test_stored_scores_display_what_they_order_by(self):
+        # Stored bonuses from a sweep two days ago, stale for some tenders now
+        sweep_recency_scores(now=self.now - timedelta(days=2), full=True)
+        live = ScoringContext(self.profiles[0], now=self.now)
+        tenders = list(Tender.objects.select_related("procuring_entity"))
+        for tender in tenders:
+            tender.match_score = live.static_score(tender)
+        Tender.objects.bulk_update(tenders, ["match_score"])
+
+        context = ScoringContext(self.profiles[0], now=self.now, stored_scores=True)
+        tenders = Tender.objects.select_related("procuring_entity").annotate(sql_score=context.as_expression())
+        stale = 0
+        for tender in tenders:
+            with self.subTest(tender=tender.tender_id):
+                self.assertEqual(tender.sql_score, context.score(tender))
+            stale += tender.recency_bonus != compute_recency_bonus(tender.tender_end_date, self.now)
+        self.assertGreater(stale, 0)
+
+
+@postgres_only
+class TenderExportTests(TestCase):
+    """Exports under ASGI stream through an async iterator with the same output."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for n in range(3):
+            make_tender(n, title=f"Tender {n}", cpv_codes=["72000000"], value_amount=Decimal("1000"))
+
+    async def test_asgi_export_streams_same_content(self):
+        for file_format in ["csv", "ndjson"]:
+            with self.subTest(file_format):
+                url = f"/api/tenders/export/?format={file_format}"
+                expected = await sync_to_async(lambda: b"".join(self.client.get(url).streaming_content))()
+                response = await AsyncClient().get(url)
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.is_async)
+                content = b"".join([chunk async for chunk in response.streaming_content])
+                self.assertEqual(content, expected)
+                self.assertEqual(content.count(b"Tender "), 3)
+
+
+class DigestFlushTests(TestCase):
+    """Buffered matches from closed windows end up in exactly one digest row."""
+
+    # Half past ten: the 09:00-10:00 hourly window is closed, 10:00-11:00 is open
+    NOW = datetime(2026, 3, 2, 10, 30, tzinfo=dt_timezone.utc)
+    WINDOW_END = datetime(2026, 3, 2, 10, 0, tzinfo=dt_timezone.utc)
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.supplier = SupplierProfile.objects.create(email="digest@example.com", alert_frequency="hourly")
+        cls.tenders = [make_tender(n, title=f"Tender {n}") for n in range(4)]
+
+    def buffer(self, tender, score, created_at):
+        row = NotificationOutbox.objects.create(
+            supplier=self.supplier, tender=tender, channel="email", match_score=score, status="buffered"
+        )
+        NotificationOutbox.objects.filter(pk=row.pk).update(created_at=created_at)
+
+    def digest(self):
+        return NotificationOutbox.objects.get(supplier=self.supplier, digest_window=self.WINDOW_END)
+
+    def test_late_matches_merge_into_pending_digest(self):
+        self.buffer(self.tenders[0], 40, self.NOW - timedelta(minutes=50))
+        self.buffer(self.tenders[1], 60, self.NOW - timedelta(minutes=40))
+        self.buffer(self.tenders[2], 90, self.NOW - timedelta(minutes=10))  # window still open
+        self.assertEqual(flush_digests(self.NOW), 1)
+        self.assertEqual(self.digest().digest_total, 2)
+
+        self.buffer(self.tenders[3], 80, self.NOW - timedelta(minutes=35))
+        self.assertEqual(flush_digests(self.NOW), 1)
+        digest = self.digest()
+        self.assertEqual(digest.digest_total, 3)
+        self.assertEqual(digest.match_score, 80)
+        self.assertEqual(digest.digest, [[self.tenders[3].pk, 80], [self.tenders[1].pk, 60], [self.tenders[0].pk, 40]])
+        self.assertEqual(
+            NotificationOutbox.objects.filter(status="buffered").values_list("tender", flat=True).get(),
+            self.tenders[2].pk,
+        )
+
+    def test_late_matches_wait_when_digest_already_sent(self):
+        self.buffer(self.tenders[0], 40, self.NOW - timedelta(minutes=50))
+        flush_digests(self.NOW)
+        NotificationOutbox.objects.filter(digest_window=self.WINDOW_END).update(status="sent")
+
+        self.buffer(self.tenders[1], 60, self.NOW - timedelta(minutes=40))
+        self.assertEqual(flush_digests(self.NOW), 0)
+        self.assertEqual(self.digest().digest_total, 1)
+        self.assertTrue(NotificationOutbox.objects.filter(tender=self.tenders[1], status="buffered").exists())
+
+
+class TenderDimensionDeleteTests(TestCase):
+    """Deleting a tender takes it out of the facet counts straight away."""
+
+    def counts(self, kind, value):
+        return TenderDimension.objects.filter(kind=kind, value=value).values_list("tender_count", "active_count").get()
+
+    def test_delete_decrements_counts(self):
+        buyer = ProcuringEntity.objects.create(party_id="buyer-1", name="Water Board")
+        open_until = timezone.now() + timedelta(days=7)
+        tenders = [
+            make_tender(n, category="works", province="Gauteng", procuring_entity=buyer, tender_end_date=open_until)
+            for n in range(2)
+        ]
+        make_tender(2, category="works", province="Gauteng", status="complete")
+        rebuild_tender_dimensions()
+        self.assertEqual(self.counts("category", "works"), (3, 2))
+
+        tenders[0].delete()
+        self.assertEqual(self.counts("category", "works"), (2, 1))
+        self.assertEqual(self.counts("province", "Gauteng"), (2, 1))
+        self.assertEqual(self.counts("buyer", "Water Board"), (1, 1))
+
+        Release.objects.filter(release_id="test-1").delete()  # cascades to the tender
+        self.assertEqual(self.counts("buyer", "Water Board"), (0, 0))
+        self.assertEqual(self.counts("category", "works"), (1, 0))
+
+
+class RescoreJobTests(TestCase):
+    """A queued job left behind by a lost submission still gets run."""
+
+    def test_reused_job_is_submitted_again(self):
+        profile = SupplierProfile.objects.create(email="default@example.com", province="Gauteng")
+        make_tender(0, title="Water treatment works")
+        stranded = RescoreJob.objects.create(supplier=profile)  # its worker went away
+
+        with mock.patch("ocds.services._submit_rescore_job") as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                job = enqueue_rescore(profile)
+        self.assertEqual(job.pk, stranded.pk)
+        submit.assert_called_once_with(stranded.pk)
+
+        self.assertEqual(run_rescore_job(job.pk).status, "done")
+        self.assertIsNone(run_rescore_job(job.pk))  # a duplicate submission
+
+
+class SupplierProfileWriteTests(TestCase):
+    """Profile edits start from the stored row, not the copy cached with the token."""
+
+    def test_put_keeps_changes_made_elsewhere(self):
+        user = User.objects.create_user("supplier", "supplier@example.com", "pw")
+        SupplierProfile.objects.create(user=user, company_name="Supplier", email=user.email)
+        token = Token.objects.create(user=user)
+        headers = {"HTTP_AUTHORIZATION": f"Token {token.key}"}
+        self.client.get("/api/supplier/profile/", **headers)  # caches the profile with the token
+
+        # An admin on another worker: no signal reaches this process's cache
+        SupplierProfile.objects.filter(user=user).update(is_paused=True)
+
+        response = self.client.get("/api/supplier/profile/", **headers)
+        self.assertTrue(response.json()["isPaused"])
+        response = self.client.put(
+            "/api/supplier/profile/", {"companyName": "Renamed"}, content_type="application/json", **headers
+        )
+        self.assertEqual(response.status_code, 200)
+        profile = SupplierProfile.objects.get(user=user)
+        self.assertEqual(profile.company_name, "Renamed")
+        self.assertTrue(profile.is_paused)
+
+
+def feed_page_queryset(params):
+    """The exact queryset `TenderListView` runs for the first page of `params`."""
+    view = TenderListView()
+    view.request = Request(APIRequestFactory().get("/api/tenders/", params))
+    view.format_kwarg = None
+    view.kwargs = {}
+    paginator = view.paginator
+    return view.get_queryset().order_by(*paginator.get_ordering())[: paginator.page_size + 1]
+
+
+def seq_scans(plan, relation="ocds_tender"):
+    """Sequential scans on `relation` anywhere in an EXPLAIN (FORMAT JSON) plan."""
+    found = []
+    if plan.get("Node Type") == "Seq Scan" and plan.get("Relation Name") == relation:
+        found.append(plan)
+    for child in plan.get("Plans", []):
+        found.extend(seq_scans(child, relation))
+    return found
+
+
+@postgres_only
+class FeedQueryPlanTests(TestCase):
+    """
+    The main feed queries use indexes on a large tender table rather than
+    falling back to a sequential scan. Seeding is the slow part; set
+    `OCDS_PLAN_TEST_TENDERS` to test against a larger table.
+    """
+
+    SEED_TENDERS = int(os.getenv("OCDS_PLAN_TEST_TENDERS", "50000"))
+    # (label, feed query parameters) for anonymous first-page feed queries
+    FEED_CASES = [
+        ("feed default", {"status": "active"}),
+        ("feed province", {"status": "active", "provinces": ["Gauteng"]}),
+        (
+            "feed province+value",
+            {"status": "active", "provinces": ["Gauteng", "Limpopo"], "minValue": "1000000", "maxValue": "5000000"},
+        ),
+        ("feed categories", {"status": "active", "categories": ["72000000", "works"]}),
+        ("feed search", {"status": "active", "search": "borehole drilling"}),
+        ("feed prefix search", {"status": "active", "search": "desalin"}),
+    ]
+
+    @classmethod
+    def setUpTestData(cls):
+        seed_synthetic_tenders(cls.SEED_TENDERS)
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE ocds_tender")
+
+    def assertIndexed(self, queryset):
+        plan = json.loads(queryset.explain(format="json"))[0]["Plan"]
+        self.assertEqual(seq_scans(plan), [], json.dumps(plan, indent=2))
+
+    def test_feed_queries(self):
+        for label, params in self.FEED_CASES:
+            with self.subTest(label):
+                self.assertIndexed(feed_page_queryset(params))
+
+    def test_detail_lookup(self):
+        self.assertIndexed(Tender.objects.filter(tender_id="synthetic-1"))
+
+    def test_recency_sweep_window(self):
+        now = timezone.now()
+        self.assertIndexed(Tender.objects.filter(recency_boundary_filter(now - timedelta(hours=1), now)))
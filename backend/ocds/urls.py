@@ -1,5 +1,21 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
+
+# Under ASGI the read-heavy endpoints run as coroutines
+if settings.ASYNC_API_VIEWS:
+    TenderListView = async_views.AsyncTenderListView
+    TenderDetailView = async_views.AsyncTenderDetailView
+    CategoryListView = async_views.AsyncCategoryListView
+    # Long-lived event streams are only served under ASGI
+    event_patterns = [
+        path("tenders/events/", async_views.TenderEventStreamView.as_view(), name="tender-events"),
+    ]
+else:
+    TenderListView = views.TenderListView
+    TenderDetailView = views.TenderDetailView
+    CategoryListView = views.CategoryListView
+    event_patterns = []
 
 urlpatterns = [
     # Auth
@@ -8,12 +24,16 @@ urlpatterns = [
     path("admin/auth/login/", views.AdminLoginView.as_view(), name="admin-login"),
 
     # Public tender feed & detail
-    path("tenders/", views.TenderListView.as_view(), name="tender-list"),
-    path("tenders/<str:tender_id>/", views.TenderDetailView.as_view(), name="tender-detail"),
+    path("tenders/", TenderListView.as_view(), name="tender-list"),
+    path("tenders/export/", views.TenderExportView.as_view(), name="tender-export"),
+    path("tenders/changes/", views.TenderChangesView.as_view(), name="tender-changes"),
+    *event_patterns,
+    path("tenders/<str:tender_id>/", TenderDetailView.as_view(), name="tender-detail"),
 
     # Supplier profile & saved tenders
     path("supplier/profile/", views.SupplierProfileView.as_view(), name="supplier-profile"),
     path("supplier/saved-tenders/", views.SavedTenderListCreateView.as_view(), name="saved-tenders"),
+    path("supplier/saved-tenders/bulk/", views.SavedTenderBulkView.as_view(), name="saved-tenders-bulk"),
     path(
         "supplier/saved-tenders/<str:tender_id>/",
         views.SavedTenderDeleteView.as_view(),
@@ -21,12 +41,16 @@ urlpatterns = [
     ),
 
     # Meta
-    path("meta/categories/", views.CategoryListView.as_view(), name="category-list"),
+    path("meta/categories/", CategoryListView.as_view(), name="category-list"),
+    path("meta/provinces/", views.DimensionListView.as_view(kind="province"), name="province-list"),
+    path("meta/buyers/", views.DimensionListView.as_view(kind="buyer"), name="buyer-list"),
+    path("meta/facets/", views.FacetCountsView.as_view(), name="facet-counts"),
 
     # Admin / ingestion
     path("admin/ingestion/stats/", views.IngestionStatsView.as_view(), name="ingestion-stats"),
     path("admin/ingestion/errors/", views.IngestionErrorListView.as_view(), name="ingestion-errors"),
     path("admin/ingestion/history/", views.IngestionHistoryView.as_view(), name="ingestion-history"),
+    path("admin/ingestion/rollups/", views.IngestionRollupView.as_view(), name="ingestion-rollups"),
     path("admin/ingestion/run/", views.RunIngestionView.as_view(), name="run-ingestion"),
     path("admin/ingestion/backfill/", views.BackfillIngestionView.as_view(), name="backfill-ingestion"),
 
@@ -1,30 +1,94 @@
 import logging
+from datetime import datetime, time, timedelta
 
 from django.contrib.auth import authenticate, get_user_model
-from django.db.models import Q
+from django.core.handlers.asgi import ASGIRequest
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.db.models import Exists, OuterRef, Q
+from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 from rest_framework import generics, status
 from rest_framework.authtoken.models import Token
 from rest_framework.permissions import IsAdminUser
 from rest_framework.response import Response
+from rest_framework.throttling import ScopedRateThrottle
+from rest_framework.utils.urls import replace_query_param
 from rest_framework.views import APIView
 
 logger = logging.getLogger(__name__)
 
-from .models import Tender, SupplierProfile, SavedTender, IngestionRun, IngestionError
+from .models import (
+    Tender,
+    TenderDimension,
+    TenderTombstone,
+    SupplierProfile,
+    SavedTender,
+    IngestionRun,
+    IngestionError,
+    IngestionRollup,
+    RescoreJob,
+    TenderRollup,
+    change_seq_high_water,
+)
 from .serializers import (
+    SCORING_COLUMNS,
     ReleaseSerializer,
+    ReleaseListSerializer,
+    TenderListSerializer,
     TenderSerializer,
     SupplierProfileSerializer,
     SavedTenderSerializer,
+    SavedTenderBulkSerializer,
+    SavedTenderExpandedSerializer,
     IngestionStatsSerializer,
     IngestionErrorSerializer,
     IngestionRunSerializer,
+    IngestionRollupSerializer,
+    TenderDimensionSerializer,
+    TenderRollupSerializer,
     UserSerializer,
     RegisterSerializer,
     LoginSerializer,
 )
-from .services import fetch_and_ingest_releases, process_file_and_ingest, OCDS_API_BASE, ETENDERS_DATA_BASE
+from .caching import (
+    CachedResponseMixin,
+    ConditionalGetMixin,
+    make_etag,
+    normalized_query_string,
+    profile_version,
+    request_data_version,
+)
+from .exports import (
+    EXPORT_FORMATS,
+    export_rows,
+    parquet_available,
+    stream_async,
+    stream_csv,
+    stream_ndjson,
+    stream_parquet,
+)
+from .filters import apply_feed_filters, facet_counts, history_requested
+from .renderers import FastJSONRenderer
+from .pagination import (
+    SavedTenderPagination,
+    SupplierDirectoryPagination,
+    TenderFeedPagination,
+    estimated_count,
+)
+from .scoring import ScoringContext, compute_recency_bonus
+from .services import (
+    fetch_and_ingest_releases,
+    process_file_and_ingest,
+    current_detail_snapshot,
+    render_detail_snapshot,
+    default_profile_id,
+    enqueue_rescore,
+    scoring_snapshot,
+    OCDS_API_BASE,
+    ETENDERS_DATA_BASE,
+)
 
 User = get_user_model()
 
@@ -53,12 +117,58 @@ def get_default_profile() -> SupplierProfile:
     return profile
 
 
-def get_or_create_profile_for_user(user: User) -> SupplierProfile:
+_default_profile_cache = {}
+
+
+def get_cached_default_profile() -> SupplierProfile:
+    """
+    Per-process copy of the default profile for read-only use (scoring).
+    Invalidated by the SupplierProfile save/delete signals; write paths
+    should keep using `get_default_profile`.
+    """
+    profile = _default_profile_cache.get("profile")
+    if profile is None:
+        profile = get_default_profile()
+        _default_profile_cache["profile"] = profile
+    return profile
+
+
+def clear_default_profile_cache(pk=None) -> None:
+    cached = _default_profile_cache.get("profile")
+    if cached is not None and (pk is None or cached.pk == pk):
+        _default_profile_cache.pop("profile", None)
+
+
+def get_scoring_context(request) -> ScoringContext:
+    """
+    Resolve the request's profile once and return a ScoringContext shared by
+    every serializer rendering tenders for this request.
+    """
+    context = getattr(request, "_scoring_context", None)
+    if context is None:
+        if request.user and request.user.is_authenticated:
+            context = ScoringContext(get_or_create_profile_for_user(request.user))
+        else:
+            # Tender.match_score holds the default profile's static scores
+            context = ScoringContext(get_cached_default_profile(), stored_scores=True)
+        request._scoring_context = context
+    return context
+
+
+def get_or_create_profile_for_user(user: User, cached: bool = True) -> SupplierProfile:
     """
     Return the SupplierProfile for the authenticated user, creating it
     if needed. Falls back to the same defaults as `get_default_profile`
     for initial values.
+
+    `cached=False` skips the copy cached with the auth token, which can be
+    up to `AUTH_TOKEN_LOCAL_TTL` seconds old: use it whenever the profile
+    itself is shown for editing or saved.
     """
+    # Attached by CachedTokenAuthentication
+    profile = getattr(user, "cached_supplier_profile", None)
+    if profile is not None and cached:
+        return profile
     profile, created = SupplierProfile.objects.get_or_create(
         user=user,
         defaults={
@@ -81,64 +191,190 @@ def get_or_create_profile_for_user(user: User) -> SupplierProfile:
     return profile
 
 
-class TenderListView(generics.ListAPIView):
+def with_scores_updating(queryset):
+    """Annotate profiles with whether a rescoring job is still pending."""
+    return queryset.annotate(
+        scores_updating=Exists(
+            RescoreJob.objects.filter(
+                supplier=OuterRef("pk"), status__in=RescoreJob.PENDING_STATUSES
+            )
+        )
+    )
+
+
+def save_profile_and_rescore(serializer) -> SupplierProfile:
+    """
+    Save a SupplierProfile serializer and, for the default profile, queue a
+    background rescore of the stored `Tender.match_score` if any field that
+    feeds the match score changed. Other profiles are scored at query time.
+    """
+    before = scoring_snapshot(serializer.instance)
+    profile = serializer.save()
+    if scoring_snapshot(profile) != before and profile.pk == default_profile_id():
+        enqueue_rescore(profile)
+    return profile
+
+
+def include_history(request) -> bool:
+    """`?history=1` also serves archived tenders (see `Tender.archived`)."""
+    return history_requested(request.query_params)
+
+
+def tender_queryset(request):
+    """Tenders a read endpoint may serve: the hot set unless history is asked for."""
+    if include_history(request):
+        return Tender.objects.all()
+    return Tender.objects.hot()
+
+
+# Release columns the feed always serialises (see `ReleaseSerializer`)
+FEED_RELEASE_COLUMNS = (
+    "release__release_id",
+    "release__date",
+    "release__tag",
+    "release__initiation_type",
+)
+
+
+class TenderListView(ConditionalGetMixin, CachedResponseMixin, generics.ListAPIView):
     """
     Paginated tender feed powering the `TenderFeed`.
     """
 
     serializer_class = ReleaseSerializer
+    pagination_class = TenderFeedPagination
+
+    def is_compact(self):
+        """`?view=compact` returns the lean card representation."""
+        return self.request.query_params.get("view") == "compact"
+
+    def get_serializer_class(self):
+        return ReleaseListSerializer if self.is_compact() else ReleaseSerializer
+
+    def get_requested_fields(self):
+        """Parse `?fields=a,b,c` (tender-level field names) into a set."""
+        if not hasattr(self, "_requested_fields"):
+            raw = self.request.query_params.get("fields") or ""
+            self._requested_fields = {name.strip() for name in raw.split(",") if name.strip()}
+        return self._requested_fields
 
     def get_serializer_context(self):
-        """Pass request context to serializer for user-specific match score computation."""
+        """Pass the request's scoring context for user-specific match scores."""
         context = super().get_serializer_context()
-        context['request'] = self.request
+        context["scoring"] = get_scoring_context(self.request)
+        context["fields"] = self.get_requested_fields()
         return context
 
+    def get_validators(self, request, *args, **kwargs):
+        """
+        The feed only changes when the tender data version or the caller's
+        profile does, or when a tender crosses a recency bucket boundary
+        (which moves live scores); each is a single small lookup.
+        """
+        data = request_data_version(request)
+        scoring = get_scoring_context(request)
+        epoch = scoring.recency_epoch()
+        etag = make_etag(
+            data.version,
+            profile_version(scoring.profile),
+            epoch.isoformat() if epoch else "-",
+            normalized_query_string(request.query_params),
+            request.accepted_media_type,
+        )
+        last_modified = max(filter(None, [data.changed_at, scoring.profile.updated_at, epoch]), default=None)
+        return etag, last_modified
+
+    def list(self, request, *args, **kwargs):
+        # Only the current page is ever fetched (one LIMIT query plus the
+        # documents prefetch); the full filtered queryset is never evaluated.
+        tenders = self.paginate_queryset(self.filter_queryset(self.get_queryset()))
+        return self.get_page_response(request, tenders)
+
+    def get_page_response(self, request, tenders):
+        """Serialise a fetched feed page; runs no queries."""
+        # Score the whole page in one pass before serialisation
+        requested = self.get_requested_fields()
+        if not requested or "matchScore" in requested:
+            get_scoring_context(request).score_many(tenders)
+        # The ReleaseSerializer expects Release instances; `select_related`
+        # also caches `release.tender` for the nested TenderSerializer.
+        serializer = self.get_serializer([t.release for t in tenders], many=True)
+        return self.get_paginated_response(serializer.data)
+
     def get_queryset(self):
-        qs = Tender.objects.select_related("release", "procuring_entity").prefetch_related("documents")
+        # Only load the columns the chosen representation / fieldset reads
+        tender_serializer = TenderListSerializer if self.is_compact() else TenderSerializer
+        columns, documents = tender_serializer.get_queryset_columns(
+            self.get_requested_fields()
+        )
+        qs = tender_queryset(self.request).select_related("release", "procuring_entity").only(
+            "id", "tender_end_date", "procuring_entity__name", *FEED_RELEASE_COLUMNS, *columns
+        )
+        if documents:
+            qs = qs.prefetch_related("documents")
 
-        search = self.request.query_params.get("search") or ""
-        categories = self.request.query_params.getlist("categories")
-        provinces = self.request.query_params.getlist("provinces")
-        status_list = self.request.query_params.getlist("status")
-        min_value = self.request.query_params.get("minValue")
-        max_value = self.request.query_params.get("maxValue")
+        qs, search_rank = apply_feed_filters(qs, self.request.query_params)
 
-        if search:
-            search = search.lower()
-            qs = qs.filter(
-                Q(title__icontains=search)
-                | Q(description__icontains=search)
-                | Q(procuring_entity__name__icontains=search)
-            )
+        # Order: by the request profile's match score desc, then by closing
+        # date asc. The score is computed by Postgres from the same rules as
+        # `compute_match_score` (recency bucket included), so sorting and
+        # pagination reflect what the user actually sees. When searching,
+        # text relevance (ts_rank / trigram similarity) is blended in.
+        feed_score = get_scoring_context(self.request).as_expression()
+        if search_rank is not None:
+            feed_score = feed_score + search_rank
+        return qs.annotate(feed_score=feed_score).order_by("-feed_score", "tender_end_date", "id")
 
-        if status_list:
-            qs = qs.filter(status__in=status_list)
 
-        if categories:
-            # Filter by category name (matching actual API category field)
-            qs = qs.filter(
-                Q(category__in=categories) | Q(cpv_codes__overlap=categories)
-            )
+class TenderExportView(APIView):
+    """
+    Stream every tender matching the feed filters as CSV, NDJSON or Parquet
+    (`?format=`, default csv) instead of paging through the feed.
+    Throttled per user (or IP) with the "exports" rate.
+    """
+
+    throttle_classes = [ScopedRateThrottle]
+    throttle_scope = "exports"
+    stream_functions = {"csv": stream_csv, "ndjson": stream_ndjson, "parquet": stream_parquet}
 
-        if provinces:
-            qs = qs.filter(province__in=provinces)
+    def perform_content_negotiation(self, request, force=False):
+        # `format` picks the export file type here, not a DRF renderer;
+        # errors (throttling, bad parameters) are rendered as JSON
+        renderer = FastJSONRenderer()
+        return renderer, renderer.media_type
 
-        if min_value:
-            qs = qs.filter(value_amount__gte=min_value)
-        if max_value:
-            qs = qs.filter(value_amount__lte=max_value)
+    def get(self, request):
+        file_format = request.query_params.get("format") or "csv"
+        if file_format not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"format must be one of: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if file_format == "parquet" and not parquet_available():
+            return Response(
+                {"detail": "Parquet export is not available on this server (pyarrow is not installed)."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        # Order: by match_score desc then by closing date asc
-        qs = qs.order_by("-match_score", "tender_end_date")
+        qs, _search_rank = apply_feed_filters(tender_queryset(request), request.query_params)
+        qs = qs.annotate(export_score=get_scoring_context(request).as_expression()).order_by("id")
 
-        # The ReleaseSerializer expects Release instances; annotate via `.release`
-        return [t.release for t in qs]
+        content_type, extension = EXPORT_FORMATS[file_format]
+        content = self.stream_functions[file_format](export_rows(qs))
+        if isinstance(request._request, ASGIRequest):
+            content = stream_async(content)
+        response = StreamingHttpResponse(content, content_type=content_type)
+        filename = f"tenders-{timezone.now():%Y%m%d-%H%M}.{extension}"
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
 
 
-class TenderDetailView(generics.RetrieveAPIView):
+class TenderDetailView(ConditionalGetMixin, generics.RetrieveAPIView):
     """
     Detail endpoint for a single tender by its `tender_id`.
+    Serves the pre-rendered `TenderDetailSnapshot` with the caller's
+    `matchScore` spliced in; the serializer only runs when the snapshot is
+    missing or older than the tender.
     """
 
     serializer_class = TenderSerializer
@@ -146,13 +382,151 @@ class TenderDetailView(generics.RetrieveAPIView):
     lookup_url_kwarg = "tender_id"
 
     def get_serializer_context(self):
-        """Pass request context to serializer for user-specific match score computation."""
+        """Pass the request's scoring context for user-specific match scores."""
         context = super().get_serializer_context()
-        context['request'] = self.request
+        context["scoring"] = get_scoring_context(self.request)
         return context
 
+    def get_validators(self, request, *args, **kwargs):
+        """
+        The tender's own `updated_at`, its current recency bucket, the tender
+        data version (rescoring and sweeps rewrite stored scores without
+        touching `updated_at`) and the caller's profile version; unknown
+        tenders fall through to the 404.
+        """
+        row = (
+            tender_queryset(request)
+            .filter(tender_id=kwargs[self.lookup_url_kwarg])
+            .values_list("updated_at", "tender_end_date", "recency_bonus")
+            .first()
+        )
+        if row is None:
+            return None, None
+        updated_at, tender_end_date, recency_bonus = row
+        data = request_data_version(request)
+        scoring = get_scoring_context(request)
+        if not scoring.stored_scores:
+            recency_bonus = compute_recency_bonus(tender_end_date, scoring.now)
+        etag = make_etag(
+            updated_at.isoformat(),
+            recency_bonus,
+            data.version,
+            profile_version(scoring.profile),
+            request.accepted_media_type,
+        )
+        # None with stored scores, whose bonus moves with the data version
+        epoch = scoring.recency_epoch()
+        return etag, max(filter(None, [updated_at, data.changed_at, scoring.profile.updated_at, epoch]))
+
     def get_queryset(self):
-        return Tender.objects.select_related("procuring_entity", "release").prefetch_related("documents")
+        return (
+            tender_queryset(self.request)
+            .select_related("procuring_entity", "release")
+            .prefetch_related("documents")
+        )
+
+    def retrieve(self, request, *args, **kwargs):
+        lookup = {self.lookup_field: kwargs[self.lookup_url_kwarg]}
+        tender = get_object_or_404(self.get_snapshot_queryset(request), **lookup)
+        snapshot = current_detail_snapshot(tender)
+        if snapshot is None:
+            snapshot = render_detail_snapshot(self.get_object())
+        return self.get_snapshot_response(request, tender, snapshot)
+
+    def get_snapshot_queryset(self, request):
+        # One indexed lookup: the snapshot plus the columns scoring reads
+        return (
+            tender_queryset(request)
+            .select_related("procuring_entity", "detail_snapshot")
+            .only(
+                "id",
+                "updated_at",
+                "detail_snapshot__payload",
+                "detail_snapshot__tender_updated_at",
+                *SCORING_COLUMNS,
+            )
+        )
+
+    def get_snapshot_response(self, request, tender, snapshot):
+        data = dict(snapshot.payload)
+        data["matchScore"] = get_scoring_context(request).score(tender)
+        return Response(data)
+
+
+# Changes per delta-sync page (`?limit=` may ask for up to the maximum)
+CHANGE_FEED_PAGE_SIZE = 500
+CHANGE_FEED_MAX_PAGE_SIZE = 2000
+
+
+class TenderChangesView(APIView):
+    """
+    Delta sync for clients mirroring the tender dataset: tenders written by
+    ingestion, and tombstones for deleted tenders, after `?since=<cursor>`
+    in change order. Each page returns the `cursor` to send as the next
+    `since`; `next` is set while more changes are waiting. Tenders are in
+    the detail representation without `matchScore`.
+    """
+
+    def get(self, request):
+        try:
+            since = int(request.query_params.get("since") or 0)
+            limit = int(request.query_params.get("limit") or CHANGE_FEED_PAGE_SIZE)
+        except ValueError:
+            return Response({"detail": "since and limit must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, CHANGE_FEED_MAX_PAGE_SIZE))
+
+        # Stop below writes still in flight, which commit with lower
+        # positions than changes already visible
+        window = Q(change_seq__gt=since)
+        high_water = change_seq_high_water()
+        if high_water is not None:
+            window &= Q(change_seq__lte=high_water)
+
+        tenders = (
+            Tender.objects.filter(window)
+            .select_related("detail_snapshot")
+            .only(
+                "id",
+                "tender_id",
+                "change_seq",
+                "updated_at",
+                "detail_snapshot__payload",
+                "detail_snapshot__tender_updated_at",
+            )
+            .order_by("change_seq")[: limit + 1]
+        )
+        tombstones = TenderTombstone.objects.filter(window).order_by("change_seq")[: limit + 1]
+        changes = sorted([*tenders, *tombstones], key=lambda change: change.change_seq)
+        has_more = len(changes) > limit
+        changes = changes[:limit]
+
+        results = []
+        for change in changes:
+            payload = None
+            deleted = isinstance(change, TenderTombstone)
+            if not deleted:
+                snapshot = current_detail_snapshot(change)
+                if snapshot is None:
+                    snapshot = render_detail_snapshot(
+                        Tender.objects.select_related("procuring_entity", "release")
+                        .prefetch_related("documents")
+                        .get(pk=change.pk)
+                    )
+                payload = snapshot.payload
+            results.append(
+                {
+                    "changeSeq": change.change_seq,
+                    "tenderId": change.tender_id,
+                    "deleted": deleted,
+                    "tender": payload,
+                }
+            )
+
+        cursor = changes[-1].change_seq if changes else since
+        next_url = None
+        if has_more:
+            next_url = replace_query_param(request.build_absolute_uri(), "since", cursor)
+        return Response({"cursor": cursor, "next": next_url, "results": results})
 
 
 class SupplierProfileView(APIView):
@@ -162,7 +536,7 @@ class SupplierProfileView(APIView):
 
     def get(self, request):
         if request.user and request.user.is_authenticated:
-            profile = get_or_create_profile_for_user(request.user)
+            profile = get_or_create_profile_for_user(request.user, cached=False)
         else:
             profile = get_default_profile()
         serializer = SupplierProfileSerializer(profile)
@@ -170,18 +544,21 @@ class SupplierProfileView(APIView):
 
     def put(self, request):
         if request.user and request.user.is_authenticated:
-            profile = get_or_create_profile_for_user(request.user)
+            profile = get_or_create_profile_for_user(request.user, cached=False)
         else:
             profile = get_default_profile()
         serializer = SupplierProfileSerializer(profile, data=request.data, partial=True)
         serializer.is_valid(raise_exception=True)
-        serializer.save()
+        save_profile_and_rescore(serializer)
         return Response(serializer.data)
 
 
 class SavedTenderListCreateView(APIView):
     """
     List and add saved tenders for the current user's profile.
+
+    `?expand=1` pages through the saved list (most recent first) with each
+    tender's compact card included, so clients need no per-tender requests.
     """
 
     def get(self, request):
@@ -189,18 +566,42 @@ class SavedTenderListCreateView(APIView):
             profile = get_or_create_profile_for_user(request.user)
         else:
             profile = get_default_profile()
-        saved = SavedTender.objects.filter(supplier=profile).select_related("tender")
+        saved = SavedTender.objects.filter(supplier=profile)
+        if request.query_params.get("expand") in ("1", "true"):
+            return self.get_expanded(request, saved)
+
         data = [
             {
-                "tenderId": s.tender.tender_id,
-                "savedAt": s.saved_at,
-                "notes": s.notes,
-                "calendarAdded": s.calendar_added,
+                "tenderId": tender_id,
+                "savedAt": saved_at,
+                "notes": notes,
+                "calendarAdded": calendar_added,
             }
-            for s in saved
+            for tender_id, saved_at, notes, calendar_added in saved.values_list(
+                "tender__tender_id", "saved_at", "notes", "calendar_added"
+            )
         ]
         return Response(data)
-    
+
+    def get_expanded(self, request, saved):
+        # One query per page: saved rows joined to the card columns only
+        columns, _documents = TenderListSerializer.get_queryset_columns()
+        saved = saved.select_related("tender__procuring_entity").only(
+            "id",
+            "saved_at",
+            "notes",
+            "calendar_added",
+            "tender__id",
+            *[f"tender__{column}" for column in columns],
+        )
+        paginator = SavedTenderPagination()
+        page = paginator.paginate_queryset(saved, request, view=self)
+        scoring = get_scoring_context(request)
+        scoring.score_many(item.tender for item in page)
+        serializer = SavedTenderExpandedSerializer(
+            page, many=True, context={"request": request, "scoring": scoring}
+        )
+        return paginator.get_paginated_response(serializer.data)
 
     def post(self, request):
         if request.user and request.user.is_authenticated:
@@ -223,6 +624,45 @@ class SavedTenderListCreateView(APIView):
         return Response(serializer.data, status=status.HTTP_201_CREATED)
 
 
+class SavedTenderBulkView(APIView):
+    """
+    Save and unsave many tenders at once:
+    `{"add": [tenderId, ...], "remove": [tenderId, ...]}`.
+    One tender lookup, one bulk insert and one delete, whatever the count.
+    """
+
+    def post(self, request):
+        if request.user and request.user.is_authenticated:
+            profile = get_or_create_profile_for_user(request.user)
+        else:
+            profile = get_default_profile()
+        serializer = SavedTenderBulkSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        add = list(dict.fromkeys(serializer.validated_data["add"]))
+        remove = serializer.validated_data["remove"]
+
+        found = dict(Tender.objects.filter(tender_id__in=add).values_list("tender_id", "id")) if add else {}
+        with transaction.atomic():
+            if found:
+                SavedTender.objects.bulk_create(
+                    [SavedTender(supplier=profile, tender_id=pk) for pk in found.values()],
+                    ignore_conflicts=True,
+                )
+            removed = 0
+            if remove:
+                removed, _by_model = SavedTender.objects.filter(
+                    supplier=profile, tender__tender_id__in=remove
+                ).delete()
+
+        return Response(
+            {
+                "added": [tender_id for tender_id in add if tender_id in found],
+                "notFound": [tender_id for tender_id in add if tender_id not in found],
+                "removed": removed,
+            }
+        )
+
+
 class SavedTenderDeleteView(APIView):
     """
     Remove a saved tender for the default profile.
@@ -300,18 +740,86 @@ class IngestionHistoryView(generics.ListAPIView):
         return IngestionRun.objects.order_by("-started_at")[:50]
 
 
+# Default and largest range served per rollup granularity
+ROLLUP_DEFAULT_SPANS = {"hour": timedelta(hours=48), "day": timedelta(days=30)}
+ROLLUP_MAX_SPANS = {"hour": timedelta(days=31), "day": timedelta(days=3 * 366)}
+
+
+class IngestionRollupView(APIView):
+    """
+    Ingestion trends for the admin dashboard from the hourly or daily
+    rollups (`?granularity=hour|day`): runs, items, errors and failure rate
+    per source, and new tenders per province, for buckets in
+    `?from=` .. `?to=` (ISO dates or datetimes; default: the last 48 hours
+    or 30 days). `?source=` narrows the runs to one source.
+    """
+
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        granularity = request.query_params.get("granularity") or "day"
+        if granularity not in ROLLUP_DEFAULT_SPANS:
+            return Response({"detail": "granularity must be hour or day"}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            until = self.parse_bound(request.query_params.get("to")) or timezone.now()
+            since = self.parse_bound(request.query_params.get("from")) or until - ROLLUP_DEFAULT_SPANS[granularity]
+        except ValueError:
+            return Response({"detail": "from and to must be ISO dates or datetimes"}, status=status.HTTP_400_BAD_REQUEST)
+        if until - since > ROLLUP_MAX_SPANS[granularity]:
+            return Response(
+                {"detail": f"at most {ROLLUP_MAX_SPANS[granularity].days} days of {granularity} buckets per request"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        buckets = {"granularity": granularity, "bucket__gte": since, "bucket__lte": until}
+        runs = IngestionRollup.objects.filter(**buckets)
+        source = request.query_params.get("source")
+        if source:
+            runs = runs.filter(source=source)
+        tenders = TenderRollup.objects.filter(**buckets)
+        return Response(
+            {
+                "granularity": granularity,
+                "from": since,
+                "to": until,
+                "runs": IngestionRollupSerializer(runs.order_by("bucket", "source"), many=True).data,
+                "tendersAdded": TenderRollupSerializer(tenders.order_by("bucket", "province"), many=True).data,
+            }
+        )
+
+    @staticmethod
+    def parse_bound(value):
+        if not value:
+            return None
+        moment = parse_datetime(value)
+        if moment is None:
+            day = parse_date(value)
+            if day is None:
+                raise ValueError(value)
+            moment = datetime.combine(day, time.min)
+        if timezone.is_naive(moment):
+            moment = timezone.make_aware(moment)
+        return moment
+
+
 class AdminSupplierListView(generics.ListAPIView):
     """
-    Admin-only list of supplier profiles.
-    Supports basic search by company name, email, or province via ?search=.
+    Admin-only supplier directory, alphabetical, in cursor-paginated pages.
+    Supports search by company name, email, or province via ?search=
+    (substring matches, backed by trigram indexes).
+
+    `count` (matching suppliers) and `summary` (all suppliers) come from
+    planner estimates once they are large, flagged by `countIsEstimate`;
+    no request counts every row.
     """
 
     serializer_class = SupplierProfileSerializer
-    pagination_class = None
+    pagination_class = SupplierDirectoryPagination
     permission_classes = [IsAdminUser]
 
     def get_queryset(self):
-        qs = SupplierProfile.objects.all().order_by("company_name")
+        qs = SupplierProfile.objects.all()
         search = self.request.query_params.get("search")
         if search:
             qs = qs.filter(
@@ -321,6 +829,27 @@ class AdminSupplierListView(generics.ListAPIView):
             )
         return qs
 
+    def list(self, request, *args, **kwargs):
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(with_scores_updating(queryset))
+        response = self.get_paginated_response(self.get_serializer(page, many=True).data)
+
+        count, estimated = estimated_count(queryset)
+        suppliers = SupplierProfile.objects.all()
+        summary = {}
+        for name, subset in (
+            ("total", suppliers),
+            ("active", suppliers.filter(is_paused=False)),
+            ("paused", suppliers.filter(is_paused=True)),
+            ("emailEnabled", suppliers.filter(email_notifications=True)),
+        ):
+            summary[name], subset_estimated = estimated_count(subset)
+            estimated = estimated or subset_estimated
+        response.data["count"] = count
+        response.data["summary"] = summary
+        response.data["countIsEstimate"] = estimated
+        return response
+
 
 class AdminSupplierDetailView(generics.RetrieveUpdateAPIView):
     """
@@ -331,21 +860,65 @@ class AdminSupplierDetailView(generics.RetrieveUpdateAPIView):
     permission_classes = [IsAdminUser]
     queryset = SupplierProfile.objects.all()
 
+    def perform_update(self, serializer):
+        save_profile_and_rescore(serializer)
+
 
-class CategoryListView(APIView):
+class CategoryListView(CachedResponseMixin, generics.ListAPIView):
     """
     Public endpoint returning distinct tender categories from current data.
     Used by the frontend for dynamic category filters and profile preferences.
+    Reads the `TenderDimension` dictionary rather than the tender table.
     """
 
-    def get(self, request):
-        categories = (
-            Tender.objects.exclude(category="")
-            .values_list("category", flat=True)
-            .distinct()
-            .order_by("category")
+    pagination_class = None
+    cache_per_profile = False
+
+    def get_queryset(self):
+        return (
+            TenderDimension.objects.filter(kind="category", tender_count__gt=0)
+            .values_list("value", flat=True)
+            .order_by("value")
         )
-        return Response(list(categories))
+
+    def list(self, request, *args, **kwargs):
+        return Response(list(self.get_queryset()))
+
+
+class DimensionListView(CachedResponseMixin, generics.ListAPIView):
+    """
+    Values of one tender dimension (province, buyer) with tender counts,
+    most active first.
+    """
+
+    serializer_class = TenderDimensionSerializer
+    pagination_class = None
+    cache_per_profile = False
+    kind = None
+
+    def get_queryset(self):
+        return TenderDimension.objects.filter(kind=self.kind, tender_count__gt=0).order_by(
+            "-active_count", "value"
+        )
+
+
+class FacetCountsView(CachedResponseMixin, generics.ListAPIView):
+    """
+    Facet counts (category, province, status, value range) for the filter
+    sidebar, under the same filters as the feed. Cached per data version.
+    """
+
+    pagination_class = None
+    cache_per_profile = False
+    # Feed parameters that don't change which tenders match
+    cache_query_exclude = ("cursor", "page", "view", "fields")
+
+    def get_queryset(self):
+        qs, _search_rank = apply_feed_filters(tender_queryset(self.request), self.request.query_params)
+        return qs
+
+    def list(self, request, *args, **kwargs):
+        return Response(facet_counts(self.get_queryset()))
 
 
 class RunIngestionView(APIView):
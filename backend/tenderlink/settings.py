@@ -41,6 +41,7 @@ INSTALLED_APPS = [
     "django.contrib.sessions",
     "django.contrib.messages",
     "django.contrib.staticfiles",
+    "django.contrib.postgres",
     "rest_framework",
     "rest_framework.authtoken",
     "corsheaders",
@@ -139,15 +140,83 @@ STATIC_URL = "static/"
 # Django REST Framework
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
-        "rest_framework.authentication.TokenAuthentication",
+        "ocds.authentication.CachedTokenAuthentication",
         "rest_framework.authentication.SessionAuthentication",
     ],
     "DEFAULT_PERMISSION_CLASSES": [
         "rest_framework.permissions.AllowAny",
     ],
+    # orjson-backed JSON (falls back to the stdlib when orjson is missing)
+    "DEFAULT_RENDERER_CLASSES": [
+        "ocds.renderers.FastJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "ocds.parsers.FastJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
     "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
     "PAGE_SIZE": 20,
+    "DEFAULT_THROTTLE_RATES": {
+        # Bulk exports (TenderExportView), per user or per IP when anonymous
+        "exports": os.getenv("EXPORT_THROTTLE_RATE", "20/hour"),
+    },
+}
+
+
+# Response cache for the feed and category endpoints. Entries are keyed by
+# the tender data version, so they never need explicit invalidation.
+CACHES = {
+    "default": {
+        "BACKEND": os.getenv("DJANGO_CACHE_BACKEND", "django.core.cache.backends.locmem.LocMemCache"),
+        "LOCATION": os.getenv("DJANGO_CACHE_LOCATION", "tenderlink"),
+    }
+}
+RESPONSE_CACHE_TIMEOUT = int(os.getenv("RESPONSE_CACHE_TIMEOUT", "300"))
+
+
+# Serve the feed, detail and category endpoints as async views (ocds.async_views).
+# Only worthwhile under an ASGI server such as uvicorn.
+ASYNC_API_VIEWS = os.getenv("DJANGO_ASYNC_VIEWS", "false").lower() == "true"
+
+# Server-sent tender events (/api/tenders/events/, async views only): default
+# minimum match score, keep-alive interval and, without LISTEN/NOTIFY, how
+# often each worker checks for changed tenders (seconds)
+TENDER_EVENTS_MIN_SCORE = int(os.getenv("TENDER_EVENTS_MIN_SCORE", "50"))
+TENDER_EVENTS_HEARTBEAT = 15
+TENDER_EVENTS_POLL_INTERVAL = 30
+
+
+# Supplier alerts (ocds.notifications): backend per channel, minimum match
+# score worth an alert, matches listed per digest, sends per second per
+# channel and dispatcher process, and where FileBackend writes
+NOTIFICATION_BACKENDS = {
+    "email": os.getenv("NOTIFICATION_EMAIL_BACKEND", "ocds.notifications.ConsoleBackend"),
+    "sms": os.getenv("NOTIFICATION_SMS_BACKEND", "ocds.notifications.ConsoleBackend"),
+    "whatsapp": os.getenv("NOTIFICATION_WHATSAPP_BACKEND", "ocds.notifications.ConsoleBackend"),
 }
+NOTIFICATION_MIN_SCORE = int(os.getenv("NOTIFICATION_MIN_SCORE", "70"))
+NOTIFICATION_DIGEST_SIZE = int(os.getenv("NOTIFICATION_DIGEST_SIZE", "10"))
+NOTIFICATION_RATE_LIMITS = {"email": 20, "sms": 5, "whatsapp": 10}
+NOTIFICATION_FILE_DIR = os.getenv("NOTIFICATION_FILE_DIR", str(BASE_DIR / "notifications"))
+
+
+# Days after closing before a tender leaves the hot set (archive_closed_tenders)
+TENDER_ARCHIVE_AFTER_DAYS = int(os.getenv("TENDER_ARCHIVE_AFTER_DAYS", "30"))
+
+
+# Token lookups (ocds.authentication.CachedTokenAuthentication): seconds in
+# the shared cache (unused with a process-local cache backend), and size and
+# lifetime of each process's local copy. The local lifetime is how long a
+# revoked token or deactivated user can keep authenticating on other workers.
+AUTH_TOKEN_CACHE_TIMEOUT = int(os.getenv("AUTH_TOKEN_CACHE_TIMEOUT", "300"))
+AUTH_TOKEN_LOCAL_SIZE = 1024
+AUTH_TOKEN_LOCAL_TTL = int(os.getenv("AUTH_TOKEN_LOCAL_TTL", "30"))
+
+
+# Background threads used to rescore suppliers after profile updates
+RESCORE_JOB_WORKERS = int(os.getenv("RESCORE_JOB_WORKERS", "2"))
 
 
 # CORS (for local frontend)
@@ -0,0 +1,84 @@
+import { Bar, BarChart, CartesianGrid, Legend, ResponsiveContainer, Tooltip, XAxis, YAxis } from 'recharts';
+import { Badge } from '@/components/ui/badge';
+import type { IngestionRollups } from '@/lib/api';
+
+interface IngestionTrendsProps {
+  rollups: IngestionRollups;
+}
+
+const formatBucket = (bucket: string, granularity: IngestionRollups['granularity']) =>
+  new Date(bucket).toLocaleString('en-ZA', granularity === 'hour'
+    ? { day: 'numeric', month: 'short', hour: '2-digit' }
+    : { day: 'numeric', month: 'short' });
+
+const IngestionTrends = ({ rollups }: IngestionTrendsProps) => {
+  // Sum sources per bucket
+  const byBucket = new Map<string, { bucket: string; ingested: number; failed: number; added: number }>();
+  const row = (bucket: string) => {
+    let entry = byBucket.get(bucket);
+    if (!entry) {
+      entry = { bucket: formatBucket(bucket, rollups.granularity), ingested: 0, failed: 0, added: 0 };
+      byBucket.set(bucket, entry);
+    }
+    return entry;
+  };
+  rollups.runs.forEach(r => {
+    const entry = row(r.bucket);
+    entry.ingested += r.itemsIngested;
+    entry.failed += r.itemsFailed;
+  });
+  rollups.tendersAdded.forEach(t => {
+    row(t.bucket).added += t.tendersAdded;
+  });
+  const data = [...byBucket.entries()]
+    .sort(([a], [b]) => a.localeCompare(b))
+    .map(([, entry]) => entry);
+
+  const provinces = new Map<string, number>();
+  rollups.tendersAdded.forEach(t => {
+    const name = t.province || 'Unknown';
+    provinces.set(name, (provinces.get(name) ?? 0) + t.tendersAdded);
+  });
+  const topProvinces = [...provinces.entries()].sort((a, b) => b[1] - a[1]).slice(0, 5);
+
+  return (
+    <div className="bg-card rounded-xl border border-border p-6">
+      <div className="flex items-center justify-between mb-4">
+        <div>
+          <h2 className="text-lg font-semibold text-foreground">Ingestion Trends</h2>
+          <p className="text-sm text-muted-foreground">
+            Items ingested, failed and new tenders per {rollups.granularity}
+          </p>
+        </div>
+        <div className="flex flex-wrap gap-2 justify-end">
+          {topProvinces.map(([province, count]) => (
+            <Badge key={province} variant="outline" className="text-xs text-muted-foreground">
+              {province}: {count}
+            </Badge>
+          ))}
+        </div>
+      </div>
+
+      {data.length === 0 ? (
+        <p className="text-sm text-muted-foreground">No finished ingestion runs in this period.</p>
+      ) : (
+        <div className="h-64">
+          <ResponsiveContainer width="100%" height="100%">
+            <BarChart data={data}>
+              <CartesianGrid strokeDasharray="3 3" className="stroke-border" />
+              <XAxis dataKey="bucket" fontSize={12} />
+              <YAxis fontSize={12} allowDecimals={false} />
+              <Tooltip />
+              <Legend />
+              <Bar dataKey="ingested" name="Ingested" fill="hsl(var(--primary))" />
+              <Bar dataKey="failed" name="Failed" fill="hsl(var(--destructive))" />
+              <Bar dataKey="added" name="New tenders" fill="hsl(var(--muted-foreground))" />
+            </BarChart>
+          </ResponsiveContainer>
+        </div>
+      )}
+    </div>
+  );
+};
+
+export default IngestionTrends;
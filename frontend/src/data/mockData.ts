@@ -311,7 +311,8 @@ export const mockSupplierProfile: SupplierProfile = {
   maxValue: 50000000,
   emailNotifications: true,
   smsNotifications: false,
-  whatsappNotifications: true
+  whatsappNotifications: true,
+  alertFrequency: 'immediate'
 };
 
 // Mock Ingestion Stats
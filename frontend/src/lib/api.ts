@@ -101,6 +101,8 @@ export async function fetchTenderFeed(filters: {
     minValue: filters.minValue > 0 ? filters.minValue : undefined,
     maxValue: filters.maxValue < 200000000 ? filters.maxValue : undefined,
     status: filters.status.length ? filters.status : undefined,
+    // Cards only need the lean representation; details are fetched per tender
+    view: 'compact',
   });
 
   const res = await fetch(`${API_BASE}/api/tenders${qs}`);
@@ -117,8 +119,23 @@ export async function fetchTenderFeed(filters: {
   });
 }
 
+/**
+ * Listen for newly matched tenders over server-sent events. Returns a
+ * function that closes the stream. Only served by ASGI deployments; the
+ * EventSource simply gives up where the endpoint does not exist.
+ */
+export function subscribeToTenderEvents(onTender: () => void): () => void {
+  const token = getAuthToken();
+  const qs = token ? `?token=${encodeURIComponent(token)}` : '';
+  const source = new EventSource(`${API_BASE}/api/tenders/events/${qs}`);
+  source.addEventListener('tender', onTender);
+  source.addEventListener('resync', onTender);
+  return () => source.close();
+}
+
 export async function fetchTenderDetail(tenderId: string): Promise<Tender> {
-  const res = await fetch(`${API_BASE}/api/tenders/${encodeURIComponent(tenderId)}/`);
+  // Saved tenders may have closed and been archived, so include history
+  const res = await fetch(`${API_BASE}/api/tenders/${encodeURIComponent(tenderId)}/?history=1`);
   if (!res.ok) throw new Error('Failed to fetch tender detail');
   const data = await res.json();
   return normalizeTender(data);
@@ -151,20 +168,24 @@ export interface SavedTenderDto {
   calendarAdded: boolean;
 }
 
-export async function fetchSavedTenders(): Promise<Release[]> {
-  const res = await fetch(`${API_BASE}/api/supplier/saved-tenders/`, {
-    headers: authHeaders(),
-  });
-  if (!res.ok) throw new Error('Failed to fetch saved tenders');
-  const data = (await res.json()) as SavedTenderDto[];
-
-  const tenders = await Promise.all(
-    data.map(item => fetchTenderDetail(item.tenderId).catch(() => null)),
-  );
+export interface SavedTenderPage {
+  next: string | null;
+  previous: string | null;
+  results: (SavedTenderDto & { tender: any })[];
+}
 
-  return tenders
-    .filter((t): t is Tender => t !== null)
-    .map(t => normalizeReleaseFromTender(t));
+export async function fetchSavedTenders(): Promise<Release[]> {
+  // The expanded list carries each tender's card, a page at a time
+  const releases: Release[] = [];
+  let url: string | null = `${API_BASE}/api/supplier/saved-tenders/?expand=1`;
+  while (url) {
+    const res = await fetch(url, { headers: authHeaders() });
+    if (!res.ok) throw new Error('Failed to fetch saved tenders');
+    const page = (await res.json()) as SavedTenderPage;
+    releases.push(...page.results.map(item => normalizeReleaseFromTender(normalizeTender(item.tender))));
+    url = page.next;
+  }
+  return releases;
 }
 
 export async function getSavedTendersCount(): Promise<number> {
@@ -284,6 +305,40 @@ export async function fetchIngestionHistory(): Promise<AdminIngestionRun[]> {
   return (await res.json()) as AdminIngestionRun[];
 }
 
+export interface IngestionRollupBucket {
+  bucket: string;
+  source: string;
+  runs: number;
+  failedRuns: number;
+  itemsIngested: number;
+  itemsFailed: number;
+  errors: number;
+  failureRate: number;
+  avgDurationSeconds: number;
+}
+
+export interface TenderRollupBucket {
+  bucket: string;
+  province: string;
+  tendersAdded: number;
+}
+
+export interface IngestionRollups {
+  granularity: 'hour' | 'day';
+  from: string;
+  to: string;
+  runs: IngestionRollupBucket[];
+  tendersAdded: TenderRollupBucket[];
+}
+
+export async function fetchIngestionRollups(granularity: 'hour' | 'day' = 'day'): Promise<IngestionRollups> {
+  const res = await fetch(`${API_BASE}/api/admin/ingestion/rollups/?granularity=${granularity}`, {
+    headers: adminAuthHeaders(),
+  });
+  if (!res.ok) throw new Error('Failed to fetch ingestion trends');
+  return (await res.json()) as IngestionRollups;
+}
+
 export async function triggerIngestionRun(pageNumber = 1, pageSize = 100): Promise<void> {
   const res = await fetch(`${API_BASE}/api/admin/ingestion/run/`, {
     method: 'POST',
@@ -308,13 +363,29 @@ export async function triggerBackfill(params: {
 }
 
 // Admin supplier management
-export async function fetchAdminSuppliers(search?: string): Promise<SupplierProfile[]> {
+export interface AdminSupplierPage {
+  next: string | null;
+  previous: string | null;
+  results: SupplierProfile[];
+  // Matching suppliers; planner estimates on large tables (countIsEstimate)
+  count: number;
+  countIsEstimate: boolean;
+  summary: {
+    total: number;
+    active: number;
+    paused: number;
+    emailEnabled: number;
+  };
+}
+
+// Pass the previous page's `next` URL to continue from it
+export async function fetchAdminSuppliers(search?: string, pageUrl?: string): Promise<AdminSupplierPage> {
   const qs = search ? buildQuery({ search }) : '';
-  const res = await fetch(`${API_BASE}/api/admin/suppliers/${qs}`, {
+  const res = await fetch(pageUrl ?? `${API_BASE}/api/admin/suppliers/${qs}`, {
     headers: adminAuthHeaders(),
   });
   if (!res.ok) throw new Error('Failed to fetch suppliers');
-  return (await res.json()) as SupplierProfile[];
+  return (await res.json()) as AdminSupplierPage;
 }
 
 export async function updateAdminSupplier(
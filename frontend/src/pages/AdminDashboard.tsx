@@ -4,14 +4,23 @@ import AdminStatCards from '@/components/admin/AdminStatCards';
 import BackfillTool from '@/components/admin/BackfillTool';
 import ErrorLogTable from '@/components/admin/ErrorLogTable';
 import IngestionHistory from '@/components/admin/IngestionHistory';
+import IngestionTrends from '@/components/admin/IngestionTrends';
 import type { AdminStats, IngestionError } from '@/data/mockAdminData';
-import { fetchAdminStats, fetchAdminErrors, fetchIngestionHistory, AdminIngestionRun } from '@/lib/api';
+import {
+  fetchAdminStats,
+  fetchAdminErrors,
+  fetchIngestionHistory,
+  fetchIngestionRollups,
+  AdminIngestionRun,
+  IngestionRollups,
+} from '@/lib/api';
 
 const AdminDashboard = () => {
   const [stats, setStats] = useState<AdminStats | null>(null);
   const [errors, setErrors] = useState<IngestionError[]>([]);
   const [errorMessage, setErrorMessage] = useState<string | null>(null);
   const [history, setHistory] = useState<AdminIngestionRun[]>([]);
+  const [rollups, setRollups] = useState<IngestionRollups | null>(null);
   const [autoSync, setAutoSync] = useState(true);
   const [syncIntervalMinutes, setSyncIntervalMinutes] = useState(15);
 
@@ -20,15 +29,17 @@ const AdminDashboard = () => {
 
     const load = async () => {
       try {
-        const [s, e, h] = await Promise.all([
+        const [s, e, h, r] = await Promise.all([
           fetchAdminStats(),
           fetchAdminErrors(),
           fetchIngestionHistory(),
+          fetchIngestionRollups(),
         ]);
         if (!cancelled) {
           setStats(s);
           setErrors(e);
           setHistory(h);
+          setRollups(r);
         }
       } catch (err) {
         if (!cancelled) {
@@ -74,15 +85,17 @@ const AdminDashboard = () => {
 
     const poll = async () => {
       try {
-        const [s, e, h] = await Promise.all([
+        const [s, e, h, r] = await Promise.all([
           fetchAdminStats(),
           fetchAdminErrors(),
           fetchIngestionHistory(),
+          fetchIngestionRollups(),
         ]);
         if (!cancelled) {
           setStats(s);
           setErrors(e);
           setHistory(h);
+          setRollups(r);
         }
       } catch {
         // ignore errors during background polling
@@ -123,6 +136,9 @@ const AdminDashboard = () => {
           </div>
         </div>
 
+        {/* Trends */}
+        {rollups && <IngestionTrends rollups={rollups} />}
+
         {/* Error Log */}
         <ErrorLogTable errors={errors} />
     </AdminLayout>
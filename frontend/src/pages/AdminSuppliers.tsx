@@ -1,7 +1,7 @@
 import { useEffect, useState } from 'react';
 import AdminLayout from '@/components/admin/AdminLayout';
 import { SupplierProfile } from '@/types/tender';
-import { fetchAdminSuppliers, updateAdminSupplier } from '@/lib/api';
+import { AdminSupplierPage, fetchAdminSuppliers, updateAdminSupplier } from '@/lib/api';
 import { Input } from '@/components/ui/input';
 import { Button } from '@/components/ui/button';
 import { Badge } from '@/components/ui/badge';
@@ -18,21 +18,25 @@ import { toast } from 'sonner';
 
 const AdminSuppliers = () => {
   const [suppliers, setSuppliers] = useState<SupplierProfile[]>([]);
+  const [page, setPage] = useState<AdminSupplierPage | null>(null);
   const [search, setSearch] = useState('');
   const [loading, setLoading] = useState(false);
   const [savingId, setSavingId] = useState<string | null>(null);
 
-  // Derived overview stats
-  const totalSuppliers = suppliers.length;
-  const pausedSuppliers = suppliers.filter(s => s.isPaused).length;
-  const activeSuppliers = totalSuppliers - pausedSuppliers;
-  const emailEnabled = suppliers.filter(s => s.emailNotifications).length;
+  // Overview stats come from the server; large counts are estimates
+  const approx = page?.countIsEstimate ? '~' : '';
+  const formatCount = (n: number | undefined) => (n === undefined ? '—' : `${approx}${n.toLocaleString()}`);
+  const totalSuppliers = formatCount(page?.summary.total);
+  const pausedSuppliers = formatCount(page?.summary.paused);
+  const activeSuppliers = formatCount(page?.summary.active);
+  const emailEnabled = formatCount(page?.summary.emailEnabled);
 
   const load = async (searchTerm?: string) => {
     setLoading(true);
     try {
       const data = await fetchAdminSuppliers(searchTerm);
-      setSuppliers(data);
+      setPage(data);
+      setSuppliers(data.results);
     } catch {
       toast.error('Failed to load suppliers');
     } finally {
@@ -44,6 +48,20 @@ const AdminSuppliers = () => {
     load();
   }, []);
 
+  const loadMore = async () => {
+    if (!page?.next) return;
+    setLoading(true);
+    try {
+      const data = await fetchAdminSuppliers(undefined, page.next);
+      setPage(data);
+      setSuppliers(prev => [...prev, ...data.results]);
+    } catch {
+      toast.error('Failed to load suppliers');
+    } finally {
+      setLoading(false);
+    }
+  };
+
   const handleSearch = (e: React.FormEvent) => {
     e.preventDefault();
     load(search.trim() || undefined);
@@ -141,7 +159,7 @@ const AdminSuppliers = () => {
             <div>
               <h3 className="text-sm font-semibold text-foreground">Supplier Profiles</h3>
               <p className="text-xs text-muted-foreground">
-                {suppliers.length} suppliers loaded
+                {suppliers.length} of {formatCount(page?.count)} suppliers loaded
               </p>
             </div>
             {loading && (
@@ -276,6 +294,13 @@ const AdminSuppliers = () => {
               </TableBody>
             </Table>
           </div>
+          {page?.next && (
+            <div className="p-4 border-t border-border flex justify-center">
+              <Button variant="outline" size="sm" onClick={loadMore} disabled={loading}>
+                Load more
+              </Button>
+            </div>
+          )}
         </div>
       </div>
     </AdminLayout>
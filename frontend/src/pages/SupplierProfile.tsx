@@ -29,7 +29,7 @@ import {
 } from 'lucide-react';
 import { toast } from 'sonner';
 import { fetchSupplierProfile, updateSupplierProfile, fetchMetaCategories } from '@/lib/api';
-import type { SupplierProfile as SupplierProfileType } from '@/types/tender';
+import type { AlertFrequency, SupplierProfile as SupplierProfileType } from '@/types/tender';
 
 const SupplierProfile = () => {
   const [profile, setProfile] = useState<SupplierProfileType | null>(null);
@@ -459,6 +459,24 @@ const SupplierProfile = () => {
                     disabled={!isEditing}
                   />
                 </div>
+                <Separator />
+                <div className="space-y-2">
+                  <Label>Alert Frequency</Label>
+                  <Select
+                    value={profile.alertFrequency}
+                    onValueChange={(v) => setProfile({ ...profile, alertFrequency: v as AlertFrequency })}
+                    disabled={!isEditing}
+                  >
+                    <SelectTrigger>
+                      <SelectValue />
+                    </SelectTrigger>
+                    <SelectContent>
+                      <SelectItem value="immediate">Every match</SelectItem>
+                      <SelectItem value="hourly">Hourly digest</SelectItem>
+                      <SelectItem value="daily">Daily digest</SelectItem>
+                    </SelectContent>
+                  </Select>
+                </div>
               </div>
             </div>
           </div>
@@ -13,7 +13,7 @@ import {
   SheetTrigger,
 } from '@/components/ui/sheet';
 
-import { fetchTenderFeed } from '@/lib/api';
+import { fetchTenderFeed, subscribeToTenderEvents } from '@/lib/api';
 import type { Release } from '@/types/tender';
 
 const TenderFeed = () => {
@@ -29,6 +29,25 @@ const TenderFeed = () => {
   const [releases, setReleases] = useState<Release[]>([]);
   const [isLoading, setIsLoading] = useState(false);
   const [error, setError] = useState<string | null>(null);
+  const [refreshKey, setRefreshKey] = useState(0);
+
+  // Reload the feed when new matching tenders are pushed, at most every few
+  // seconds while an ingestion run is streaming events
+  useEffect(() => {
+    let timer: number | undefined;
+    const unsubscribe = subscribeToTenderEvents(() => {
+      if (timer === undefined) {
+        timer = window.setTimeout(() => {
+          timer = undefined;
+          setRefreshKey(key => key + 1);
+        }, 3000);
+      }
+    });
+    return () => {
+      window.clearTimeout(timer);
+      unsubscribe();
+    };
+  }, []);
 
   useEffect(() => {
     let cancelled = false;
@@ -55,7 +74,7 @@ const TenderFeed = () => {
     return () => {
       cancelled = true;
     };
-  }, [filters]);
+  }, [filters, refreshKey]);
 
   return (
     <AppLayout>
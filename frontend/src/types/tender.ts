@@ -97,6 +97,9 @@ export interface Province {
 }
 
 // User/Supplier Profile
+// How often alerts are sent: one per match, or an hourly / daily digest
+export type AlertFrequency = 'immediate' | 'hourly' | 'daily';
+
 export interface SupplierProfile {
   id: string;
   companyName: string;
@@ -113,6 +116,7 @@ export interface SupplierProfile {
   emailNotifications: boolean;
   smsNotifications: boolean;
   whatsappNotifications: boolean;
+  alertFrequency: AlertFrequency;
   isPaused: boolean;
   createdAt: string;
   updatedAt: string;